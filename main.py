@@ -2,6 +2,7 @@
 import customtkinter as ctk
 from tkinter import messagebox, filedialog, font as tkinter_font
 import requests
+from requests.adapters import HTTPAdapter
 import os
 import subprocess
 import threading
@@ -15,33 +16,1413 @@ from PIL import Image, ImageTk
 import io
 import tempfile
 import base64
+import time
+import struct
+import zlib
+import hashlib
+import gzip
+import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from collections import deque
 
 # Set appearance mode and color theme
 ctk.set_appearance_mode("dark")
 ctk.set_default_color_theme("blue")
 
+# Browser-like headers for image requests, osu.titanic.sh refuses bare clients
+IMAGE_REQUEST_HEADERS = {
+    'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
+    'Accept': 'image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
+    'Upgrade-Insecure-Requests': '1'
+}
+
+class LauncherSession(requests.Session):
+    """Launcher-wide HTTP client with pooled keep-alive connections, default headers and a default timeout"""
+    
+    DEFAULT_TIMEOUT = 10
+    POOL_HOSTS = 8  # Distinct hosts kept in the pool (api, osu, cdn, github, ...)
+    POOL_SIZE = 16  # Connections kept alive per host
+    
+    def __init__(self):
+        super().__init__()
+        adapter = HTTPAdapter(pool_connections=self.POOL_HOSTS, pool_maxsize=self.POOL_SIZE)
+        self.mount('https://', adapter)
+        self.mount('http://', adapter)
+        self.headers.update({'Accept-Language': 'en-US,en;q=0.9'})
+    
+    def request(self, method, url, **kwargs):
+        kwargs.setdefault('timeout', self.DEFAULT_TIMEOUT)
+        return super().request(method, url, **kwargs)
+
+# Download locations tried when the API download link fails
+FALLBACK_URL_PATTERNS = [
+    "https://cdn.titanic.sh/clients/{version}.zip",
+    "https://osu.titanic.sh/releases/{version}.zip",
+    "https://osu.titanic.sh/download/{version}",
+    "https://osu.titanic.sh/files/{version}.zip",
+    "https://osu.titanic.sh/get/{version}.zip"
+]
+
+# Segmented downloads only pay off for larger archives
+SEGMENT_MIN_SIZE = 8 * 1024 * 1024
+# Slow segments are only split while at least this much is left on each half
+SEGMENT_SPLIT_MIN = 1024 * 1024
+
+# Parallel extraction
+EXTRACT_WORKERS = min(8, os.cpu_count() or 4)
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+# Console: lines kept in the widget and in the pending ring buffer
+CONSOLE_MAX_LINES = 2000
+CONSOLE_LEVELS = ('INFO', 'WARN', 'ERROR', 'SUCCESS', 'GAME')
+
+# On-disk log: rotate by size or age, keep this many compressed segments
+LOG_MAX_BYTES = 2 * 1024 * 1024
+LOG_MAX_AGE = 24 * 60 * 60
+LOG_KEEP_SEGMENTS = 10
+LOG_QUEUE_LIMIT = 10000
+
+# Download dialog: fixed card height and the smallest number of pooled cards
+DOWNLOAD_DIALOG_ROW_HEIGHT = 110
+DOWNLOAD_DIALOG_MIN_ROWS = 4
+
+# Download link checks: how long results stay valid, how many run at once and how many releases per launch
+RELEASE_HEALTH_TTL = 12 * 60 * 60
+ENRICH_CONCURRENCY = 8
+ENRICH_MAX_RELEASES = 40
+
+# Delta installs: changed members closer than this are fetched in one range request
+DELTA_MERGE_GAP = 64 * 1024
+DELTA_MAX_SPAN = 16 * 1024 * 1024
+# Above this share of the archive a full download is cheaper than many range requests
+DELTA_MAX_FETCH_RATIO = 0.7
+
+def write_json_atomic(path, data, indent=2):
+    """Write JSON to a temp file next to path, fsync it and rename it over path"""
+    directory = os.path.dirname(path) or "."
+    fd, temp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(data, f, indent=indent)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_path, path)
+    except Exception:
+        try:
+            os.remove(temp_path)
+        except OSError:
+            pass
+        raise
+
+class UIDispatcher:
+    """Thread-safe queue of UI updates from worker threads, drained by the Tk loop on a fixed cadence.
+    
+    Calls run in the order they were posted. Keyed values such as status text, progress and console
+    flushes collapse to the latest one posted between two drains.
+    """
+    
+    INTERVAL_MS = 50
+    
+    def __init__(self, root):
+        self.root = root
+        self.lock = threading.Lock()
+        self.events = []  # Callbacks in posting order
+        self.latest = {}  # key -> callback, only the newest survives
+        self.main_thread = threading.get_ident()
+        self.running = False
+    
+    def start(self):
+        if not self.running:
+            self.running = True
+            self.root.after(self.INTERVAL_MS, self._drain)
+    
+    def stop(self):
+        self.running = False
+    
+    def on_main_thread(self):
+        return threading.get_ident() == self.main_thread
+    
+    def call(self, callback):
+        """Run callback on the Tk thread, in order with other posted events"""
+        with self.lock:
+            self.events.append(callback)
+    
+    def set_latest(self, key, callback):
+        """Run callback on the Tk thread, replacing any not yet run callback posted under the same key"""
+        with self.lock:
+            self.latest[key] = callback
+    
+    def discard(self, key):
+        with self.lock:
+            self.latest.pop(key, None)
+    
+    def _drain(self):
+        with self.lock:
+            events, self.events = self.events, []
+            latest, self.latest = self.latest, {}
+        
+        for callback in events:
+            self._run(callback)
+        for callback in latest.values():
+            self._run(callback)
+        
+        if self.running:
+            try:
+                self.root.after(self.INTERVAL_MS, self._drain)
+            except Exception:
+                self.running = False  # Window is gone
+    
+    @staticmethod
+    def _run(callback):
+        try:
+            callback()
+        except Exception as e:
+            print(f"UI update failed: {e}")
+
+class DownloadStopped(Exception):
+    """Raised inside a download when its queue job was paused or cancelled"""
+
+class DownloadQueue:
+    """Persistent queue of client downloads with a concurrency limit, priorities, pause/resume and cancel"""
+    
+    # Jobs in these states are saved to config and picked up again after a restart
+    PERSISTED_STATES = ('queued', 'downloading', 'paused', 'failed')
+    
+    def __init__(self, config_store, runner, cleanup, on_change, max_concurrent=2):
+        self.config_store = config_store
+        self.runner = runner  # runner(job) downloads and installs, raises DownloadStopped when stopped
+        self.cleanup = cleanup  # cleanup(version) removes partial files of a cancelled job
+        self.on_change = on_change
+        self.max_concurrent = max_concurrent
+        self.lock = threading.RLock()
+        self.started = False
+        self.jobs = []
+        
+        for saved in config_store.get_section('_download_queue', []):
+            if saved.get('state') in self.PERSISTED_STATES:
+                # Interrupted downloads go back in line and resume from their .part files
+                state = 'queued' if saved['state'] == 'downloading' else saved['state']
+                self.jobs.append(self._new_job(saved['version'], state))
+    
+    def _new_job(self, version, state='queued'):
+        return {
+            'version': version,
+            'state': state,
+            'downloaded': 0,
+            'total': 0,
+            'message': '',
+            'running': False,  # Worker thread alive, stays set while a paused job winds down
+            'stop': threading.Event()
+        }
+    
+    def start(self):
+        """Start processing jobs (called once the release catalog is available)"""
+        self.started = True
+        self.schedule()
+    
+    def set_max_concurrent(self, value):
+        """Change how many downloads may run at once"""
+        self.max_concurrent = max(1, int(value))
+        self.schedule()
+    
+    def find(self, version):
+        with self.lock:
+            for job in self.jobs:
+                if job['version'] == version:
+                    return job
+            return None
+    
+    def snapshot(self):
+        """Copies of all jobs in priority order, safe to read from the UI"""
+        with self.lock:
+            return [{key: value for key, value in job.items() if key not in ('stop', 'running')} for job in self.jobs]
+    
+    def active_jobs(self):
+        with self.lock:
+            return [job for job in self.jobs if job['state'] == 'downloading']
+    
+    def has_pending(self, exclude=None):
+        """Whether any job other than exclude is still queued or downloading"""
+        with self.lock:
+            return any(job['state'] in ('queued', 'downloading') for job in self.jobs if job is not exclude)
+    
+    def add(self, version):
+        """Queue a version, re-queueing it if it previously failed or was cancelled"""
+        with self.lock:
+            job = self.find(version)
+            if job is None:
+                job = self._new_job(version)
+                self.jobs.append(job)
+            elif job['state'] not in ('queued', 'downloading'):
+                # Reuse the job so a worker still winding down is waited for
+                job['state'] = 'queued'
+                job['message'] = ''
+        self.schedule()
+        return job
+    
+    def move(self, version, offset):
+        """Move a job up (negative offset) or down in priority"""
+        with self.lock:
+            job = self.find(version)
+            if not job:
+                return
+            index = self.jobs.index(job)
+            new_index = min(max(index + offset, 0), len(self.jobs) - 1)
+            self.jobs.insert(new_index, self.jobs.pop(index))
+        self.schedule()
+    
+    def pause(self, version):
+        with self.lock:
+            job = self.find(version)
+            if job and job['state'] in ('queued', 'downloading'):
+                job['state'] = 'paused'
+                job['stop'].set()
+        self.schedule()
+    
+    def resume(self, version):
+        with self.lock:
+            job = self.find(version)
+            if job and job['state'] in ('paused', 'failed'):
+                job['state'] = 'queued'
+                job['message'] = ''
+        self.schedule()
+    
+    def cancel(self, version):
+        with self.lock:
+            job = self.find(version)
+            if not job:
+                return
+            # A worker that is still winding down (even a paused one) cleans up once it has stopped writing
+            running = job['running']
+            job['state'] = 'cancelled'
+            job['stop'].set()
+        if not running:
+            self.cleanup(version)
+        self.schedule()
+    
+    def clear_finished(self):
+        with self.lock:
+            self.jobs = [job for job in self.jobs if job['state'] not in ('completed', 'cancelled')]
+        self.schedule()
+    
+    def schedule(self):
+        """Start queued jobs in priority order up to the concurrency limit"""
+        with self.lock:
+            if self.started:
+                running = sum(1 for job in self.jobs if job['running'])
+                for job in self.jobs:
+                    if running >= self.max_concurrent:
+                        break
+                    if job['state'] == 'queued' and not job['running']:
+                        job['state'] = 'downloading'
+                        job['running'] = True
+                        job['stop'] = threading.Event()
+                        job['downloaded'] = 0
+                        job['total'] = 0
+                        running += 1
+                        threading.Thread(target=self._run, args=(job,), daemon=True).start()
+            self._persist()
+        self.on_change()
+    
+    def _run(self, job):
+        try:
+            self.runner(job)
+            with self.lock:
+                if job['state'] == 'downloading':
+                    job['state'] = 'completed'
+        except DownloadStopped:
+            pass
+        except Exception as e:
+            with self.lock:
+                if job['state'] == 'downloading':
+                    job['state'] = 'failed'
+                    job['message'] = str(e)
+        
+        # Decide under the lock so cancel() either sees the worker still running or leaves cleanup to it
+        with self.lock:
+            cancelled = job['state'] == 'cancelled'
+            if not cancelled:
+                job['running'] = False
+        if cancelled:
+            self.cleanup(job['version'])
+            with self.lock:
+                job['running'] = False
+        self.schedule()
+    
+    def _persist(self):
+        self.config_store.set_section('_download_queue', [
+            {'version': job['version'], 'state': job['state']}
+            for job in self.jobs if job['state'] in self.PERSISTED_STATES
+        ])
+        self.config_store.save()
+
+def zip_member_path(dest_dir, name):
+    """Map an archive member name into dest_dir, dropping drive, absolute and parent components like zipfile does"""
+    name = os.path.splitdrive(name.replace('\\', '/'))[1]
+    parts = [part for part in name.split('/') if part not in ('', '.', '..')]
+    return os.path.join(dest_dir, *parts)
+
+def extract_zip_parallel(zip_path, dest_dir, max_workers=None, on_progress=None, stop_event=None):
+    """Extract a zip with a pool of workers that each hold their own handle on the archive.
+    
+    on_progress(done_bytes, total_bytes) is called from the worker threads. Returns the number of bytes written.
+    """
+    with zipfile.ZipFile(zip_path, 'r') as zip_ref:
+        members = zip_ref.infolist()
+    
+    # Create the directory tree up front so workers never race on makedirs
+    files = []
+    directories = {dest_dir}
+    for info in members:
+        target = zip_member_path(dest_dir, info.filename)
+        if info.is_dir():
+            directories.add(target)
+        else:
+            directories.add(os.path.dirname(target))
+            files.append((info, target))
+    for directory in sorted(directories):
+        os.makedirs(directory, exist_ok=True)
+    
+    total_bytes = sum(info.file_size for info, _ in files)
+    if not files:
+        return 0
+    
+    # Spread the members over the workers by size, largest first
+    worker_count = max(1, min(max_workers or EXTRACT_WORKERS, len(files)))
+    buckets = [[] for _ in range(worker_count)]
+    bucket_sizes = [0] * worker_count
+    for info, target in sorted(files, key=lambda item: item[0].file_size, reverse=True):
+        index = bucket_sizes.index(min(bucket_sizes))
+        buckets[index].append((info, target))
+        bucket_sizes[index] += info.file_size
+    
+    lock = threading.Lock()
+    done = [0]
+    abort = threading.Event()  # Set when one worker fails so the others stop too
+    
+    def extract_bucket(bucket):
+        with zipfile.ZipFile(zip_path, 'r') as worker_zip:
+            for info, target in bucket:
+                with worker_zip.open(info) as source, open(target, 'wb') as f:
+                    # Preallocate from the central directory size
+                    f.truncate(info.file_size)
+                    while True:
+                        if abort.is_set() or (stop_event is not None and stop_event.is_set()):
+                            raise DownloadStopped()
+                        chunk = source.read(EXTRACT_CHUNK_SIZE)
+                        if not chunk:
+                            break
+                        f.write(chunk)
+                        with lock:
+                            done[0] += len(chunk)
+                            current = done[0]
+                        if on_progress:
+                            on_progress(current, total_bytes)
+    
+    with ThreadPoolExecutor(max_workers=worker_count) as executor:
+        futures = [executor.submit(extract_bucket, bucket) for bucket in buckets]
+        try:
+            for future in as_completed(futures):
+                future.result()
+        except BaseException:
+            # Stop the other workers at their next chunk
+            abort.set()
+            raise
+    
+    return done[0]
+
+class StreamingUnsupported(Exception):
+    """Raised when an archive cannot be installed while streaming (the caller falls back to a normal download)"""
+
+class StreamingZipExtractor:
+    """Extract a zip archive from its bytes as they arrive, then check it against the central directory"""
+    
+    LOCAL_HEADER = struct.Struct('<4sHHHHHIIIHH')
+    CENTRAL_HEADER = struct.Struct('<4sHHHHHHIIIHHHHHII')
+    DESCRIPTOR_SIGNATURE = b'PK\x07\x08'
+    
+    def __init__(self, dest_dir):
+        self.dest_dir = dest_dir
+        self.buffer = bytearray()
+        self.entries = {}  # name -> (crc, size) as extracted
+        self.entry = None
+        self.in_central_directory = False
+        self.extracted_bytes = 0
+        os.makedirs(dest_dir, exist_ok=True)
+    
+    def feed(self, data):
+        """Consume the next chunk of the archive"""
+        self.buffer += data
+        if self.in_central_directory:
+            return
+        while self._step():
+            pass
+    
+    def finish(self):
+        """Verify the extracted entries against the central directory at the end of the stream"""
+        if self.entry is not None or not self.in_central_directory:
+            raise Exception("Archive ended unexpectedly")
+        
+        expected = self._parse_central_directory()
+        if set(expected) != set(self.entries):
+            raise Exception("Archive central directory does not match extracted files")
+        for name, (crc, size) in expected.items():
+            if self.entries[name] != (crc, size):
+                raise Exception(f"Extracted file does not match central directory: {name}")
+        return len(expected)
+    
+    def _step(self):
+        """Process as much of the buffer as possible, returns True if progress was made"""
+        if self.entry is not None:
+            return self._read_entry_data()
+        
+        if len(self.buffer) < 4:
+            return False
+        signature = bytes(self.buffer[:4])
+        if signature in (b'PK\x01\x02', b'PK\x05\x06', b'PK\x06\x06'):
+            # Everything after this is the central directory, kept for finish()
+            self.in_central_directory = True
+            return False
+        if signature != b'PK\x03\x04':
+            raise StreamingUnsupported("Unexpected data between archive entries")
+        
+        if len(self.buffer) < self.LOCAL_HEADER.size:
+            return False
+        (_, _, flags, method, _, _, crc, compressed_size, size,
+         name_length, extra_length) = self.LOCAL_HEADER.unpack_from(self.buffer)
+        header_size = self.LOCAL_HEADER.size + name_length + extra_length
+        if len(self.buffer) < header_size:
+            return False
+        
+        raw_name = bytes(self.buffer[self.LOCAL_HEADER.size:self.LOCAL_HEADER.size + name_length])
+        extra = bytes(self.buffer[self.LOCAL_HEADER.size + name_length:header_size])
+        del self.buffer[:header_size]
+        
+        if flags & 0x1:
+            raise StreamingUnsupported("Encrypted archives cannot be streamed")
+        if method not in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED):
+            raise StreamingUnsupported(f"Unsupported compression method {method}")
+        
+        zip64 = self._zip64_sizes(extra, size, compressed_size)
+        if zip64:
+            size, compressed_size = zip64
+        has_descriptor = bool(flags & 0x8)
+        if has_descriptor and method == zipfile.ZIP_STORED:
+            # Stored data has no end marker, its length is only known from the descriptor
+            raise StreamingUnsupported("Stored entries with data descriptors cannot be streamed")
+        
+        name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437')
+        target = zip_member_path(self.dest_dir, name)
+        if name.endswith('/'):
+            # Directories still carry (empty) data, read it like any other entry
+            os.makedirs(target, exist_ok=True)
+            output = None
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            output = open(target, 'wb')
+        
+        self.entry = {
+            'name': name,
+            'file': output,
+            'method': method,
+            'crc': crc,
+            'size': size,
+            'remaining': None if has_descriptor else compressed_size,
+            'descriptor': has_descriptor,
+            'zip64': bool(zip64),
+            'decompressor': zlib.decompressobj(-15) if method == zipfile.ZIP_DEFLATED else None,
+            'actual_crc': 0,
+            'written': 0
+        }
+        return True
+    
+    def _read_entry_data(self):
+        entry = self.entry
+        if entry['remaining'] is None:
+            # Deflate stream with a data descriptor, runs until the stream says it is done
+            if entry['decompressor'].eof:
+                return self._read_descriptor()
+            if not self.buffer:
+                return False
+            data = bytes(self.buffer)
+            self.buffer.clear()
+            self._write(entry['decompressor'].decompress(data))
+            if entry['decompressor'].eof:
+                self.buffer[:0] = entry['decompressor'].unused_data
+            return True
+        
+        if entry['remaining'] > 0:
+            if not self.buffer:
+                return False
+            count = min(entry['remaining'], len(self.buffer))
+            data = bytes(self.buffer[:count])
+            del self.buffer[:count]
+            entry['remaining'] -= count
+            if entry['decompressor']:
+                data = entry['decompressor'].decompress(data)
+            self._write(data)
+            return True
+        
+        if entry['decompressor']:
+            self._write(entry['decompressor'].flush())
+        self._close_entry(entry['crc'], entry['size'])
+        return True
+    
+    def _read_descriptor(self):
+        entry = self.entry
+        size_format = '<Q' if entry['zip64'] else '<I'
+        field_size = struct.calcsize(size_format)
+        offset = 4 if bytes(self.buffer[:4]) == self.DESCRIPTOR_SIGNATURE else 0
+        needed = offset + 4 + 2 * field_size
+        if len(self.buffer) < needed:
+            return False
+        crc = struct.unpack_from('<I', self.buffer, offset)[0]
+        size = struct.unpack_from(size_format, self.buffer, offset + 4 + field_size)[0]
+        del self.buffer[:needed]
+        self._write(entry['decompressor'].flush())
+        self._close_entry(crc, size)
+        return True
+    
+    def _write(self, data):
+        if data:
+            entry = self.entry
+            if entry['file']:
+                entry['file'].write(data)
+            entry['actual_crc'] = zlib.crc32(data, entry['actual_crc'])
+            entry['written'] += len(data)
+            self.extracted_bytes += len(data)
+    
+    def _close_entry(self, crc, size):
+        entry = self.entry
+        if entry['file']:
+            entry['file'].close()
+        self.entry = None
+        if entry['actual_crc'] != crc or entry['written'] != size:
+            raise Exception(f"Corrupt archive entry: {entry['name']}")
+        self.entries[entry['name']] = (crc, size)
+    
+    def close(self):
+        """Close the file of an interrupted entry"""
+        if self.entry is not None and self.entry['file']:
+            self.entry['file'].close()
+        self.entry = None
+    
+    @staticmethod
+    def _zip64_sizes(extra, size, compressed_size):
+        """Read (size, compressed_size) from a zip64 extra field if the header sizes overflowed"""
+        if size != 0xFFFFFFFF and compressed_size != 0xFFFFFFFF:
+            return None
+        position = 0
+        while position + 4 <= len(extra):
+            header_id, length = struct.unpack_from('<HH', extra, position)
+            if header_id == 0x0001:
+                values = list(struct.unpack_from('<' + 'Q' * (length // 8), extra, position + 4))
+                if size == 0xFFFFFFFF:
+                    size = values.pop(0)
+                if compressed_size == 0xFFFFFFFF:
+                    compressed_size = values.pop(0)
+                return size, compressed_size
+            position += 4 + length
+        return None
+    
+    def _parse_central_directory(self):
+        expected = {}
+        position = 0
+        while bytes(self.buffer[position:position + 4]) == b'PK\x01\x02':
+            if len(self.buffer) < position + self.CENTRAL_HEADER.size:
+                break
+            (_, _, _, flags, _, _, _, crc, compressed_size, size, name_length,
+             extra_length, comment_length, _, _, _, _) = self.CENTRAL_HEADER.unpack_from(self.buffer, position)
+            start = position + self.CENTRAL_HEADER.size
+            raw_name = bytes(self.buffer[start:start + name_length])
+            extra = bytes(self.buffer[start + name_length:start + name_length + extra_length])
+            zip64 = self._zip64_sizes(extra, size, compressed_size)
+            if zip64:
+                size = zip64[0]
+            name = raw_name.decode('utf-8' if flags & 0x800 else 'cp437')
+            expected[name] = (crc, size)
+            position = start + name_length + extra_length + comment_length
+        
+        # The directory must be followed by its end record, otherwise the stream was cut short
+        if bytes(self.buffer[position:position + 4]) not in (b'PK\x05\x06', b'PK\x06\x06'):
+            raise Exception("Archive central directory is truncated")
+        return expected
+
+class LocalRangeSource:
+    """Byte ranges of a local file, lets delta installs run against archives on disk"""
+    
+    def __init__(self, path):
+        self.path = path
+        self.size = os.path.getsize(path)
+    
+    def read(self, offset, length):
+        with open(self.path, 'rb') as f:
+            f.seek(offset)
+            return f.read(length)
+
+class HttpRangeSource:
+    """Byte ranges of a remote file fetched with HTTP Range requests"""
+    
+    def __init__(self, session, url, size):
+        self.session = session
+        self.url = url
+        self.size = size
+        self.fetched = 0
+    
+    def read(self, offset, length):
+        response = self.session.get(self.url, headers={'Range': f"bytes={offset}-{offset + length - 1}"}, timeout=30)
+        if response.status_code != 206:
+            raise Exception(f"Server did not return a byte range (status {response.status_code})")
+        if len(response.content) != length:
+            raise Exception("Server returned a short byte range")
+        self.fetched += length
+        return response.content
+
+def read_zip_directory(source):
+    """Read a zip's central directory through a range source.
+    
+    Returns a list of member dicts (name, crc, size, compressed_size, method, flags, offset, end), where end is
+    where the member's local record stops (the next member's header or the central directory).
+    """
+    tail_size = min(source.size, 65536 + 22)
+    tail = source.read(source.size - tail_size, tail_size)
+    eocd = tail.rfind(b'PK\x05\x06')
+    if eocd < 0 or len(tail) - eocd < 22:
+        raise Exception("Archive end of central directory not found")
+    entry_count, directory_size, directory_offset = struct.unpack_from('<HII', tail, eocd + 10)
+    
+    # Zip64 archives keep the real values in a separate record pointed to by a locator
+    if 0xFFFFFFFF in (directory_size, directory_offset) or entry_count == 0xFFFF:
+        locator = eocd - 20
+        if locator < 0 or tail[locator:locator + 4] != b'PK\x06\x07':
+            raise Exception("Zip64 archive locator not found")
+        record_offset = struct.unpack_from('<Q', tail, locator + 8)[0]
+        record = source.read(record_offset, 56)
+        if record[:4] != b'PK\x06\x06':
+            raise Exception("Zip64 end of central directory not found")
+        entry_count, directory_size, directory_offset = struct.unpack_from('<QQQ', record, 32)
+    
+    directory = source.read(directory_offset, directory_size)
+    header = StreamingZipExtractor.CENTRAL_HEADER
+    members = []
+    position = 0
+    while position + header.size <= len(directory) and directory[position:position + 4] == b'PK\x01\x02':
+        (_, _, _, flags, method, _, _, crc, compressed_size, size, name_length,
+         extra_length, comment_length, _, _, _, offset) = header.unpack_from(directory, position)
+        start = position + header.size
+        raw_name = directory[start:start + name_length]
+        extra = directory[start + name_length:start + name_length + extra_length]
+        if 0xFFFFFFFF in (size, compressed_size, offset):
+            # Zip64 extra: only the overflowed fields are present, in this order
+            values = []
+            cursor = 0
+            while cursor + 4 <= len(extra):
+                header_id, length = struct.unpack_from('<HH', extra, cursor)
+                if header_id == 0x0001:
+                    values = list(struct.unpack_from('<' + 'Q' * (length // 8), extra, cursor + 4))
+                    break
+                cursor += 4 + length
+            if size == 0xFFFFFFFF:
+                size = values.pop(0)
+            if compressed_size == 0xFFFFFFFF:
+                compressed_size = values.pop(0)
+            if offset == 0xFFFFFFFF:
+                offset = values.pop(0)
+        members.append({
+            'name': raw_name.decode('utf-8' if flags & 0x800 else 'cp437'),
+            'crc': crc,
+            'size': size,
+            'compressed_size': compressed_size,
+            'method': method,
+            'flags': flags,
+            'offset': offset
+        })
+        position = start + name_length + extra_length + comment_length
+    
+    if len(members) != entry_count:
+        raise Exception("Archive central directory is incomplete")
+    
+    ordered = sorted(members, key=lambda member: member['offset'])
+    for member, following in zip(ordered, ordered[1:] + [None]):
+        member['end'] = following['offset'] if following else directory_offset
+    return members
+
+def sha256_file(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+def file_crc32(path):
+    crc = 0
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            crc = zlib.crc32(block, crc)
+    return crc
+
+def plan_zip_delta(members, base_dir):
+    """Split archive members into those identical to a file in base_dir and those that must be fetched"""
+    reuse = []
+    fetch = []
+    for member in members:
+        if member['name'].endswith('/'):
+            continue
+        base_path = zip_member_path(base_dir, member['name'])
+        if (os.path.isfile(base_path) and os.path.getsize(base_path) == member['size']
+                and file_crc32(base_path) == member['crc']):
+            reuse.append(member)
+        else:
+            fetch.append(member)
+    return reuse, fetch
+
+def apply_zip_delta(source, members, reuse, fetch, base_dir, dest_dir, on_progress=None, stop_event=None):
+    """Build dest_dir from reused base files plus members fetched from source, returns the bytes fetched"""
+    for member in members:
+        if member['name'].endswith('/'):
+            os.makedirs(zip_member_path(dest_dir, member['name']), exist_ok=True)
+    
+    for member in reuse:
+        target = zip_member_path(dest_dir, member['name'])
+        os.makedirs(os.path.dirname(target), exist_ok=True)
+        shutil.copy2(zip_member_path(base_dir, member['name']), target)
+    
+    # Coalesce members lying close together in the archive into one range request
+    spans = []
+    for member in sorted(fetch, key=lambda item: item['offset']):
+        if spans and member['offset'] - spans[-1]['end'] <= DELTA_MERGE_GAP and member['end'] - spans[-1]['start'] <= DELTA_MAX_SPAN:
+            spans[-1]['members'].append(member)
+            spans[-1]['end'] = member['end']
+        else:
+            spans.append({'start': member['offset'], 'end': member['end'], 'members': [member]})
+    
+    total = sum(span['end'] - span['start'] for span in spans)
+    fetched = 0
+    for span in spans:
+        if stop_event is not None and stop_event.is_set():
+            raise DownloadStopped()
+        data = source.read(span['start'], span['end'] - span['start'])
+        for member in span['members']:
+            _write_zip_member(data, member['offset'] - span['start'], member, dest_dir)
+        fetched += len(data)
+        if on_progress:
+            on_progress(fetched, total)
+    return fetched
+
+def _write_zip_member(data, position, member, dest_dir):
+    """Inflate one member from raw archive bytes starting at its local header"""
+    header = StreamingZipExtractor.LOCAL_HEADER
+    if data[position:position + 4] != b'PK\x03\x04':
+        raise Exception(f"Bad local header for {member['name']}")
+    name_length, extra_length = struct.unpack_from('<HH', data, position + 26)
+    start = position + header.size + name_length + extra_length
+    raw = data[start:start + member['compressed_size']]
+    
+    if member['flags'] & 0x1:
+        raise Exception(f"Encrypted member {member['name']}")
+    if member['method'] == zipfile.ZIP_STORED:
+        content = raw
+    elif member['method'] == zipfile.ZIP_DEFLATED:
+        content = zlib.decompress(raw, -15)
+    else:
+        raise Exception(f"Unsupported compression method {member['method']} for {member['name']}")
+    if len(content) != member['size'] or zlib.crc32(content) != member['crc']:
+        raise Exception(f"Corrupt archive entry: {member['name']}")
+    
+    # Replace rather than overwrite, the old file may be hardlinked into other installs
+    target = zip_member_path(dest_dir, member['name'])
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    temp_path = target + ".tmp"
+    with open(temp_path, 'wb') as f:
+        f.write(content)
+    os.replace(temp_path, target)
+
+# Only files the game never writes to are shared between versions
+DEDUP_EXTENSIONS = ('.dll', '.exe', '.pdb', '.ttf', '.otf', '.png', '.jpg', '.jpeg', '.gif', '.wav', '.ogg', '.mp3')
+# User data folders inside an install are never shared, even if they hold matching file types
+DEDUP_EXCLUDED_DIRS = ('songs', 'skins', 'replays', 'screenshots', 'data', 'logs', 'exports')
+
+class ObjectStore:
+    """Content-addressed store of install files, identical files are hardlinked into each version"""
+    
+    def __init__(self, root):
+        self.root = root
+    
+    def object_path(self, digest):
+        return os.path.join(self.root, digest[:2], digest)
+    
+    @staticmethod
+    def is_shareable(relative_path):
+        """Whether a file (relative to its install) is safe to hardlink between versions"""
+        parts = relative_path.replace('\\', '/').lower().split('/')
+        if len(parts) > 1 and parts[0] in DEDUP_EXCLUDED_DIRS:
+            return False
+        return parts[-1].endswith(DEDUP_EXTENSIONS)
+    
+    def dedup_tree(self, tree):
+        """Replace shareable files in tree with links to the store, returns (files linked, bytes saved)"""
+        linked = 0
+        saved = 0
+        for dirpath, dirnames, filenames in os.walk(tree):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                if os.path.islink(path) or not self.is_shareable(os.path.relpath(path, tree)):
+                    continue
+                try:
+                    saved_bytes = self.ingest(path)
+                except OSError as e:
+                    # Other filesystem or no hardlink support, keep the private copy
+                    print(f"Dedup skipped {path}: {e}")
+                    continue
+                if saved_bytes:
+                    linked += 1
+                    saved += saved_bytes
+        return linked, saved
+    
+    def ingest(self, path):
+        """Link path to its object, adding it to the store if new. Returns the bytes saved"""
+        size = os.path.getsize(path)
+        object_path = self.object_path(sha256_file(path))
+        
+        if os.path.exists(object_path):
+            if os.path.samefile(object_path, path):
+                return 0
+            if os.path.getsize(object_path) != size:
+                return 0
+            # Swap the private copy for a link in one step
+            temp_path = path + ".dedup"
+            os.link(object_path, temp_path)
+            os.replace(temp_path, path)
+            return size
+        
+        os.makedirs(os.path.dirname(object_path), exist_ok=True)
+        os.link(path, object_path)
+        return 0
+    
+    def stats(self):
+        """Return (object count, bytes saved) across all installs, from the objects' link counts"""
+        count = 0
+        saved = 0
+        if not os.path.isdir(self.root):
+            return count, saved
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            for filename in filenames:
+                info = os.stat(os.path.join(dirpath, filename))
+                count += 1
+                # One link is the store itself, one is the first install
+                if info.st_nlink > 2:
+                    saved += (info.st_nlink - 2) * info.st_size
+        return count, saved
+    
+    def prune(self):
+        """Delete objects no install links to any more, returns the bytes freed"""
+        freed = 0
+        if not os.path.isdir(self.root):
+            return freed
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            for filename in filenames:
+                path = os.path.join(dirpath, filename)
+                try:
+                    info = os.stat(path)
+                    if info.st_nlink == 1:
+                        os.remove(path)
+                        freed += info.st_size
+                except OSError:
+                    pass
+        return freed
+
+# Files the game rewrites itself (settings, databases, logs) are never verified
+VERIFY_SKIPPED_EXTENSIONS = ('.cfg', '.db', '.log', '.tmp', '.dedup')
+
+def is_verifiable_file(relative_path):
+    """Whether a file inside an install is part of the client rather than user data"""
+    parts = relative_path.replace('\\', '/').lower().split('/')
+    if len(parts) > 1 and parts[0] in DEDUP_EXCLUDED_DIRS:
+        return False
+    return not parts[-1].endswith(VERIFY_SKIPPED_EXTENSIONS)
+
+def lower_thread_priority():
+    """Run the calling worker thread at the lowest CPU priority where the platform allows it"""
+    try:
+        # On Linux the nice value is per thread
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), 19)
+    except (AttributeError, OSError):
+        pass
+
+class InstallVerifier:
+    """Per-version manifests of (size, mtime, sha256), only files whose stat data changed are re-hashed"""
+    
+    def __init__(self, manifests_dir):
+        self.manifests_dir = manifests_dir
+    
+    def manifest_path(self, version):
+        return os.path.join(self.manifests_dir, f"{version}.json")
+    
+    def load(self, version):
+        try:
+            with open(self.manifest_path(version), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    def remove(self, version):
+        try:
+            os.remove(self.manifest_path(version))
+        except OSError:
+            pass
+    
+    def build(self, version, tree, names=None):
+        """Hash the client files in tree (or only names, relative paths) into a fresh manifest"""
+        if names is None:
+            names = []
+            for dirpath, dirnames, filenames in os.walk(tree):
+                for filename in filenames:
+                    names.append(os.path.relpath(os.path.join(dirpath, filename), tree).replace(os.sep, '/'))
+        
+        files = {}
+        for name in names:
+            if name.endswith('/') or not is_verifiable_file(name):
+                continue
+            path = zip_member_path(tree, name)
+            try:
+                info = os.stat(path)
+                files[name] = [info.st_size, info.st_mtime_ns, sha256_file(path)]
+            except OSError:
+                continue  # Deleted or locked mid-walk (game running, antivirus), leave it out
+        
+        manifest = {'files': files, 'built_at': time.time()}
+        os.makedirs(self.manifests_dir, exist_ok=True)
+        write_json_atomic(self.manifest_path(version), manifest, indent=None)
+        return manifest
+    
+    def verify(self, version, tree):
+        """Compare tree with its manifest, building one first if there is none.
+        
+        Returns {'missing': [...], 'modified': [...], 'checked': n, 'rehashed': n}.
+        """
+        manifest = self.load(version)
+        if manifest is None:
+            manifest = self.build(version, tree)
+            return {'missing': [], 'modified': [], 'checked': len(manifest['files']), 'rehashed': len(manifest['files'])}
+        
+        missing = []
+        modified = []
+        rehashed = 0
+        changed = False
+        for name, (size, mtime_ns, digest) in manifest['files'].items():
+            path = zip_member_path(tree, name)
+            try:
+                info = os.stat(path)
+            except OSError:
+                missing.append(name)
+                continue
+            if info.st_size == size and info.st_mtime_ns == mtime_ns:
+                continue  # Stat data unchanged, trust the cached hash
+            
+            rehashed += 1
+            try:
+                matches = info.st_size == size and sha256_file(path) == digest
+            except OSError:
+                continue  # Locked or vanished while hashing, check it again next time
+            if matches:
+                # Only touched, refresh the stat cache
+                manifest['files'][name] = [size, info.st_mtime_ns, digest]
+                changed = True
+            else:
+                modified.append(name)
+        
+        if changed:
+            write_json_atomic(self.manifest_path(version), manifest, indent=None)
+        return {'missing': missing, 'modified': modified, 'checked': len(manifest['files']), 'rehashed': rehashed}
+
+class ArchiveCache:
+    """LRU cache of release archives under a byte budget, keyed by release and server validator"""
+    
+    def __init__(self, root, max_bytes):
+        self.root = root
+        self.max_bytes = max_bytes
+        self.index_path = os.path.join(root, "index.json")
+        self.lock = threading.Lock()
+        self.entries = self._load()
+    
+    def _load(self):
+        try:
+            with open(self.index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        # Drop entries whose archive was removed behind our back
+        return {key: entry for key, entry in entries.items()
+                if os.path.isfile(os.path.join(self.root, entry['file']))}
+    
+    def _save(self):
+        os.makedirs(self.root, exist_ok=True)
+        write_json_atomic(self.index_path, self.entries)
+    
+    def lookup(self, version, validator=None):
+        """Path of the cached archive for version (matching validator if given), marking it recently used"""
+        with self.lock:
+            matches = [(key, entry) for key, entry in self.entries.items()
+                       if entry['version'] == version and (validator is None or entry['validator'] == validator)]
+            if not matches:
+                return None
+            key, entry = max(matches, key=lambda item: item[1]['last_used'])
+            path = os.path.join(self.root, entry['file'])
+            if not os.path.isfile(path) or os.path.getsize(path) != entry['size']:
+                del self.entries[key]
+                self._save()
+                return None
+            entry['last_used'] = time.time()
+            self._save()
+            return path
+    
+    def store(self, version, validator, path):
+        """Move a verified archive into the cache, evicting least recently used archives over the budget.
+        
+        Returns the cached path, or None if the archive alone exceeds the budget (it is deleted then).
+        """
+        with self.lock:
+            if os.path.getsize(path) > self.max_bytes:
+                # Would only evict everything else and then itself
+                os.remove(path)
+                return None
+            
+            # Older builds of the same release are stale now
+            for key in [key for key, entry in self.entries.items() if entry['version'] == version]:
+                self._remove(key)
+            
+            key = f"{version}-{hashlib.sha1(validator.encode('utf-8')).hexdigest()[:12]}"
+            file_name = f"{key}.zip"
+            os.makedirs(self.root, exist_ok=True)
+            os.replace(path, os.path.join(self.root, file_name))
+            self.entries[key] = {
+                'version': version,
+                'validator': validator,
+                'file': file_name,
+                'size': os.path.getsize(os.path.join(self.root, file_name)),
+                'last_used': time.time()
+            }
+            self._evict()
+            self._save()
+            return os.path.join(self.root, file_name) if key in self.entries else None
+    
+    def set_limit(self, max_bytes):
+        with self.lock:
+            self.max_bytes = max_bytes
+            self._evict()
+            self._save()
+    
+    def usage(self):
+        """Return (archive count, bytes used)"""
+        with self.lock:
+            return len(self.entries), sum(entry['size'] for entry in self.entries.values())
+    
+    def clear(self):
+        with self.lock:
+            for key in list(self.entries):
+                self._remove(key)
+            self._save()
+    
+    def _evict(self):
+        total = sum(entry['size'] for entry in self.entries.values())
+        for key, entry in sorted(self.entries.items(), key=lambda item: item[1]['last_used']):
+            if total <= self.max_bytes:
+                break
+            total -= entry['size']
+            self._remove(key)
+    
+    def _remove(self, key):
+        entry = self.entries.pop(key)
+        try:
+            os.remove(os.path.join(self.root, entry['file']))
+        except OSError:
+            pass
+
+class LogWriter:
+    """Append-only launcher log written by a background thread, rotated and gzipped by size or age"""
+    
+    # Pending lines are written together at most this often
+    FLUSH_INTERVAL = 0.5
+    
+    def __init__(self, log_dir, max_bytes=LOG_MAX_BYTES, max_age=LOG_MAX_AGE, keep=LOG_KEEP_SEGMENTS):
+        self.log_dir = log_dir
+        self.path = os.path.join(log_dir, "launcher.log")
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.keep = keep
+        self.pending = deque(maxlen=LOG_QUEUE_LIMIT)
+        self.dropped = 0
+        self.lock = threading.Lock()
+        self.wake = threading.Event()
+        self.stopping = False
+        self.file = None
+        self.opened_at = 0
+        self.thread = threading.Thread(target=self._run, name="log-writer", daemon=True)
+        self.thread.start()
+    
+    def write(self, message, level="INFO"):
+        """Queue one line; never blocks on disk, the oldest lines are dropped if the writer falls behind"""
+        line = f"{datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')} [{level}] {message}\n"
+        with self.lock:
+            if len(self.pending) == self.pending.maxlen:
+                self.dropped += 1
+            self.pending.append(line)
+    
+    def close(self, timeout=2.0):
+        """Write out whatever is pending and stop the writer thread"""
+        self.stopping = True
+        self.wake.set()
+        self.thread.join(timeout)
+    
+    def _run(self):
+        while True:
+            self.wake.wait(self.FLUSH_INTERVAL)
+            self.wake.clear()
+            stopping = self.stopping
+            try:
+                self._flush()
+            except OSError as e:
+                print(f"Failed to write launcher log: {e}")
+            if stopping:
+                break
+        if self.file:
+            self.file.close()
+            self.file = None
+    
+    def _flush(self):
+        with self.lock:
+            lines = list(self.pending)
+            self.pending.clear()
+            dropped = self.dropped
+            self.dropped = 0
+        if not lines:
+            return
+        if dropped:
+            lines.insert(0, f"... {dropped} log lines dropped ...\n")
+        
+        data = "".join(lines).encode('utf-8')
+        self._open()
+        if self.file.tell() and (self.file.tell() + len(data) > self.max_bytes
+                                 or time.time() - self.opened_at > self.max_age):
+            self._rotate()
+            self._open()
+        self.file.write(data)
+        self.file.flush()
+    
+    def _open(self):
+        if self.file:
+            return
+        os.makedirs(self.log_dir, exist_ok=True)
+        self.file = open(self.path, 'ab')
+        self.opened_at = time.time()
+        if self.file.tell():
+            # Age counts from the first line's timestamp, so it survives restarts
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    first = datetime.datetime.strptime(f.read(19), '%Y-%m-%d %H:%M:%S')
+                self.opened_at = first.timestamp()
+            except (OSError, ValueError):
+                pass
+    
+    def _rotate(self):
+        self.file.close()
+        self.file = None
+        stamp = datetime.datetime.now().strftime("%Y%m%d-%H%M%S")
+        rotated = os.path.join(self.log_dir, f"launcher-{stamp}.log")
+        suffix = 1
+        while os.path.exists(rotated + ".gz"):
+            rotated = os.path.join(self.log_dir, f"launcher-{stamp}-{suffix}.log")
+            suffix += 1
+        os.replace(self.path, rotated)
+        
+        # Compress the closed segment, then keep only the newest few
+        try:
+            with open(rotated, 'rb') as src, gzip.open(rotated + ".gz", 'wb') as dst:
+                shutil.copyfileobj(src, dst)
+            os.remove(rotated)
+        except OSError as e:
+            print(f"Failed to compress {rotated}: {e}")
+        
+        segments = sorted((os.path.join(self.log_dir, name) for name in os.listdir(self.log_dir)
+                           if name.startswith("launcher-") and name.endswith(".log.gz")), key=os.path.getmtime)
+        for path in segments[:-self.keep]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+class ConfigStore:
+    """In-memory copy of config.json, parsed once and written through a single path"""
+    
+    # Saves within this many seconds of each other are coalesced into one write
+    SAVE_DELAY = 1.0
+    # A failed write is retried after a delay that doubles up to this many seconds
+    MAX_RETRY_DELAY = 60.0
+
+    def __init__(self, path, log=None):
+        self.path = path
+        self.data = {}
+        self.lock = threading.RLock()
+        self.write_lock = threading.Lock()
+        self.dirty = False
+        self.save_timer = None
+        self.retry_delay = self.SAVE_DELAY
+        self.log = log or (lambda message, level="INFO": print(message))
+        self.load()
+    
+    def load(self):
+        """Parse config.json into memory"""
+        try:
+            if os.path.exists(self.path):
+                with open(self.path, 'r') as f:
+                    self.data = json.load(f)
+        except Exception as e:
+            self.log(f"Failed to load config: {e}", "ERROR")
+            self.data = {}
+    
+    def get_section(self, name, default=None):
+        """Get a top-level section such as 'options', 'auth' or '_customization'"""
+        with self.lock:
+            value = self.data.get(name, default)
+            # Hand out copies so callers never mutate the store behind its back
+            if isinstance(value, dict):
+                return dict(value)
+            if isinstance(value, list):
+                return list(value)
+            return value
+    
+    def set_section(self, name, value):
+        """Replace a top-level section"""
+        with self.lock:
+            self.data[name] = value
+    
+    def get_version(self, version):
+        """Get settings for a specific version"""
+        return self.get_section(version, {
+            'custom_name': version,
+            'launch_args': ''
+        })
+    
+    def set_version(self, version, config):
+        """Replace settings for a specific version"""
+        self.set_section(version, config)
+    
+    def options(self):
+        """Launcher options section"""
+        return self.get_section('options', {})
+    
+    def auth(self):
+        """Saved login section"""
+        return self.get_section('auth', {})
+    
+    def customization(self):
+        """Visual/layout customization section"""
+        return self.get_section('_customization', {})
+    
+    def version_order(self):
+        """Custom sidebar order of installed versions"""
+        return self.get_section('_version_order', [])
+    
+    def imported_versions(self):
+        """Versions imported from zip files or folders"""
+        return self.get_section('_imported_versions', [])
+    
+    def save(self):
+        """Schedule a write-behind save, bursts of calls end up as one write"""
+        with self.lock:
+            self.dirty = True
+            self._schedule(self.SAVE_DELAY)
+    
+    def _schedule(self, delay):
+        # Caller holds self.lock
+        if self.save_timer is None:
+            self.save_timer = threading.Timer(delay, self.flush)
+            self.save_timer.daemon = True
+            self.save_timer.start()
+    
+    def flush(self):
+        """Atomically write pending changes to disk now (called by the timer and on exit)"""
+        with self.write_lock:
+            with self.lock:
+                if self.save_timer is not None:
+                    self.save_timer.cancel()
+                    self.save_timer = None
+                if not self.dirty:
+                    return
+                # Snapshot under the lock so the UI thread can keep mutating while we write
+                snapshot = json.loads(json.dumps(self.data))
+                self.dirty = False
+            try:
+                write_json_atomic(self.path, snapshot)
+                self.retry_delay = self.SAVE_DELAY
+            except Exception as e:
+                self.log(f"Failed to save config, retrying in {self.retry_delay:.0f}s: {e}", "WARNING")
+                with self.lock:
+                    self.dirty = True
+                    self._schedule(self.retry_delay)
+                self.retry_delay = min(self.retry_delay * 2, self.MAX_RETRY_DELAY)
+
 class TitanicLauncher(ctk.CTk):
     def __init__(self):
         super().__init__()
         self.title("Iceberg Launcher")
         self.geometry("1000x700")
+        
+        # Worker threads hand UI updates to the Tk loop through this
+        self.ui = UIDispatcher(self)
+        self.ui.start()
+        
+        # Console lines waiting for the next flush, oldest dropped beyond the cap
+        self.console_pending = deque(maxlen=CONSOLE_MAX_LINES)
+        self.console_lock = threading.Lock()
+        self.console_dropped = 0
 
         # Configuration
         self.titanic_base_url = "https://osu.titanic.sh/"
         self.versions_dir = os.path.expanduser("~/.titaniclauncher")
         self.config_file = os.path.join(self.versions_dir, "config.json")
+        self.releases_cache_file = os.path.join(self.versions_dir, "releases.json")
+        self.release_meta_file = os.path.join(self.versions_dir, "release_meta.json")  # Archive sizes per release
+        self.release_health_file = os.path.join(self.versions_dir, "release_health.json")  # Download link reachability
         self.logo_path = os.path.join(self.versions_dir, "logo.png")
+        self.staging_dir = os.path.join(self.versions_dir, ".staging")  # Installs are extracted here, then renamed into place
+        self.trash_dir = os.path.join(self.versions_dir, ".trash")  # Replaced installs waiting for background deletion
+        self.object_store = ObjectStore(os.path.join(self.versions_dir, ".objects"))  # Files shared between installs
+        self.verifier = InstallVerifier(os.path.join(self.versions_dir, ".manifests"))  # Stat-cached file hashes per install
+        self.verify_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="verify", initializer=lower_thread_priority)
+        self.verify_results = {}
+        self.release_meta = self.load_release_meta()
+        self.release_meta_lock = threading.Lock()
+        self.release_health = self.load_release_health()
+        self.enrichment_running = False
+        self.inspect_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="inspect")
+        self.installed_versions = set()  # Filled by refresh_version_buttons, read by the download dialog
+        self.download_dialog = None
+        self.release_size_texts = {}  # Size lines computed for releases without cached metadata
+        self.archive_cache = ArchiveCache(os.path.join(self.versions_dir, ".archive_cache"), 5 * 1024 ** 3)
+        self.log_writer = LogWriter(os.path.join(self.versions_dir, "logs"))  # Rotating launcher.log, gzipped segments
         self.logo_url = "https://osu.titanic.sh/images/logo/main-vector.min.svg"
         
         # Ensure versions directory exists
         os.makedirs(self.versions_dir, exist_ok=True)
         
+        # Shared HTTP client, reuses TLS connections across every request
+        self.http = LauncherSession()
+        
         # Variables
         self.versions = []
         self.download_links = {}
         self.version_descriptions = {}
         self.version_images = {}
-        self.version_configs = {}  # Per-version configuration
+        self.release_snapshot = None  # Last known /releases payload with its validators
+        self.config_store = ConfigStore(self.config_file, log=self.log_to_console)  # config.json, parsed once
+        self.download_queue = DownloadQueue(
+            self.config_store,
+            runner=self._run_download_job,
+            cleanup=self.remove_partial_download,
+            on_change=lambda: self.ui.set_latest('queue', self.refresh_download_queue_window)
+        )
+        self.queue_window = None
         self.selected_version = ctk.StringVar()
         self.download_progress = ctk.DoubleVar()
         self.status_text = ctk.StringVar(value="Ready")
@@ -49,6 +1430,9 @@ class TitanicLauncher(ctk.CTk):
         
         # Drag and drop variables
         self.version_buttons = {}  # Store references to version buttons
+        self.version_rows = {}  # Sidebar row frame per installed version, reused across refreshes
+        self.version_row_index = {}  # Grid row each version frame currently sits in
+        self.no_versions_label = None
         
         # Initialize collapse states before UI setup
         self.details_collapsed = True
@@ -61,6 +1445,22 @@ class TitanicLauncher(ctk.CTk):
         self.text_color = ctk.StringVar(value="white")  # Will be updated based on mode
         self.button_text_color = ctk.StringVar(value="black")
         
+        # Download options
+        self.download_segments = ctk.IntVar(value=4)  # Parallel connections per download
+        self.max_concurrent_downloads = ctk.IntVar(value=2)  # Queue jobs running at once
+        self.stream_install = ctk.BooleanVar(value=True)  # Extract while downloading, resumable through the .part file
+        self.dedup_installs = ctk.BooleanVar(value=False)  # Hardlink identical files between installs
+        self.delta_updates = ctk.BooleanVar(value=True)  # Only fetch files that differ from the closest installed build
+        self.archive_cache_enabled = ctk.BooleanVar(value=False)  # Keep downloaded archives for instant reinstalls
+        self.archive_cache_gb = ctk.IntVar(value=5)  # Archive cache budget in GB
+        
+        # Plain copies of the download options for worker threads, which must not read Tk variables
+        self.download_settings = {}
+        for variable in (self.download_segments, self.stream_install, self.dedup_installs,
+                         self.delta_updates, self.archive_cache_enabled):
+            variable.trace_add('write', lambda *args: self.sync_download_settings())
+        self.sync_download_settings()
+        
         # Visual customization variables
         self.custom_bg_image = ctk.StringVar(value="")
         self.custom_font_size = ctk.IntVar(value=12)
@@ -81,53 +1481,102 @@ class TitanicLauncher(ctk.CTk):
         self.user_country = ctk.StringVar(value="-")
         self.avatar_image = None
         
-        # Font caching
+        # Font caching - use the cached font right away, fetch it in the background otherwise
         self.comfortaa_font_path = os.path.join(self.versions_dir, "Comfortaa-Bold.ttf")
-        self.logo_font = self.setup_logo_font()
+        self.font_registered_marker = os.path.join(self.versions_dir, ".font_registered")
+        self.logo_font = "Comfortaa" if os.path.exists(self.comfortaa_font_path) else None
         
         # Grid configuration
         self.grid_columnconfigure(1, weight=1)
         self.grid_rowconfigure(0, weight=1)
 
-        # Download logo if not cached
-        self.download_logo_if_missing()
-        
         self.setup_ui()
         
+        # Download logo and font off the UI thread, they are swapped in when ready
+        self._start_asset_bootstrap()
+        
+        # Clear out staging leftovers and replaced installs from earlier sessions
+        self.empty_install_trash(include_staging=True)
+        
         # Bind sidebar position changes to update logo alignment
         self.sidebar_position.trace('w', lambda *args: self.update_logo_alignment())
         
         self.load_options_config()
         self.load_auth_config()
-        self.load_config()
         self.load_versions()
         self.load_customization_config()
         
         # Bind window resize event to update background
         self.bind("<Configure>", self.on_window_resize)
         
-        # Apply Comfortaa font after UI is fully loaded
-        self.after(500, self._apply_logo_font_delayed)
+        # Flush pending config writes before the window goes away
+        self.protocol("WM_DELETE_WINDOW", self.on_close)
+
+    def on_close(self):
+        """Flush pending saves and close the launcher"""
+        self.ui.stop()
+        self.config_store.flush()
+        self.verify_pool.shutdown(wait=False, cancel_futures=True)
+        self.inspect_pool.shutdown(wait=False, cancel_futures=True)
+        self.http.close()
+        self.log_writer.close()
+        self.destroy()
+
+    def _start_asset_bootstrap(self):
+        """Fetch the logo and Comfortaa font in a background thread"""
+        thread = threading.Thread(target=self._asset_bootstrap_thread)
+        thread.daemon = True
+        thread.start()
+
+    def _asset_bootstrap_thread(self):
+        """Download missing assets and register the font, then hand them to the UI thread"""
+        logo_ready = self.download_logo_if_missing()
+        logo_font = self.setup_logo_font()
+        self.ui.call(lambda: self._apply_bootstrapped_assets(logo_ready, logo_font))
+
+    def _apply_bootstrapped_assets(self, logo_ready, logo_font):
+        """Swap the downloaded logo and font into the already visible UI"""
+        if logo_ready:
+            self._set_logo_image()
+        
+        if logo_font:
+            self.logo_font = logo_font
+            self._apply_logo_font_delayed()
 
     def download_logo_if_missing(self):
-        """Download logo.png from GitHub if not already cached"""
+        """Download logo.png from GitHub if not already cached, returns True if the logo is available"""
         if os.path.exists(self.logo_path):
             print(f"Logo found at {self.logo_path}")
-            return
+            return True
         
         try:
             print("Downloading logo...")
             logo_url = "https://github.com/SuperYosh23/Iceberg/blob/main/logo.png?raw=true"
-            response = requests.get(logo_url, timeout=10)
+            response = self.http.get(logo_url)
             
             if response.status_code == 200:
                 with open(self.logo_path, 'wb') as f:
                     f.write(response.content)
                 print(f"Logo cached at {self.logo_path}")
+                return True
             else:
                 print(f"Failed to download logo: {response.status_code}")
         except Exception as e:
             print(f"Error downloading logo: {e}")
+        return False
+
+    def _set_logo_image(self):
+        """Replace the fallback emoji with the cached logo.png"""
+        try:
+            if not (self.logo_image_label and self.logo_image_label.winfo_exists()):
+                return
+            pil_image = Image.open(self.logo_path)
+            # Scale to 32x32
+            pil_image = pil_image.resize((32, 32), Image.Resampling.LANCZOS)
+            self.logo_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=(32, 32))
+            self.logo_image_label.configure(image=self.logo_image, text="")
+        except Exception as e:
+            print(f"Failed to load logo image: {e}")
 
     def update_logo_alignment(self):
         """Update logo and text alignment based on sidebar position"""
@@ -173,7 +1622,7 @@ class TitanicLauncher(ctk.CTk):
             # Try to download Comfortaa font
             print("Downloading Comfortaa font...")
             font_url = "https://github.com/alexeiva/comfortaa/raw/refs/heads/master/fonts/TTF/Comfortaa-Bold.ttf"
-            response = requests.get(font_url, timeout=10)
+            response = self.http.get(font_url)
             
             if response.status_code == 200:
                 with open(self.comfortaa_font_path, 'wb') as f:
@@ -195,6 +1644,10 @@ class TitanicLauncher(ctk.CTk):
     def _install_font_to_system(self):
         """Install font to system fonts directory (Linux)"""
         try:
+            # Skip entirely once the font has been registered with fontconfig
+            if os.path.exists(self.font_registered_marker):
+                return
+            
             fonts_dir = os.path.expanduser("~/.local/share/fonts")
             os.makedirs(fonts_dir, exist_ok=True)
             
@@ -204,22 +1657,32 @@ class TitanicLauncher(ctk.CTk):
             if not os.path.exists(dest_path):
                 sh.copy2(self.comfortaa_font_path, dest_path)
                 print(f"Installed font to {dest_path}")
-                
-                # Update font cache
-                try:
-                    subprocess.run(["fc-cache", "-f", fonts_dir], timeout=5)
-                    print("Updated font cache")
-                except:
-                    pass
+            
+            # Update font cache
+            try:
+                result = subprocess.run(["fc-cache", "-f", fonts_dir], timeout=5)
+            except (OSError, subprocess.SubprocessError) as e:
+                print(f"Could not update font cache: {e}")
+                return
+            if result.returncode != 0:
+                print(f"fc-cache exited with code {result.returncode}, will retry next launch")
+                return
+            print("Updated font cache")
+            
+            # Record the registration so fc-cache never runs again
+            with open(self.font_registered_marker, 'w') as f:
+                f.write(dest_path)
         except Exception as e:
             print(f"Could not install font to system: {e}")
 
     def _apply_logo_font_delayed(self):
-        """Apply Comfortaa font to logo label after a delay to ensure system recognizes it"""
+        """Apply Comfortaa font to the logo label and launch button once it is available"""
         try:
             if self.logo_font and hasattr(self, 'logo_label'):
                 self.logo_label.configure(font=ctk.CTkFont(family=self.logo_font, size=26, weight="bold"))
                 print(f"Applied {self.logo_font} font to logo label")
+            if self.logo_font and hasattr(self, 'launch_btn'):
+                self.launch_btn.configure(font=ctk.CTkFont(family=self.logo_font, size=20, weight="bold"))
         except Exception as e:
             print(f"Could not apply font after delay: {e}")
 
@@ -282,18 +1745,11 @@ class TitanicLauncher(ctk.CTk):
         inner_frame = ctk.CTkFrame(logo_title_frame, fg_color="transparent")
         inner_frame.pack(fill="x", expand=True, anchor=anchor_pos)
         
-        # Load and display logo image
-        self.logo_image_label = None
+        # Logo image - emoji placeholder until logo.png is cached
+        self.logo_image_label = ctk.CTkLabel(inner_frame, text="🚢", font=ctk.CTkFont(size=24))
+        self.logo_image_label.pack(side=logo_pack_side, padx=logo_padx)
         if os.path.exists(self.logo_path):
-            try:
-                pil_image = Image.open(self.logo_path)
-                # Scale to 32x32
-                pil_image = pil_image.resize((32, 32), Image.Resampling.LANCZOS)
-                self.logo_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=(32, 32))
-                self.logo_image_label = ctk.CTkLabel(inner_frame, image=self.logo_image, text="")
-                self.logo_image_label.pack(side=logo_pack_side, padx=logo_padx)
-            except Exception as e:
-                print(f"Failed to load logo image: {e}")
+            self._set_logo_image()
         
         # Use Comfortaa if available, fallback to Arial
         if self.logo_font:
@@ -352,7 +1808,7 @@ class TitanicLauncher(ctk.CTk):
         # Action buttons frame - icon only with tooltips, arranged horizontally
         buttons_frame = ctk.CTkFrame(self.sidebar_frame)
         buttons_frame.grid(row=3, column=0, padx=10, pady=10, sticky="ew")
-        buttons_frame.grid_columnconfigure((0, 1, 2, 3), weight=1)
+        buttons_frame.grid_columnconfigure((0, 1, 2, 3, 4), weight=1)
         
         self.download_clients_btn = ctk.CTkButton(buttons_frame, text="↓", width=30, height=30, command=self.open_download_dialog, fg_color="#F8A6BE", hover_color="#e8949d", text_color="black", font=ctk.CTkFont(size=14), corner_radius=self.button_corner_radius.get())
         self.download_clients_btn.grid(row=0, column=0, padx=2, pady=2, sticky="ew")
@@ -369,6 +1825,10 @@ class TitanicLauncher(ctk.CTk):
         self.delete_btn = ctk.CTkButton(buttons_frame, text="✕", width=30, height=30, fg_color="#F8A6BE", hover_color="#e8949d", command=self.delete_version, font=ctk.CTkFont(size=14), text_color="black", corner_radius=self.button_corner_radius.get())
         self.delete_btn.grid(row=0, column=3, padx=2, pady=2, sticky="ew")
         self._add_tooltip(self.delete_btn, "Delete Version")
+        
+        self.queue_btn = ctk.CTkButton(buttons_frame, text="☰", width=30, height=30, command=self.open_download_queue, fg_color="#F8A6BE", text_color="black", font=ctk.CTkFont(size=14), corner_radius=self.button_corner_radius.get())
+        self.queue_btn.grid(row=0, column=4, padx=2, pady=2, sticky="ew")
+        self._add_tooltip(self.queue_btn, "Download Queue")
 
         # === MAIN PANEL ===
         self.main_frame = ctk.CTkFrame(self, corner_radius=0, fg_color="transparent")
@@ -474,6 +1934,13 @@ class TitanicLauncher(ctk.CTk):
         self.save_settings_btn = ctk.CTkButton(self.settings_form, text="Save Settings", command=self.save_current_version_settings, fg_color="#28a745")
         self.save_settings_btn.pack(pady=10)
         
+        # File check and repair
+        self.verify_btn = ctk.CTkButton(self.settings_form, text="🔍 Verify Files", command=self.verify_selected_version, fg_color="#17a2b8", hover_color="#138496")
+        self.verify_btn.pack(pady=(0, 5))
+        
+        self.repair_btn = ctk.CTkButton(self.settings_form, text="🛠 Repair Files", command=self.repair_selected_version, fg_color="#ff6b35", hover_color="#e55a2b")
+        self.repair_btn.pack(pady=(0, 10))
+        
         # Help text
         help_text = ctk.CTkTextbox(self.settings_content_frame, height=120, font=ctk.CTkFont(size=10))
         help_text.pack(fill="x", pady=(10, 10))
@@ -526,11 +1993,32 @@ class TitanicLauncher(ctk.CTk):
         self.console_content_frame = ctk.CTkFrame(self.console_frame)
         # Don't pack initially - start collapsed
         
+        # Level filter, hidden levels are elided rather than re-rendered
+        self.console_filter_frame = ctk.CTkFrame(self.console_content_frame, fg_color="transparent")
+        self.console_filter_frame.pack(fill="x", padx=10, pady=(10, 0))
+        self.console_level_filters = {}
+        for level in CONSOLE_LEVELS:
+            variable = ctk.BooleanVar(value=True)
+            self.console_level_filters[level] = variable
+            ctk.CTkCheckBox(
+                self.console_filter_frame,
+                text=level,
+                variable=variable,
+                width=70,
+                checkbox_width=16,
+                checkbox_height=16,
+                font=ctk.CTkFont(size=11),
+                command=lambda l=level: self.apply_console_filter(l)
+            ).pack(side="left", padx=(0, 8))
+        
         # Console text widget
         self.console_text = ctk.CTkTextbox(self.console_content_frame, height=150, font=ctk.CTkFont(family="Courier", size=10))
         self.console_text.pack(fill="both", expand=True, padx=10, pady=10)
         self.console_text.insert("0.0", "Console output will appear here...\n")
         self.console_text.configure(state="disabled")
+        self.console_text.tag_config("ERROR", foreground="#dc3545")
+        self.console_text.tag_config("WARN", foreground="#ff9800")
+        self.console_text.tag_config("SUCCESS", foreground="#28a745")
 
         # Progress section (move to main frame)
         ctk.CTkLabel(self.main_frame, text="Download Progress").pack(anchor="w", padx=20, pady=(10, 0))
@@ -552,23 +2040,149 @@ class TitanicLauncher(ctk.CTk):
         self.launch_btn.pack(side="bottom", fill="x", padx=20, pady=10)
 
     def load_versions(self):
-        """Load available Titanic versions from the API"""
+        """Load available Titanic versions, rendering the cached catalog first and revalidating it in the background"""
+        # On startup show the last known catalog right away
+        if not self.versions and self.release_snapshot is None:
+            self.release_snapshot = self.load_release_snapshot()
+            if self.release_snapshot:
+                self._apply_release_data(self.release_snapshot['releases'])
+                self._update_versions_ui()
+                self.log_to_console(f"Loaded {len(self.versions)} versions from cached catalog")
+        
         self.log_to_console("Fetching versions from Titanic API...")
-        self.status_text.set("Fetching versions from Titanic API...")
-        self.update()
+        self.set_status("Fetching versions from Titanic API...")
         
         # Start fetching in separate thread to avoid blocking UI
         thread = threading.Thread(target=self._fetch_versions_thread)
         thread.daemon = True
         thread.start()
 
+    def load_release_snapshot(self):
+        """Load the cached release catalog and its validators from disk"""
+        try:
+            if os.path.exists(self.releases_cache_file):
+                with open(self.releases_cache_file, 'r') as f:
+                    snapshot = json.load(f)
+                if isinstance(snapshot.get('releases'), list):
+                    return snapshot
+        except Exception as e:
+            print(f"Failed to load release cache: {e}")
+        return None
+
+    def save_release_snapshot(self, api_data, response):
+        """Persist the release catalog together with its ETag/Last-Modified validators"""
+        snapshot = {
+            'etag': response.headers.get('ETag'),
+            'last_modified': response.headers.get('Last-Modified'),
+            'releases': api_data
+        }
+        try:
+            write_json_atomic(self.releases_cache_file, snapshot)
+        except Exception as e:
+            print(f"Failed to save release cache: {e}")
+        self.release_snapshot = snapshot
+
+    def load_release_meta(self):
+        """Load cached archive sizes per release"""
+        try:
+            if os.path.exists(self.release_meta_file):
+                with open(self.release_meta_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Failed to load release metadata: {e}")
+        return {}
+
+    def inspect_remote_archive(self, version, url):
+        """Read a release archive's central directory by range requests.
+        
+        Returns (meta, members) and caches meta; members is None when the server has no range support.
+        """
+        info = self.head_archive(url)
+        if not info:
+            raise Exception(f"Could not reach {url}")
+        
+        meta = {'url': url, 'compressed': info['total'], 'uncompressed': None, 'members': None, 'checked_at': time.time()}
+        members = None
+        if info['ranges'] and info['total']:
+            members = read_zip_directory(HttpRangeSource(self.http, url, info['total']))
+            files = [member for member in members if not member['name'].endswith('/')]
+            meta['uncompressed'] = sum(member['size'] for member in files)
+            meta['members'] = len(files)
+        
+        with self.release_meta_lock:
+            self.release_meta[version] = meta
+            try:
+                write_json_atomic(self.release_meta_file, self.release_meta)
+            except Exception as e:
+                print(f"Failed to save release metadata: {e}")
+        return meta, members
+
+    def known_download_url(self, version):
+        """Download URL from the catalog, cached metadata or link checks, without probing anything"""
+        if self.download_links.get(version):
+            return self.download_links[version]
+        meta = self.release_meta.get(version)
+        if meta and meta.get('url'):
+            return meta['url']
+        health = self.get_release_health(version)
+        if health and health.get('reachable'):
+            return health.get('url')
+        return None
+
+    def get_release_meta(self, version, url=None):
+        """Cached archive sizes for version, inspecting the archive if they are missing or for another URL"""
+        url = url or self.download_links.get(version)
+        meta = self.release_meta.get(version)
+        if meta and (url is None or meta.get('url') == url):
+            return meta
+        if not url:
+            return None
+        return self.inspect_remote_archive(version, url)[0]
+
+    def describe_release_meta(self, meta):
+        """One-line size summary for cards and previews"""
+        if not meta:
+            return "Size unknown"
+        if meta.get('uncompressed') is None:
+            return f"{self.format_size(meta['compressed'])} download"
+        return (f"{self.format_size(meta['uncompressed'])} installed · "
+                f"{self.format_size(meta['compressed'])} download · {meta['members']} files")
+
+    def check_disk_space(self, version, meta):
+        """Raise if the install described by meta will not fit on the launcher's drive"""
+        if not meta:
+            return
+        # Unknown installed size: assume the archive roughly doubles when extracted
+        needed = meta['uncompressed'] if meta.get('uncompressed') is not None else meta['compressed'] * 2
+        # The zip (or a streaming install's .part file) sits next to the extracted files until the install finishes
+        needed += meta['compressed']
+        free = shutil.disk_usage(self.versions_dir).free
+        if needed > free:
+            raise Exception(f"Not enough disk space to install {version}: needs {self.format_size(needed)}, "
+                            f"only {self.format_size(free)} free")
+
     def _fetch_versions_thread(self):
-        """Fetch versions from Titanic API in background thread"""
+        """Revalidate the release catalog against the Titanic API in background thread"""
+        snapshot = self.release_snapshot
         try:
             self.log_to_console("Connecting to Titanic API...")
             
+            # Conditional GET so an unchanged catalog costs a 304 and no UI rebuild
+            headers = {}
+            if snapshot:
+                if snapshot.get('etag'):
+                    headers['If-None-Match'] = snapshot['etag']
+                if snapshot.get('last_modified'):
+                    headers['If-Modified-Since'] = snapshot['last_modified']
+            
             # Fetch official versions from the official Titanic API
-            response = requests.get("https://api.titanic.sh/releases", timeout=10)
+            response = self.http.get("https://api.titanic.sh/releases", headers=headers)
+            
+            if response.status_code == 304 and snapshot:
+                self.log_to_console("Release catalog is up to date", "SUCCESS")
+                self.set_status(f"Loaded {len(self.versions)} versions")
+                return
+            
             response.raise_for_status()
             
             self.log_to_console("Successfully fetched official releases")
@@ -576,73 +2190,93 @@ class TitanicLauncher(ctk.CTk):
             # Parse JSON response
             api_data = response.json()
             
-            versions = []
-            download_links = {}
-            version_descriptions = {}
-            version_images = {}
-            
-            # Process each version from the API
-            for version_data in api_data:
-                version = version_data['name']
-                description = version_data.get('description', 'No description available.')
-                
-                # Get download URL (API provides a list, take the first one)
-                downloads = version_data.get('downloads', [])
-                download_url = downloads[0] if downloads else None
-                
-                # Get screenshot URLs (API provides a list, prefer the first one)
-                screenshots = version_data.get('screenshots', [])
-                image_url = None
-                
-                if screenshots:
-                    screenshot = screenshots[0]
-                    # Convert relative URLs to absolute
-                    if screenshot.startswith('/images/clients/'):
-                        image_url = self.titanic_base_url + screenshot.lstrip('/')
-                    elif screenshot.startswith('/ss/'):
-                        image_url = self.titanic_base_url + screenshot.lstrip('/')
-                    elif screenshot.startswith('http'):
-                        image_url = screenshot
-                
-                versions.append(version)
-                if download_url:
-                    download_links[version] = download_url
-                version_descriptions[version] = description
-                version_images[version] = image_url
-            
-            # Sort versions from newest to oldest using the existing version_key method
-            versions.sort(key=TitanicLauncher.version_key, reverse=True)
+            # Server ignored the validators but sent the same payload - just refresh the validators
+            if snapshot and snapshot['releases'] == api_data:
+                self.save_release_snapshot(api_data, response)
+                self.log_to_console("Release catalog is up to date", "SUCCESS")
+                self.set_status(f"Loaded {len(self.versions)} versions")
+                return
             
-            # Store data for later use
-            self.versions = versions
-            self.download_links = download_links
-            self.version_descriptions = version_descriptions
-            self.version_images = version_images
+            self._apply_release_data(api_data)
+            self.save_release_snapshot(api_data, response)
+            versions = self.versions
             
             # Update UI in main thread
-            self.after(0, self._update_versions_ui)
-            self.after(0, lambda: self.status_text.set(f"Loaded {len(versions)} versions from Titanic API"))
+            self.ui.call(self._update_versions_ui)
+            self.set_status(f"Loaded {len(versions)} versions from Titanic API")
             self.log_to_console(f"Successfully loaded {len(versions)} versions", "SUCCESS")
             
         except Exception as e:
-            # Fallback to known versions on error
             self.log_to_console(f"API error: {str(e)}", "ERROR")
+            
+            # Keep showing the last known catalog when offline
+            if snapshot:
+                self.set_status(f"Using cached versions (API error: {str(e)})")
+                self.log_to_console("Using cached release catalog due to API error", "WARNING")
+                return
+            
+            # Fallback to known versions on error
             fallback_versions = ["b20151228.3", "b20150826.3", "b20150331.2", "b20141216.1", "b20131216.1"]
             self.download_links = {}
             self.version_descriptions = {v: "Fallback version" for v in fallback_versions}
             self.version_images = {}
             self.versions = fallback_versions
-            self.after(0, self._update_versions_ui)
-            self.after(0, lambda: self.status_text.set(f"Using fallback versions (API error: {str(e)})"))
+            self.ui.call(self._update_versions_ui)
+            self.set_status(f"Using fallback versions (API error: {str(e)})")
             self.log_to_console("Using fallback versions due to API error", "WARNING")
 
+    def _apply_release_data(self, api_data):
+        """Parse the /releases payload into the version lists"""
+        versions = []
+        download_links = {}
+        version_descriptions = {}
+        version_images = {}
+        
+        # Process each version from the API
+        for version_data in api_data:
+            version = version_data['name']
+            description = version_data.get('description', 'No description available.')
+            
+            # Get download URL (API provides a list, take the first one)
+            downloads = version_data.get('downloads', [])
+            download_url = downloads[0] if downloads else None
+            
+            # Get screenshot URLs (API provides a list, prefer the first one)
+            screenshots = version_data.get('screenshots', [])
+            image_url = None
+            
+            if screenshots:
+                screenshot = screenshots[0]
+                # Convert relative URLs to absolute
+                if screenshot.startswith('/images/clients/'):
+                    image_url = self.titanic_base_url + screenshot.lstrip('/')
+                elif screenshot.startswith('/ss/'):
+                    image_url = self.titanic_base_url + screenshot.lstrip('/')
+                elif screenshot.startswith('http'):
+                    image_url = screenshot
+            
+            versions.append(version)
+            if download_url:
+                download_links[version] = download_url
+            version_descriptions[version] = description
+            version_images[version] = image_url
+        
+        # Sort versions from newest to oldest using the existing version_key method
+        versions.sort(key=TitanicLauncher.version_key, reverse=True)
+        
+        # Store data for later use
+        self.versions = versions
+        self.download_links = download_links
+        self.version_descriptions = version_descriptions
+        self.version_images = version_images
+
     def _update_versions_ui(self):
         """Update UI with fetched versions - this method should not overwrite the version lists"""
         # Don't overwrite self.versions or self.modified_versions here
         # They should only be set in the _fetch_versions_thread method
         
         # Add imported versions to the list
-        imported_versions = self.version_configs.get('_imported_versions', [])
+        imported_versions = self.config_store.imported_versions()
         for imported_version in imported_versions:
             if imported_version not in self.versions:
                 self.versions.append(imported_version)
@@ -650,7 +2284,16 @@ class TitanicLauncher(ctk.CTk):
         # Just refresh the version buttons to show current state
         self.refresh_version_buttons()
         
-        self.status_text.set("Versions loaded")
+        # Queued downloads need the catalog's download links, start them once it is loaded
+        if not self.download_queue.started:
+            self.download_queue.start()
+            # Check every installed version in the background once per session
+            self.verify_installed_versions()
+        
+        # Refresh stale download link checks (new releases may have arrived)
+        self.start_catalog_enrichment()
+        
+        self.set_status("Versions loaded")
     
     @staticmethod
     def version_key(v):
@@ -668,81 +2311,99 @@ class TitanicLauncher(ctk.CTk):
 
     def refresh_version_buttons(self):
         """Refresh the version buttons in the sidebar - show only installed versions"""
-        # Clear existing buttons
-        for widget in self.scrollable_list.winfo_children():
-            widget.destroy()
-        
         self.scrollable_list.grid_columnconfigure(0, weight=1)
-        self.version_buttons.clear()
         
         # Get installed versions in custom order if available, otherwise default order
         installed_versions = self.get_installed_versions_in_order()
+        installed = set(installed_versions)
+        self.installed_versions = installed
+        
+        # Drop rows of versions that are no longer installed
+        for version in [v for v in self.version_rows if v not in installed]:
+            self.version_rows.pop(version).destroy()
+            self.version_buttons.pop(version, None)
+            self.version_row_index.pop(version, None)
         
-        # Add buttons for installed versions only
+        # Create new rows, relabel renamed ones and regrid only rows whose position changed
         for i, version in enumerate(installed_versions):
-            # Get custom name
-            config = self.get_version_config(version)
-            display_name = config['custom_name']
-            
-            # Create frame for version button and controls
-            version_frame = ctk.CTkFrame(self.scrollable_list)
-            version_frame.grid(row=i, column=0, sticky="ew", pady=2)
-            version_frame.grid_columnconfigure(0, weight=1)
-            
-            # Create version button
-            btn = ctk.CTkButton(
-                version_frame,
-                text=display_name,
-                fg_color="transparent",
-                border_width=1,
-                anchor="w",
-                height=40,
-                corner_radius=self.button_corner_radius.get(),
-                command=lambda v=version: self.select_version(v)
-            )
-            btn.grid(row=0, column=0, sticky="ew", padx=(0, 5))
-            btn.configure(text_color=("gray10", "gray90"))
-            
-            # Create control buttons frame
-            control_frame = ctk.CTkFrame(version_frame, fg_color="transparent")
-            control_frame.grid(row=0, column=1, sticky="ns")
-            
-            # Up button
-            up_btn = ctk.CTkButton(
-                control_frame,
-                text="▲",
-                width=25,
-                height=20,
-                fg_color="gray30",
-                text_color=("gray10", "gray90"),
-                command=lambda v=version: self.move_version_up(v)
-            )
-            up_btn.grid(row=0, column=0, padx=(0, 2))
-            
-            # Down button
-            down_btn = ctk.CTkButton(
-                control_frame,
-                text="▼",
-                width=25,
-                height=20,
-                fg_color="gray30",
-                text_color=("gray10", "gray90"),
-                command=lambda v=version: self.move_version_down(v)
-            )
-            down_btn.grid(row=1, column=0, padx=(0, 0))
+            display_name = self.get_version_config(version)['custom_name']
+            if version not in self.version_rows:
+                self._create_version_row(version, display_name)
+            elif self.version_buttons[version].cget("text") != display_name:
+                self.version_buttons[version].configure(text=display_name)
             
-            # Store reference
-            self.version_buttons[version] = btn
+            if self.version_row_index.get(version) != i:
+                self.version_rows[version].grid(row=i, column=0, sticky="ew", pady=2)
+                self.version_row_index[version] = i
+        
+        # If no versions installed, show message
+        if not installed_versions:
+            if self.no_versions_label is None:
+                self.no_versions_label = ctk.CTkLabel(
+                    self.scrollable_list,
+                    text="No versions installed\nClick 'Download Clients' to get started",
+                    font=ctk.CTkFont(size=12),
+                    text_color="gray"
+                )
+            self.no_versions_label.grid(row=0, column=0, pady=20)
+        elif self.no_versions_label is not None:
+            self.no_versions_label.grid_remove()
+        
+        # Keep an open download dialog in step with installs and deletes
+        if self.download_dialog is not None and self.download_dialog.winfo_exists() and self.download_dialog.winfo_viewable():
+            self.refresh_download_dialog()
+
+    def _create_version_row(self, version, display_name):
+        """Build the sidebar row for one installed version (gridded by refresh_version_buttons)"""
+        # Create frame for version button and controls
+        version_frame = ctk.CTkFrame(self.scrollable_list)
+        version_frame.grid_columnconfigure(0, weight=1)
+        
+        # Create version button
+        btn = ctk.CTkButton(
+            version_frame,
+            text=display_name,
+            fg_color="transparent",
+            border_width=1,
+            anchor="w",
+            height=40,
+            corner_radius=self.button_corner_radius.get(),
+            command=lambda v=version: self.select_version(v)
+        )
+        btn.grid(row=0, column=0, sticky="ew", padx=(0, 5))
+        btn.configure(text_color=("gray10", "gray90"))
+        
+        # Create control buttons frame
+        control_frame = ctk.CTkFrame(version_frame, fg_color="transparent")
+        control_frame.grid(row=0, column=1, sticky="ns")
+        
+        # Up button
+        up_btn = ctk.CTkButton(
+            control_frame,
+            text="▲",
+            width=25,
+            height=20,
+            fg_color="gray30",
+            text_color=("gray10", "gray90"),
+            command=lambda v=version: self.move_version_up(v)
+        )
+        up_btn.grid(row=0, column=0, padx=(0, 2))
+        
+        # Down button
+        down_btn = ctk.CTkButton(
+            control_frame,
+            text="▼",
+            width=25,
+            height=20,
+            fg_color="gray30",
+            text_color=("gray10", "gray90"),
+            command=lambda v=version: self.move_version_down(v)
+        )
+        down_btn.grid(row=1, column=0, padx=(0, 0))
         
-        # If no versions installed, show message
-        if not installed_versions:
-            no_versions_label = ctk.CTkLabel(
-                self.scrollable_list,
-                text="No versions installed\nClick 'Download Clients' to get started",
-                font=ctk.CTkFont(size=12),
-                text_color="gray"
-            )
-            no_versions_label.grid(row=0, column=0, pady=20)
+        # Store references
+        self.version_rows[version] = version_frame
+        self.version_buttons[version] = btn
 
     def get_installed_versions_in_order(self):
         """Get installed versions in custom order if available"""
@@ -754,7 +2415,7 @@ class TitanicLauncher(ctk.CTk):
                 installed_versions.append(version)
         
         # Check if we have a custom order saved
-        version_order = self.version_configs.get('_version_order', [])
+        version_order = self.config_store.version_order()
         
         # Filter the order to only include installed versions
         ordered_versions = [v for v in version_order if v in installed_versions]
@@ -778,7 +2439,7 @@ class TitanicLauncher(ctk.CTk):
                     version_order[current_index - 1], version_order[current_index]
                 
                 # Save the new order
-                self.version_configs['_version_order'] = version_order
+                self.config_store.set_section('_version_order', version_order)
                 self.save_config()
                 
                 # Refresh the buttons
@@ -798,7 +2459,7 @@ class TitanicLauncher(ctk.CTk):
                     version_order[current_index + 1], version_order[current_index]
                 
                 # Save the new order
-                self.version_configs['_version_order'] = version_order
+                self.config_store.set_section('_version_order', version_order)
                 self.save_config()
                 
                 # Refresh the buttons
@@ -849,23 +2510,15 @@ class TitanicLauncher(ctk.CTk):
         self.launch_args_entry.delete(0, 'end')
         self.launch_args_entry.insert(0, config['launch_args'])
         
-        self.status_text.set(f"Selected {display_name}")
+        self.set_status(f"Selected {display_name}")
 
     def load_preview_image(self, image_url):
         """Load and display preview image for a version"""
         try:
             # Add proper headers to mimic browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Referer': 'https://osu.titanic.sh/download/',
-                'Accept': 'image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            headers = dict(IMAGE_REQUEST_HEADERS, Referer='https://osu.titanic.sh/download/')
             
-            response = requests.get(image_url, headers=headers, timeout=10)
+            response = self.http.get(image_url, headers=headers)
             if response.status_code == 200:
                 # Load image from response
                 image_data = io.BytesIO(response.content)
@@ -897,17 +2550,17 @@ class TitanicLauncher(ctk.CTk):
                 ctk_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=(target_width, target_height))
                 
                 # Update UI in main thread
-                self.after(0, lambda: self.update_preview_image(ctk_image))
+                self.ui.call(lambda: self.update_preview_image(ctk_image))
             else:
                 print(f"Image request failed with status {response.status_code} for URL: {image_url}")
                 # If it's an /ss/ URL that failed, try to find an alternative
                 if '/ss/' in image_url:
-                    self.after(0, lambda: self.clear_preview_image("Preview image unavailable (protected)"))
+                    self.ui.call(lambda: self.clear_preview_image("Preview image unavailable (protected)"))
                 else:
-                    self.after(0, lambda: self.clear_preview_image("Preview image unavailable"))
+                    self.ui.call(lambda: self.clear_preview_image("Preview image unavailable"))
         except Exception as e:
             print(f"Failed to load preview image: {e}")
-            self.after(0, lambda: self.clear_preview_image("Failed to load preview image"))
+            self.ui.call(lambda: self.clear_preview_image("Failed to load preview image"))
 
     def clear_preview_image(self, text="No preview image available"):
         """Clear the preview image and show placeholder text"""
@@ -985,150 +2638,1411 @@ class TitanicLauncher(ctk.CTk):
         # but no longer loads any logo since we removed the logo display
         pass
 
-    def update_logo(self):
-        """Update the logo display"""
-        # Logo functionality has been removed - this method is kept for compatibility
-        # but no longer updates any logo since we removed the logo display
-        pass
+    def update_logo(self):
+        """Update the logo display"""
+        # Logo functionality has been removed - this method is kept for compatibility
+        # but no longer updates any logo since we removed the logo display
+        pass
+
+    def handle_main_action(self):
+        """Handle the main action button - always launch for installed versions"""
+        version = self.selected_version.get()
+        if not version:
+            messagebox.showerror("Error", "Please select a version first")
+            return
+        
+        # Always launch since we only show installed versions in sidebar
+        self.launch_game()
+
+    def download_version(self):
+        """Download selected Titanic version"""
+        version = self.selected_version.get()
+        if not version:
+            messagebox.showerror("Error", "Please select a version to download")
+            return
+        
+        # Catch installs that cannot fit right away when the archive size is already known
+        try:
+            self.check_disk_space(version, self.release_meta.get(version))
+        except Exception as e:
+            messagebox.showerror("Not Enough Disk Space", str(e))
+            return
+        
+        # Hand the download to the queue, it runs on a worker thread
+        self.download_queue.add(version)
+        self.log_to_console(f"Queued download for {version}")
+
+    def _run_download_job(self, job):
+        """Run a download queue job (called on a queue worker thread)"""
+        self._download_version_thread(job['version'], job)
+
+    def _download_version_thread(self, version, job=None):
+        """Download version in background thread"""
+        try:
+            self.log_to_console(f"Starting download for {version}...")
+            self.set_status(f"Downloading {version}...")
+            self.set_progress(0)
+            
+            use_cache = self.download_settings['archive_cache']
+            cached_path = None
+            validator = None
+            try:
+                download_url = self.resolve_download_url(version)
+            except Exception:
+                # Offline or the release vanished, a cached archive still installs
+                cached_path = self.archive_cache.lookup(version) if use_cache else None
+                if not cached_path:
+                    raise
+                download_url = None
+                self.log_to_console(f"No download URL for {version}, using the cached archive", "WARNING")
+            
+            if download_url and use_cache:
+                # The server's validator tells us whether a cached copy is still current
+                validator = self.archive_validator(self.head_archive(download_url))
+                if validator:
+                    cached_path = self.archive_cache.lookup(version, validator)
+            
+            # Refuse installs that will not fit before anything is written
+            try:
+                meta = self.get_release_meta(version, download_url) if download_url else self.release_meta.get(version)
+            except Exception as e:
+                self.log_to_console(f"Could not inspect archive size: {e}", "WARNING")
+                meta = None
+            self.check_disk_space(version, meta)
+            
+            # Download path
+            download_path = os.path.join(self.versions_dir, f"{version}.zip")
+            
+            self.log_to_console(f"Downloading to: {download_path}")
+            
+            # Extract into staging, the current install stays playable until the swap
+            staging_path = self.prepare_staging(version)
+            
+            expected_sizes = None
+            installed = False
+            if cached_path:
+                expected_sizes = self.install_from_cached_archive(version, cached_path, staging_path, job)
+                installed = True
+            
+            # Reuse files from the closest installed build when the server supports ranges
+            # (skipped when caching, the cache needs the whole archive)
+            if not installed and not use_cache:
+                expected_sizes = self.try_delta_install(version, download_url, staging_path, job)
+                installed = expected_sizes is not None
+            
+            # Extract while downloading unless there is a partial or verified archive to use
+            # (a failed stream leaves its .part behind, so the next attempt resumes through download_archive)
+            if (not installed and not use_cache and self.download_settings['stream_install'] and not os.path.exists(download_path + ".part")
+                    and not self.is_archive_verified(version, download_path)):
+                try:
+                    expected_sizes = self.stream_install_archive(version, download_url, staging_path, download_path, job)
+                    installed = True
+                except StreamingUnsupported as e:
+                    self.log_to_console(f"{e}, finishing the download before extracting", "WARNING")
+                    staging_path = self.prepare_staging(version)
+                except requests.exceptions.RequestException as e:
+                    self.log_to_console(f"Stream interrupted ({e}), resuming the download", "WARNING")
+                    staging_path = self.prepare_staging(version)
+            
+            if not installed:
+                self.download_archive(version, download_url, download_path, job)
+                if job and job['stop'].is_set():
+                    raise DownloadStopped()
+                
+                # Final progress update
+                self.set_progress(100)
+                self.log_to_console("Download completed successfully", "SUCCESS")
+                
+                self.set_status(f"Extracting {version}...")
+                self.log_to_console(f"Extracting to: {staging_path}")
+                
+                # Extract archive
+                with zipfile.ZipFile(download_path, 'r') as zip_ref:
+                    expected_sizes = {info.filename: info.file_size for info in zip_ref.infolist()}
+                self.extract_archive(version, download_path, staging_path, job)
+                self.log_to_console("Extraction completed successfully", "SUCCESS")
+                
+                # Keep the archive in the cache, or clean up the zip file
+                if use_cache and validator and self.archive_cache.store(version, validator, download_path):
+                    count, used = self.archive_cache.usage()
+                    self.log_to_console(f"Cached archive of {version} ({count} archives, {self.format_size(used)} used)")
+                else:
+                    if os.path.exists(download_path):
+                        os.remove(download_path)
+                    self.log_to_console(f"Cleaned up zip file: {download_path}")
+            
+            self.commit_staged_install(version, staging_path, expected_sizes)
+            
+            self.set_status(f"Successfully installed {version}")
+            self.log_to_console(f"Successfully installed {version}", "SUCCESS")
+            self.set_progress(100)
+            
+            # Refresh UI with a delay to avoid canvas errors (scheduled from the main thread)
+            self.ui.call(lambda: self.after(1000, self.refresh_version_buttons))
+            self.ui.call(lambda: self.after(1000, lambda: self.select_version(version)))  # Update the display and button
+            
+        except DownloadStopped:
+            state = job['state'] if job else 'stopped'
+            self.log_to_console(f"Download of {version} {state}", "WARNING")
+            self.set_status(f"Download of {version} {state}")
+            self.discard_staging(version)
+            raise
+        except Exception as e:
+            self.discard_staging(version)
+            error_msg = f"Failed to download {version}: {str(e)}"
+            self.log_to_console(error_msg, "ERROR")
+            self.set_status(f"Failed to download {version}")
+            self.set_progress(0)
+            
+            # Only interrupt the user when this was not part of an unattended batch
+            if not self.download_queue.has_pending(exclude=job):
+                self.ui.call(lambda: messagebox.showerror("Error", error_msg))
+            raise
+
+    @staticmethod
+    def archive_validator(info):
+        """Identify the server's current copy of an archive (ETag, else Last-Modified, else its size)"""
+        if not info:
+            return None
+        if info['etag'] or info['last_modified']:
+            return info['etag'] or info['last_modified']
+        return f"size:{info['total']}" if info['total'] else None
+
+    def install_from_cached_archive(self, version, cached_path, staging_path, job=None):
+        """Extract a cached archive into staging, returns its member sizes"""
+        self.log_to_console(f"Installing {version} from the archive cache")
+        if not self.is_archive_verified(version, cached_path):
+            self.validate_archive(cached_path, None)
+        with zipfile.ZipFile(cached_path, 'r') as zip_ref:
+            expected_sizes = {info.filename: info.file_size for info in zip_ref.infolist()}
+        self.extract_archive(version, cached_path, staging_path, job)
+        return expected_sizes
+
+    def resolve_download_url(self, version):
+        """Find a working archive URL for version, trying the catalog link first, then the fallback patterns"""
+        download_url = None
+        
+        # The background link check already found a working URL (the fastest mirror if the main link was dead)
+        health = self.get_release_health(version)
+        if health and health.get('reachable') and self.probe_download_url(health['url']):
+            self.log_to_console(f"Using known working URL for {version}: {health['url']}")
+            return health['url']
+        
+        # Use scraped URL if available
+        if version in self.download_links:
+            api_url = self.download_links[version]
+            self.log_to_console(f"Trying download URL: {api_url}")
+            if self.probe_download_url(api_url):
+                download_url = api_url
+                self.log_to_console(f"Using API URL for {version}")
+                self.set_status(f"Using API URL for {version}")
+            else:
+                self.log_to_console("API URL failed", "WARNING")
+        
+        # If API URL failed, probe the fallback patterns
+        if not download_url:
+            self.log_to_console("Probing fallback download URLs...")
+            download_url = self.find_fallback_download_url(version)
+            if download_url:
+                self.log_to_console(f"Found working URL: {download_url}")
+                self.set_status(f"Using fallback URL for {version}")
+        
+        if not download_url:
+            raise Exception("Could not find valid download URL")
+        return download_url
+
+    def find_delta_base(self, version):
+        """Pick the installed version closest to version by release date, or None"""
+        target_key = self.version_key(version)
+        installed = [v for v in self.get_installed_versions_in_order()
+                     if v == version or self.version_key(v) != (0, 0, 0, 0)]
+        if version in installed:
+            # Reinstalling, the current install is the best possible base
+            return version
+        if target_key == (0, 0, 0, 0) or not installed:
+            return None
+        
+        def distance(v):
+            year, month, day, build = self.version_key(v)
+            target_year, target_month, target_day, target_build = target_key
+            days = abs((year - target_year) * 372 + (month - target_month) * 31 + (day - target_day))
+            return (days, abs(build - target_build))
+        
+        return min(installed, key=distance)
+
+    def try_delta_install(self, version, url, staging_path, job=None):
+        """Build version in staging from the closest installed build plus changed files fetched by range.
+        
+        Returns the archive's member sizes, or None when a full download should be used instead.
+        """
+        if not self.download_settings['delta_updates']:
+            return None
+        base = self.find_delta_base(version)
+        if not base:
+            return None
+        info = self.head_archive(url)
+        if not info or not info['ranges'] or not info['total']:
+            return None
+        
+        try:
+            source = HttpRangeSource(self.http, url, info['total'])
+            members = read_zip_directory(source)
+            base_path = os.path.join(self.versions_dir, base)
+            self.set_status(f"Comparing {version} with {base}...")
+            reuse, fetch = plan_zip_delta(members, base_path)
+            
+            fetch_bytes = sum(member['end'] - member['offset'] for member in fetch)
+            if fetch_bytes > info['total'] * DELTA_MAX_FETCH_RATIO:
+                self.log_to_console(f"{version} differs too much from {base}, downloading the full archive")
+                return None
+            
+            self.log_to_console(f"Delta install from {base}: reusing {len(reuse)} files, "
+                                f"fetching {len(fetch)} files ({self.format_size(fetch_bytes)} of {self.format_size(info['total'])})")
+            apply_zip_delta(
+                source, members, reuse, fetch, base_path, staging_path,
+                on_progress=lambda done, total: self.report_download_progress(version, job, done, total),
+                stop_event=job['stop'] if job else None
+            )
+        except DownloadStopped:
+            raise
+        except Exception as e:
+            self.log_to_console(f"Delta install failed ({e}), downloading the full archive", "WARNING")
+            self.prepare_staging(version)
+            return None
+        
+        self.set_progress(100)
+        self.log_to_console(f"Delta install fetched {self.format_size(source.fetched)}", "SUCCESS")
+        return {member['name']: member['size'] for member in members}
+
+    def stream_install_archive(self, version, url, extract_path, download_path, job=None):
+        """Download an archive over one connection and extract it as the bytes arrive.
+        
+        The bytes are also kept in the usual .part file and sidecar, so if the stream fails download_archive
+        resumes from where it stopped instead of starting over. Both are removed once the install is extracted.
+        """
+        part_path = download_path + ".part"
+        state_path = part_path + ".json"
+        self.log_to_console(f"Streaming install to: {extract_path}")
+        response = self.http.get(url, stream=True)
+        extractor = StreamingZipExtractor(extract_path)
+        received = 0
+        state = None
+        try:
+            if response.status_code != 200:
+                raise Exception(f"Server returned status {response.status_code}")
+            total_size = int(response.headers.get('content-length', 0))
+            self.log_to_console(f"Total download size: {self.format_size(total_size)}")
+            
+            state = {
+                'url': url,
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+                'total': total_size,
+                'received': 0
+            }
+            self.save_part_state(state_path, state)
+            
+            last_progress_update = 0
+            last_state_save = 0
+            with open(part_path, 'wb') as f:
+                try:
+                    for chunk in response.iter_content(chunk_size=64 * 1024):
+                        if chunk:
+                            if received == 0 and not chunk.startswith(b'PK'):
+                                raise Exception("Server did not return a zip archive (the server may have returned a web page)")
+                            # On disk first, so the bytes survive if the extractor gives up on this chunk
+                            f.write(chunk)
+                            received += len(chunk)
+                            extractor.feed(chunk)
+                            
+                            # Checkpoint progress so a later attempt can resume
+                            if received - last_state_save > 4 * 1024 * 1024:
+                                f.flush()
+                                state['received'] = received
+                                self.save_part_state(state_path, state)
+                                last_state_save = received
+                            
+                            if received - last_progress_update > 1024 * 1024:  # Update every 1MB
+                                self.report_download_progress(version, job, received, total_size)
+                                last_progress_update = received
+                finally:
+                    f.flush()
+                    state['received'] = received
+                    self.save_part_state(state_path, state)
+            
+            if total_size and received != total_size:
+                raise Exception(f"Download incomplete ({self.format_size(received)} of {self.format_size(total_size)})")
+            count = extractor.finish()
+        except BaseException:
+            # The half-extracted tree is dropped, the .part file is kept for download_archive to resume
+            extractor.close()
+            shutil.rmtree(extract_path, ignore_errors=True)
+            if received == 0 or (state and not (state['etag'] or state['last_modified'] or state['total'])):
+                # Nothing worth resuming (or no way to check the server's copy is the same)
+                for path in (part_path, state_path):
+                    if os.path.exists(path):
+                        os.remove(path)
+            raise
+        finally:
+            response.close()
+        
+        # Extracted and verified, the archive itself is not kept
+        os.remove(part_path)
+        self.remove_part_state(state_path)
+        
+        self.set_progress(100)
+        self.log_to_console(f"Extracted and verified {count} entries ({self.format_size(extractor.extracted_bytes)})", "SUCCESS")
+        return {name: size for name, (crc, size) in extractor.entries.items()}
+
+    def prepare_staging(self, name):
+        """Return an empty staging directory for an install of name"""
+        staging_path = os.path.join(self.staging_dir, name)
+        if os.path.exists(staging_path):
+            shutil.rmtree(staging_path)
+        os.makedirs(staging_path)
+        return staging_path
+
+    def discard_staging(self, name):
+        """Remove a failed or stopped install's staging directory"""
+        shutil.rmtree(os.path.join(self.staging_dir, name), ignore_errors=True)
+
+    def validate_staged_install(self, staging_path, expected_sizes=None):
+        """Check a staged install has osu!.exe and that every file matches its size in the archive"""
+        if not os.path.isfile(os.path.join(staging_path, "osu!.exe")):
+            raise Exception("Installed files do not contain osu!.exe")
+        for member, size in (expected_sizes or {}).items():
+            if member.endswith('/'):
+                continue
+            path = zip_member_path(staging_path, member)
+            if not os.path.isfile(path) or os.path.getsize(path) != size:
+                raise Exception(f"Installed file does not match the archive: {member}")
+
+    def commit_staged_install(self, version, staging_path, expected_sizes=None):
+        """Validate a staged install and swap it in with renames, rolling back if the swap fails"""
+        self.validate_staged_install(staging_path, expected_sizes)
+        
+        if self.download_settings['dedup_installs']:
+            linked, saved = self.object_store.dedup_tree(staging_path)
+            if linked:
+                self.log_to_console(f"Shared {linked} files with other versions, saved {self.format_size(saved)}")
+        
+        # Record the freshly validated files as the baseline for Verify
+        try:
+            self.verifier.build(version, staging_path, list(expected_sizes) if expected_sizes else None)
+        except OSError as e:
+            self.log_to_console(f"Could not build file manifest for {version}: {e}", "WARNING")
+        
+        extract_path = os.path.join(self.versions_dir, version)
+        trash_path = None
+        if os.path.exists(extract_path):
+            # Move the old install aside first, it is only deleted once the new one is in place
+            os.makedirs(self.trash_dir, exist_ok=True)
+            trash_path = os.path.join(self.trash_dir, f"{version}-{int(time.time() * 1000)}")
+            try:
+                os.rename(extract_path, trash_path)
+            except OSError as e:
+                raise Exception(f"Could not replace {version}, is it still running? ({e})")
+        
+        try:
+            os.rename(staging_path, extract_path)
+        except OSError:
+            if trash_path:
+                os.rename(trash_path, extract_path)
+                self.log_to_console(f"Restored previous install of {version}", "WARNING")
+            raise
+        
+        if trash_path:
+            self.log_to_console(f"Replaced previous install of {version}")
+            self.empty_install_trash()
+
+    def empty_install_trash(self, include_staging=False):
+        """Delete replaced installs in a background thread, optionally moving staging leftovers to the trash first"""
+        if include_staging and os.path.isdir(self.staging_dir):
+            # Renames are instant, so new installs never see a stale staging directory
+            os.makedirs(self.trash_dir, exist_ok=True)
+            for entry in os.listdir(self.staging_dir):
+                try:
+                    os.rename(os.path.join(self.staging_dir, entry),
+                              os.path.join(self.trash_dir, f"{entry}-{int(time.time() * 1000)}"))
+                except OSError as e:
+                    print(f"Failed to clear staging entry {entry}: {e}")
+        
+        def worker():
+            if os.path.isdir(self.trash_dir):
+                for entry in os.listdir(self.trash_dir):
+                    shutil.rmtree(os.path.join(self.trash_dir, entry), ignore_errors=True)
+            # Shared files only used by the deleted trees can go too
+            self.object_store.prune()
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+    def update_archive_cache_report(self, label):
+        """Show how many archives the cache holds and how much space they use"""
+        count, used = self.archive_cache.usage()
+        label.configure(text=f"{count} cached archives, {self.format_size(used)} of {self.archive_cache_gb.get()} GB")
+
+    def update_archive_cache_limit(self, value, label):
+        """Apply and save a new archive cache budget, evicting archives over it"""
+        self.archive_cache_gb.set(value)
+        self.archive_cache.set_limit(value * 1024 ** 3)
+        self.save_options_config()
+        self.update_archive_cache_report(label)
+
+    def clear_archive_cache(self, label):
+        """Delete every cached archive"""
+        if messagebox.askyesno("Clear Cache", "Delete all cached archives?"):
+            self.archive_cache.clear()
+            self.log_to_console("Archive cache cleared")
+            self.update_archive_cache_report(label)
+
+    def update_dedup_report(self, label):
+        """Show how much disk the shared object store saves (computed in the background)"""
+        def worker():
+            count, saved = self.object_store.stats()
+            text = f"{count} shared files, saving {self.format_size(saved)}" if count else "No shared files yet"
+            self.ui.call(lambda: label.winfo_exists() and label.configure(text=text))
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+    def dedup_installed_versions(self, label=None):
+        """Hardlink identical files across every installed version in a background thread"""
+        def worker():
+            total_linked = 0
+            total_saved = 0
+            for entry in sorted(os.listdir(self.versions_dir)):
+                version_path = os.path.join(self.versions_dir, entry)
+                if entry.startswith('.') or not os.path.isfile(os.path.join(version_path, "osu!.exe")):
+                    continue
+                self.set_status(f"Deduplicating {entry}...")
+                linked, saved = self.object_store.dedup_tree(version_path)
+                total_linked += linked
+                total_saved += saved
+            
+            self.log_to_console(f"Deduplicated {total_linked} files, saved {self.format_size(total_saved)}", "SUCCESS")
+            self.set_status(f"Deduplication saved {self.format_size(total_saved)}")
+            if label is not None:
+                self.update_dedup_report(label)
+        
+        threading.Thread(target=worker, daemon=True).start()
+
+    def verify_selected_version(self):
+        """Verify the selected version's files and report the result"""
+        version = self.selected_version.get()
+        if not version or not os.path.isdir(os.path.join(self.versions_dir, version)):
+            messagebox.showerror("Error", "Please select an installed version to verify")
+            return
+        self.set_status(f"Verifying {version}...")
+        self.verify_version(version, report=True)
+
+    def verify_version(self, version, report=False):
+        """Queue a version on the low-priority verify pool"""
+        tree = os.path.join(self.versions_dir, version)
+        
+        def task():
+            start = time.time()
+            result = self.verifier.verify(version, tree)
+            result['seconds'] = time.time() - start
+            return result
+        
+        future = self.verify_pool.submit(task)
+        future.add_done_callback(lambda f: self.ui.call(lambda: self._on_verify_done(version, f, report)))
+        return future
+
+    def verify_installed_versions(self):
+        """Verify every installed version that is not being downloaded right now"""
+        busy = {job['version'] for job in self.download_queue.active_jobs()}
+        for version in self.get_installed_versions_in_order():
+            if version not in busy:
+                self.verify_version(version)
+
+    def _on_verify_done(self, version, future, report):
+        """Log (and optionally show) the outcome of a verify task"""
+        try:
+            result = future.result()
+        except Exception as e:
+            self.log_to_console(f"Could not verify {version}: {e}", "ERROR")
+            if report:
+                messagebox.showerror("Verify Failed", f"Could not verify {version}: {e}")
+            return
+        
+        self.verify_results[version] = result
+        problems = result['missing'] + result['modified']
+        summary = f"{result['checked']} files checked, {result['rehashed']} re-hashed in {result['seconds']:.1f}s"
+        if not problems:
+            self.log_to_console(f"Verified {version}: {summary}", "SUCCESS")
+            if report:
+                self.set_status(f"{version} verified")
+                messagebox.showinfo("Verify Files", f"All files of {version} are intact.\n\n{summary}")
+            return
+        
+        self.log_to_console(f"{version}: {len(result['missing'])} missing, {len(result['modified'])} modified files ({summary})", "WARNING")
+        for name in problems[:20]:
+            self.log_to_console(f"  {'missing' if name in result['missing'] else 'modified'}: {name}", "WARNING")
+        self.set_status(f"{version} has {len(problems)} damaged files")
+        if report:
+            listing = "\n".join(problems[:10]) + ("\n..." if len(problems) > 10 else "")
+            if messagebox.askyesno("Verify Files", f"{version} has {len(result['missing'])} missing and {len(result['modified'])} modified files:\n\n{listing}\n\nRepair them now?"):
+                self.repair_version(version)
+
+    def repair_selected_version(self):
+        """Repair the selected version's damaged files"""
+        version = self.selected_version.get()
+        if not version or not os.path.isdir(os.path.join(self.versions_dir, version)):
+            messagebox.showerror("Error", "Please select an installed version to repair")
+            return
+        self.repair_version(version)
+
+    def repair_version(self, version):
+        """Start a repair of version in a background thread"""
+        job = self.download_queue.find(version)
+        if job and job['state'] == 'downloading':
+            messagebox.showinfo("Repair Files", f"{version} is being downloaded right now")
+            return
+        thread = threading.Thread(target=self._repair_version_thread, args=(version,))
+        thread.daemon = True
+        thread.start()
+
+    def _repair_version_thread(self, version):
+        """Compare an install with the remote archive's central directory and re-fetch only broken members"""
+        tree = os.path.join(self.versions_dir, version)
+        try:
+            self.log_to_console(f"Repairing {version}...")
+            self.set_status(f"Checking {version} against the server...")
+            
+            # A cached copy of the release repairs without touching the network
+            cached_path = self.archive_cache.lookup(version) if self.download_settings['archive_cache'] else None
+            if cached_path:
+                self.log_to_console(f"Repairing {version} from the archive cache")
+                source = LocalRangeSource(cached_path)
+            else:
+                download_url = self.resolve_download_url(version)
+                info = self.head_archive(download_url)
+                if not info or not info['ranges'] or not info['total']:
+                    # Without ranges the only way to repair is a full reinstall
+                    self.ui.call(lambda: self._offer_reinstall(version, "The server does not support partial downloads."))
+                    return
+                source = HttpRangeSource(self.http, download_url, info['total'])
+            members = [member for member in read_zip_directory(source) if is_verifiable_file(member['name'])]
+            reuse, fetch = plan_zip_delta(members, tree)
+            
+            if fetch:
+                fetch_bytes = sum(member['end'] - member['offset'] for member in fetch)
+                self.log_to_console(f"Re-fetching {len(fetch)} damaged files ({self.format_size(fetch_bytes)})")
+                for member in fetch:
+                    self.log_to_console(f"  {member['name']}")
+                
+                def on_progress(done, total):
+                    progress = (done / total) * 100
+                    self.set_progress(progress)
+                    self.set_status(f"Repairing {version}: {progress:.1f}%")
+                
+                apply_zip_delta(source, members, [], fetch, tree, tree, on_progress=on_progress)
+            
+            # The repaired tree is the new baseline
+            self.verifier.build(version, tree, [member['name'] for member in members])
+            self.verify_results.pop(version, None)
+            
+            if fetch:
+                message = f"Repaired {len(fetch)} files of {version} ({self.format_size(getattr(source, 'fetched', 0))} downloaded)"
+            else:
+                message = f"All files of {version} match the server, nothing to repair"
+            self.log_to_console(message, "SUCCESS")
+            self.set_status(message)
+            self.ui.call(lambda: messagebox.showinfo("Repair Files", message))
+        except Exception as e:
+            error_msg = f"Failed to repair {version}: {str(e)}"
+            self.log_to_console(error_msg, "ERROR")
+            self.set_status(f"Repair of {version} failed")
+            self.ui.call(lambda: self._offer_reinstall(version, error_msg))
+
+    def _offer_reinstall(self, version, reason):
+        """Ask whether to queue a full reinstall when a repair is not possible"""
+        if messagebox.askyesno("Repair Files", f"{reason}\n\nReinstall {version} with a full download instead?"):
+            self.download_queue.add(version)
+
+    def extract_archive(self, name, zip_path, extract_path, job=None):
+        """Extract a zip on the parallel extractor, showing byte progress in the status bar"""
+        last_update = [0]
+        
+        def on_progress(done, total):
+            # Called from the extraction workers, update every 2MB
+            if done - last_update[0] >= 2 * 1024 * 1024 or done == total:
+                last_update[0] = done
+                progress = (done / total) * 100
+                self.set_progress(progress)
+                self.set_status(f"Extracting {name}: {progress:.1f}%")
+        
+        self.set_status(f"Extracting {name}...")
+        self.set_progress(0)
+        start = time.time()
+        written = extract_zip_parallel(zip_path, extract_path, on_progress=on_progress,
+                                       stop_event=job['stop'] if job else None)
+        self.log_to_console(f"Extracted {self.format_size(written)} in {time.time() - start:.1f}s")
+
+    def report_download_progress(self, version, job, received, total_size):
+        """Update a job's progress and the shared status line, stops the download if the job was paused or cancelled"""
+        if job:
+            job['downloaded'] = received
+            job['total'] = total_size
+            if job['stop'].is_set():
+                raise DownloadStopped()
+        
+        # Show combined progress when several downloads are running
+        active = self.download_queue.active_jobs()
+        if len(active) > 1:
+            received = sum(active_job['downloaded'] for active_job in active)
+            total_size = sum(active_job['total'] for active_job in active)
+            label = f"Downloading {len(active)} versions"
+        else:
+            label = f"Downloading {version}"
+        
+        if total_size > 0:
+            progress = (received / total_size) * 100
+            self.set_progress(progress)
+            self.set_status(f"{label}: {progress:.1f}%")
+
+    def remove_partial_download(self, version):
+        """Delete the archive and .part files of a cancelled download"""
+        download_path = os.path.join(self.versions_dir, f"{version}.zip")
+        for path in (download_path, download_path + ".part", download_path + ".part.json"):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                self.log_to_console(f"Failed to remove {path}: {e}", "WARNING")
+        self.log_to_console(f"Removed partial download of {version}")
+
+    def sync_download_settings(self):
+        """Copy the download options into a plain dict for worker threads (runs on the main thread)"""
+        self.download_settings = {
+            'segments': self.download_segments.get(),
+            'stream_install': self.stream_install.get(),
+            'dedup_installs': self.dedup_installs.get(),
+            'delta_updates': self.delta_updates.get(),
+            'archive_cache': self.archive_cache_enabled.get()
+        }
+
+    def update_max_concurrent_downloads(self, value):
+        """Apply and save the simultaneous downloads limit"""
+        self.max_concurrent_downloads.set(value)
+        self.download_queue.set_max_concurrent(value)
+        self.save_options_config()
+
+    def open_download_queue(self):
+        """Open the download queue window, or focus it if already open"""
+        if self.queue_window is not None and self.queue_window.winfo_exists():
+            self.queue_window.focus_set()
+            return
+        
+        ctk.set_appearance_mode(self.appearance_mode.get())
+        
+        queue_window = ctk.CTkToplevel(self)
+        queue_window.title("Download Queue")
+        queue_window.geometry("600x450")
+        queue_window.transient(self)
+        self.queue_window = queue_window
+        self.queue_rows = {}
+        self.queue_order = []
+        
+        main_frame = ctk.CTkFrame(queue_window)
+        main_frame.pack(fill="both", expand=True, padx=20, pady=20)
+        
+        ctk.CTkLabel(main_frame, text="Download Queue", font=ctk.CTkFont(size=24, weight="bold")).pack(pady=(10, 20))
+        
+        self.queue_list_frame = ctk.CTkScrollableFrame(main_frame, height=280)
+        self.queue_list_frame.pack(fill="both", expand=True, pady=(0, 10))
+        self.queue_list_frame.grid_columnconfigure(0, weight=1)
+        
+        self.queue_empty_label = ctk.CTkLabel(self.queue_list_frame, text="No downloads queued", text_color="gray")
+        
+        bottom_frame = ctk.CTkFrame(main_frame, fg_color="transparent")
+        bottom_frame.pack(fill="x")
+        
+        clear_btn = ctk.CTkButton(bottom_frame, text="Clear Finished", command=self.download_queue.clear_finished, fg_color="#17a2b8", hover_color="#138496")
+        clear_btn.pack(side="left", padx=5)
+        
+        close_btn = ctk.CTkButton(bottom_frame, text="Close", command=queue_window.destroy, fg_color="#6c757d")
+        close_btn.pack(side="right", padx=5)
+        
+        self.refresh_download_queue_window()
+        
+        # Poll job progress while the window is open
+        def poll():
+            if queue_window.winfo_exists():
+                self.refresh_download_queue_window()
+                queue_window.after(500, poll)
+        
+        queue_window.after(500, poll)
+
+    def refresh_download_queue_window(self):
+        """Sync the download queue window with the queue's jobs"""
+        if self.queue_window is None or not self.queue_window.winfo_exists():
+            return
+        
+        jobs = self.download_queue.snapshot()
+        order = [job['version'] for job in jobs]
+        
+        # Rebuild the rows only when jobs were added, removed or reordered
+        if order != self.queue_order:
+            for row in self.queue_rows.values():
+                row['frame'].destroy()
+            self.queue_rows = {}
+            self.queue_order = order
+            
+            if jobs:
+                self.queue_empty_label.grid_forget()
+            else:
+                self.queue_empty_label.grid(row=0, column=0, pady=20)
+            
+            for index, job in enumerate(jobs):
+                self.queue_rows[job['version']] = self._create_queue_row(index, job['version'])
+        
+        for job in jobs:
+            row = self.queue_rows[job['version']]
+            display_name = self.get_version_config(job['version'])['custom_name']
+            row['name'].configure(text=display_name)
+            
+            state = job['state'].capitalize()
+            if job['state'] == 'downloading' and job['total'] > 0:
+                state = f"{self.format_size(job['downloaded'])} / {self.format_size(job['total'])}"
+            elif job['state'] == 'failed' and job['message']:
+                state = f"Failed: {job['message'][:60]}"
+            row['state'].configure(text=state)
+            
+            if job['state'] == 'completed':
+                row['progress'].set(1)
+            elif job['total'] > 0:
+                row['progress'].set(job['downloaded'] / job['total'])
+            else:
+                row['progress'].set(0)
+            
+            can_resume = job['state'] in ('paused', 'failed')
+            row['toggle'].configure(
+                text="▶" if can_resume else "⏸",
+                state="normal" if job['state'] in ('queued', 'downloading', 'paused', 'failed') else "disabled"
+            )
+            row['cancel'].configure(state="normal" if job['state'] not in ('completed', 'cancelled') else "disabled")
+
+    def _create_queue_row(self, index, version):
+        """Create the widgets for one job in the download queue window"""
+        frame = ctk.CTkFrame(self.queue_list_frame)
+        frame.grid(row=index, column=0, sticky="ew", pady=3, padx=5)
+        frame.grid_columnconfigure(0, weight=1)
+        
+        name_label = ctk.CTkLabel(frame, text=version, font=ctk.CTkFont(size=14, weight="bold"), anchor="w")
+        name_label.grid(row=0, column=0, sticky="w", padx=10, pady=(5, 0))
+        
+        state_label = ctk.CTkLabel(frame, text="", font=ctk.CTkFont(size=11), text_color="gray", anchor="w")
+        state_label.grid(row=1, column=0, sticky="w", padx=10)
+        
+        progress = ctk.CTkProgressBar(frame)
+        progress.grid(row=2, column=0, sticky="ew", padx=10, pady=(0, 8))
+        progress.set(0)
+        
+        def toggle():
+            job = self.download_queue.find(version)
+            if job and job['state'] in ('paused', 'failed'):
+                self.download_queue.resume(version)
+            else:
+                self.download_queue.pause(version)
+        
+        up_btn = ctk.CTkButton(frame, text="▲", width=30, command=lambda: self.download_queue.move(version, -1), fg_color="#6c757d")
+        up_btn.grid(row=0, column=1, rowspan=3, padx=2)
+        
+        down_btn = ctk.CTkButton(frame, text="▼", width=30, command=lambda: self.download_queue.move(version, 1), fg_color="#6c757d")
+        down_btn.grid(row=0, column=2, rowspan=3, padx=2)
+        
+        toggle_btn = ctk.CTkButton(frame, text="⏸", width=30, command=toggle, fg_color="#17a2b8", hover_color="#138496")
+        toggle_btn.grid(row=0, column=3, rowspan=3, padx=2)
+        
+        cancel_btn = ctk.CTkButton(frame, text="✕", width=30, command=lambda: self.download_queue.cancel(version), fg_color="#dc3545", hover_color="#c82333")
+        cancel_btn.grid(row=0, column=4, rowspan=3, padx=(2, 10))
+        
+        return {'frame': frame, 'name': name_label, 'state': state_label, 'progress': progress, 'toggle': toggle_btn, 'cancel': cancel_btn}
+
+    def download_archive(self, version, url, download_path, job=None):
+        """Download url to download_path through a resumable .part file, verifying it before it is promoted"""
+        part_path = download_path + ".part"
+        state_path = part_path + ".json"
+        
+        if self.is_archive_verified(version, download_path):
+            self.log_to_console(f"Using previously verified archive {download_path}")
+            return
+        
+        # Pick up where a previous attempt left off if it was fetching the same URL
+        state = self.load_part_state(state_path)
+        if not (state and state.get('url') == url and os.path.exists(part_path)):
+            state = None
+        
+        # Use several connections when the server supports ranges
+        segment_count = self.download_settings['segments']
+        if (state and 'segments' in state) or (state is None and segment_count > 1):
+            info = self.head_archive(url)
+            if state and not self.segment_state_matches(state, info):
+                self.log_to_console("Archive changed on the server, restarting download", "WARNING")
+                state = None
+            if info and info['ranges'] and info['total'] >= SEGMENT_MIN_SIZE and (state or segment_count > 1):
+                self.download_archive_segmented(version, url, part_path, state_path, info, state, max(segment_count, 1), job)
+                # Segments arrive out of order, hash the finished file in one pass
+                self.finish_archive(version, url, part_path, state_path, download_path, sha256_file(part_path), info['total'])
+                return
+            if state and 'segments' in state:
+                state = None
+        
+        try:
+            digest, total_size = self.download_archive_single(version, url, part_path, state_path, state, job)
+        except Exception:
+            # Nothing was kept (e.g. the body was not a zip), do not leave an empty .part behind
+            if os.path.exists(part_path) and os.path.getsize(part_path) == 0:
+                os.remove(part_path)
+                self.remove_part_state(state_path)
+            raise
+        self.finish_archive(version, url, part_path, state_path, download_path, digest, total_size)
+
+    def finish_archive(self, version, url, part_path, state_path, download_path, digest, total_size):
+        """Validate a completed .part file, then promote it and record its digest"""
+        try:
+            self.validate_archive(part_path, total_size)
+        except Exception:
+            # A bad body is not worth resuming, start clean next time
+            os.remove(part_path)
+            self.remove_part_state(state_path)
+            raise
+        
+        # Complete - promote the .part file and drop its sidecar
+        os.replace(part_path, download_path)
+        self.remove_part_state(state_path)
+        self.record_verified_archive(version, download_path, digest, url)
+        self.log_to_console(f"Verified archive (sha256 {digest[:16]}...)")
+
+    def validate_archive(self, path, expected_size):
+        """Check a downloaded archive's length and that its end of central directory is intact"""
+        size = os.path.getsize(path)
+        if expected_size and size != expected_size:
+            raise Exception(f"Download incomplete ({self.format_size(size)} of {self.format_size(expected_size)})")
+        
+        with open(path, 'rb') as f:
+            signature = f.read(4)
+        if signature not in (b'PK\x03\x04', b'PK\x05\x06'):
+            raise Exception("Downloaded file is not a zip archive (the server may have returned a web page)")
+        
+        try:
+            read_zip_directory(LocalRangeSource(path))
+        except Exception as e:
+            raise Exception(f"Downloaded archive is damaged: {e}")
+
+    def record_verified_archive(self, version, path, digest, url):
+        """Remember a verified archive's digest, keyed to its size and mtime so re-checks are instant"""
+        info = os.stat(path)
+        records = self.config_store.get_section('_verified_archives', {})
+        records[version] = {
+            'sha256': digest,
+            'size': info.st_size,
+            'mtime_ns': info.st_mtime_ns,
+            'url': url
+        }
+        self.config_store.set_section('_verified_archives', records)
+        self.config_store.save()
+
+    def is_archive_verified(self, version, path):
+        """Whether path is the archive recorded for version and has not changed since it was verified"""
+        record = self.config_store.get_section('_verified_archives', {}).get(version)
+        if not record or not os.path.isfile(path):
+            return False
+        info = os.stat(path)
+        return info.st_size == record['size'] and info.st_mtime_ns == record['mtime_ns']
+
+    def download_archive_single(self, version, url, part_path, state_path, state, job=None):
+        """Download over one connection, resuming from the sidecar state when given"""
+        received = 0
+        headers = {}
+        if state:
+            received = min(state.get('received', 0), os.path.getsize(part_path))
+            validator = state.get('etag') or state.get('last_modified')
+            if received > 0 and (validator or state.get('total')):
+                headers['Range'] = f"bytes={received}-"
+                if validator:
+                    headers['If-Range'] = validator
+        
+        response = self.http.get(url, stream=True, headers=headers)
+        try:
+            if response.status_code == 206 and headers:
+                # Content-Range: bytes start-end/total
+                content_range = response.headers.get('content-range', '')
+                match = re.match(r'bytes (\d+)-\d+/(\d+|\*)', content_range)
+                range_total = int(match.group(2)) if match and match.group(2) != '*' else None
+                if not match or int(match.group(1)) != received or (state.get('total') and range_total != state['total']):
+                    # Retrying the same range would fail the same way, start over from scratch
+                    self.log_to_console(f"Server returned an unexpected range ({content_range}), restarting download", "WARNING")
+                    return self.restart_archive_single(version, url, part_path, state_path, job)
+                total_size = range_total or state.get('total', 0)
+                self.log_to_console(f"Resuming download at {self.format_size(received)}")
+                mode = 'r+b'
+            elif response.status_code == 416 and headers:
+                self.log_to_console("Server rejected the saved range, restarting download", "WARNING")
+                return self.restart_archive_single(version, url, part_path, state_path, job)
+            elif response.status_code == 200:
+                # Fresh download, or the server ignored the range / the file changed
+                if headers:
+                    self.log_to_console("Server sent the full file, restarting download", "WARNING")
+                received = 0
+                total_size = int(response.headers.get('content-length', 0))
+                mode = 'wb'
+            else:
+                raise Exception(f"Server returned status {response.status_code}")
+            
+            # Partial responses may omit the validators, keep the ones we resumed with
+            previous = state if mode == 'r+b' else {}
+            state = {
+                'url': url,
+                'etag': response.headers.get('ETag') or previous.get('etag'),
+                'last_modified': response.headers.get('Last-Modified') or previous.get('last_modified'),
+                'total': total_size,
+                'received': received
+            }
+            self.save_part_state(state_path, state)
+            
+            self.log_to_console(f"Total download size: {self.format_size(total_size)}")
+            
+            # Hash the stream as it is written, starting with any bytes kept from before
+            digest = hashlib.sha256()
+            if mode == 'r+b':
+                with open(part_path, 'rb') as existing:
+                    remaining = received
+                    while remaining > 0:
+                        block = existing.read(min(remaining, 1024 * 1024))
+                        if not block:
+                            break
+                        digest.update(block)
+                        remaining -= len(block)
+            
+            last_progress_update = received
+            last_state_save = received
+            with open(part_path, mode) as f:
+                f.seek(received)
+                f.truncate()
+                try:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            if received == 0 and not chunk.startswith(b'PK'):
+                                raise Exception("Server did not return a zip archive (the server may have returned a web page)")
+                            f.write(chunk)
+                            digest.update(chunk)
+                            received += len(chunk)
+                            
+                            # Checkpoint progress so a later attempt can resume
+                            if received - last_state_save > 4 * 1024 * 1024:
+                                f.flush()
+                                state['received'] = received
+                                self.save_part_state(state_path, state)
+                                last_state_save = received
+                            
+                            # Update progress less frequently to avoid UI lag
+                            if received - last_progress_update > 1024 * 1024:  # Update every 1MB
+                                self.report_download_progress(version, job, received, total_size)
+                                last_progress_update = received
+                finally:
+                    f.flush()
+                    state['received'] = received
+                    self.save_part_state(state_path, state)
+        finally:
+            response.close()
+        
+        if total_size and received != total_size:
+            raise Exception(f"Download incomplete ({self.format_size(received)} of {self.format_size(total_size)})")
+        return digest.hexdigest(), total_size
+
+    def restart_archive_single(self, version, url, part_path, state_path, job=None):
+        """Throw away a partial download the server no longer agrees with and fetch it again with a plain GET"""
+        for path in (part_path, state_path):
+            try:
+                if os.path.exists(path):
+                    os.remove(path)
+            except OSError as e:
+                self.log_to_console(f"Failed to remove {path}: {e}", "WARNING")
+        return self.download_archive_single(version, url, part_path, state_path, None, job)
+
+    def head_archive(self, url):
+        """HEAD an archive URL, returns its size, validators and range support or None"""
+        try:
+            response = self.http.head(url, allow_redirects=True)
+            response.close()
+            if response.status_code != 200:
+                return None
+            return {
+                'total': int(response.headers.get('content-length', 0)),
+                'ranges': response.headers.get('accept-ranges', '').lower() == 'bytes',
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified')
+            }
+        except Exception as e:
+            self.log_to_console(f"Could not inspect {url}: {e}", "WARNING")
+            return None
+
+    def segment_state_matches(self, state, info):
+        """Check that a saved partial download still describes the file on the server"""
+        if not info:
+            return False
+        if state.get('total') != info['total']:
+            return False
+        if state.get('etag') and info['etag']:
+            return state['etag'] == info['etag']
+        if state.get('last_modified') and info['last_modified']:
+            return state['last_modified'] == info['last_modified']
+        return True
+
+    def download_archive_segmented(self, version, url, part_path, state_path, info, state, segment_count, job=None):
+        """Download byte ranges in parallel into a preallocated .part file"""
+        total_size = info['total']
+        validator = info['etag'] or info['last_modified']
+        
+        if state:
+            # Saved as [start, done, end] per segment
+            segments = [{'start': start, 'pos': done, 'done': done, 'end': end, 'active': False}
+                        for start, done, end in state['segments']]
+            self.log_to_console(f"Resuming segmented download of {version}")
+        else:
+            size = total_size // segment_count
+            bounds = [i * size for i in range(segment_count)] + [total_size]
+            segments = [{'start': bounds[i], 'pos': bounds[i], 'done': bounds[i], 'end': bounds[i + 1], 'active': False}
+                        for i in range(segment_count)]
+            # Preallocate the whole file so every connection can write at its offset
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
+        
+        state = {
+            'url': url,
+            'etag': info['etag'],
+            'last_modified': info['last_modified'],
+            'total': total_size,
+            'segments': [[seg['start'], seg['done'], seg['end']] for seg in segments]
+        }
+        self.save_part_state(state_path, state)
+        
+        self.log_to_console(f"Total download size: {self.format_size(total_size)} over {segment_count} connections")
+        
+        lock = threading.Lock()
+        failed = threading.Event()
+        errors = []
+        workers = [
+            threading.Thread(target=self._segment_worker, args=(url, part_path, validator, total_size, segments, lock, failed, errors), daemon=True)
+            for _ in range(segment_count)
+        ]
+        for worker in workers:
+            worker.start()
+        
+        # Report progress and checkpoint the segment table while the workers run
+        last_state_save = 0
+        while any(worker.is_alive() for worker in workers):
+            time.sleep(0.25)
+            with lock:
+                received = sum(seg['done'] - seg['start'] for seg in segments)
+                state['segments'] = [[seg['start'], seg['done'], seg['end']] for seg in segments]
+            if received - last_state_save > 4 * 1024 * 1024:
+                self.save_part_state(state_path, state)
+                last_state_save = received
+            try:
+                self.report_download_progress(version, job, received, total_size)
+            except DownloadStopped:
+                # Let the workers wind down, the segment table is saved below
+                failed.set()
+        
+        with lock:
+            state['segments'] = [[seg['start'], seg['done'], seg['end']] for seg in segments]
+        self.save_part_state(state_path, state)
+        
+        if job and job['stop'].is_set():
+            raise DownloadStopped()
+        if errors:
+            raise errors[0]
+        if any(seg['done'] < seg['end'] for seg in segments):
+            raise Exception("Segmented download incomplete")
+
+    def _claim_segment(self, segments):
+        """Hand a worker an idle segment, or split the slowest one in half (call with the lock held)"""
+        for segment in segments:
+            if not segment['active'] and segment['pos'] < segment['end']:
+                segment['active'] = True
+                return segment
+        
+        # Nothing idle left - steal the back half of the segment with the most remaining
+        active = [seg for seg in segments if seg['active']]
+        if not active:
+            return None
+        victim = max(active, key=lambda seg: seg['end'] - seg['pos'])
+        remaining = victim['end'] - victim['pos']
+        if remaining < 2 * SEGMENT_SPLIT_MIN:
+            return None
+        middle = victim['pos'] + remaining // 2
+        segment = {'start': middle, 'pos': middle, 'done': middle, 'end': victim['end'], 'active': True}
+        victim['end'] = middle
+        segments.append(segment)
+        return segment
+
+    def _segment_worker(self, url, part_path, validator, total_size, segments, lock, failed, errors):
+        """Fetch segments until none are left, writing each at its offset"""
+        try:
+            # Unbuffered so every write reaches the OS before it is counted as done
+            with open(part_path, 'r+b', buffering=0) as f:
+                while not failed.is_set():
+                    with lock:
+                        segment = self._claim_segment(segments)
+                    if segment is None:
+                        return
+                    try:
+                        self._fetch_segment(url, f, validator, total_size, segment, lock, failed)
+                    finally:
+                        with lock:
+                            segment['active'] = False
+                            segment['pos'] = segment['done']
+        except Exception as e:
+            errors.append(e)
+            failed.set()
+
+    def _fetch_segment(self, url, f, validator, total_size, segment, lock, failed):
+        """Stream one byte range into the .part file"""
+        with lock:
+            start, end = segment['pos'], segment['end']
+        headers = {'Range': f"bytes={start}-{end - 1}"}
+        if validator:
+            headers['If-Range'] = validator
+        
+        response = self.http.get(url, headers=headers, stream=True)
+        try:
+            content_range = response.headers.get('content-range', '')
+            if response.status_code != 206 or not content_range.endswith(f"/{total_size}"):
+                raise Exception(f"Server stopped honouring ranges (status {response.status_code})")
+            
+            written = 0
+            for chunk in response.iter_content(chunk_size=65536):
+                if failed.is_set():
+                    return
+                # Reserve the bytes first so a concurrent split never overlaps them
+                with lock:
+                    remaining = segment['end'] - segment['pos']
+                    if remaining <= 0:
+                        return
+                    chunk = chunk[:remaining]
+                    offset = segment['pos']
+                    segment['pos'] += len(chunk)
+                f.seek(offset)
+                f.write(chunk)
+                with lock:
+                    segment['done'] = offset + len(chunk)
+                written += len(chunk)
+            
+            if written == 0:
+                raise Exception("Segment download stalled")
+        finally:
+            response.close()
+
+    def load_part_state(self, state_path):
+        """Load the sidecar describing a partial download"""
+        try:
+            if os.path.exists(state_path):
+                with open(state_path, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Failed to read partial download state: {e}")
+        return None
+
+    def save_part_state(self, state_path, state):
+        """Save the sidecar describing a partial download"""
+        try:
+            write_json_atomic(state_path, state)
+        except Exception as e:
+            print(f"Failed to save partial download state: {e}")
+
+    def remove_part_state(self, state_path):
+        """Remove a partial download sidecar"""
+        try:
+            if os.path.exists(state_path):
+                os.remove(state_path)
+        except OSError as e:
+            print(f"Failed to remove partial download state: {e}")
 
-    def handle_main_action(self):
-        """Handle the main action button - always launch for installed versions"""
-        version = self.selected_version.get()
-        if not version:
-            messagebox.showerror("Error", "Please select a version first")
-            return
+    def get_fallback_patterns(self):
+        """Get fallback URL patterns, the ones that worked before come first"""
+        mirrors = self.config_store.get_section('_download_mirrors', {})
+        last_pattern = mirrors.get('last')
+        successes = mirrors.get('successes', {})
         
-        # Always launch since we only show installed versions in sidebar
-        self.launch_game()
-
-    def download_version(self):
-        """Download selected Titanic version"""
-        version = self.selected_version.get()
-        if not version:
-            messagebox.showerror("Error", "Please select a version to download")
-            return
+        def rank(item):
+            index, pattern = item
+            return (pattern != last_pattern, -successes.get(pattern, 0), index)
         
-        # Start download in separate thread
-        thread = threading.Thread(target=self._download_version_thread, args=(version,))
-        thread.daemon = True
-        thread.start()
+        return [pattern for index, pattern in sorted(enumerate(FALLBACK_URL_PATTERNS), key=rank)]
 
-    def _download_version_thread(self, version):
-        """Download version in background thread"""
+    def remember_download_mirror(self, pattern):
+        """Record a fallback pattern that served a download so it is tried first next time"""
+        mirrors = self.config_store.get_section('_download_mirrors', {})
+        successes = dict(mirrors.get('successes', {}))
+        successes[pattern] = successes.get(pattern, 0) + 1
+        self.config_store.set_section('_download_mirrors', {'last': pattern, 'successes': successes})
+        self.save_config()
+
+    def probe_download_url(self, url):
+        """Check that a URL serves a downloadable file without pulling the body"""
+        return self.inspect_download_url(url) is not None
+
+    def inspect_download_url(self, url, quiet=False):
+        """HEAD a download URL, returns its latency and headers if it serves a file, otherwise None"""
         try:
-            self.log_to_console(f"Starting download for {version}...")
-            self.status_text.set(f"Downloading {version}...")
-            self.download_progress.set(0)
-            self.update()
-            
-            # Try scraped download URL first, then fallback patterns
-            download_url = None
-            response = None
-            
-            # Use scraped URL if available
-            if version in self.download_links:
-                download_url = self.download_links[version]
-                self.log_to_console(f"Trying download URL: {download_url}")
-                try:
-                    response = requests.get(download_url, stream=True, timeout=10)
-                    if response.status_code == 200:
-                        self.log_to_console(f"Using API URL for {version}")
-                        self.after(0, lambda: self.status_text.set(f"Using API URL for {version}"))
-                except Exception as e:
-                    self.log_to_console(f"API URL failed: {e}", "WARNING")
-                    download_url = None
-            
-            # If API URL failed, try fallback patterns
-            if not response or response.status_code != 200:
-                self.log_to_console("Trying fallback download URLs...")
-                possible_urls = [
-                    f"https://cdn.titanic.sh/clients/{version}.zip",
-                    f"https://osu.titanic.sh/releases/{version}.zip",
-                    f"https://osu.titanic.sh/download/{version}",
-                    f"https://osu.titanic.sh/files/{version}.zip",
-                    f"https://osu.titanic.sh/get/{version}.zip"
-                ]
-                
-                for url in possible_urls:
-                    try:
-                        self.log_to_console(f"Trying: {url}")
-                        response = requests.get(url, stream=True, timeout=10)
-                        if response.status_code == 200:
-                            download_url = url
-                            self.log_to_console(f"Found working URL: {url}")
-                            self.after(0, lambda: self.status_text.set(f"Using fallback URL for {version}"))
-                            break
-                    except Exception as e:
-                        self.log_to_console(f"URL failed: {url} - {e}", "WARNING")
-                        continue
-            
-            if not response or response.status_code != 200:
-                raise Exception("Could not find valid download URL")
-            
-            # Download path
-            download_path = os.path.join(self.versions_dir, f"{version}.zip")
-            extract_path = os.path.join(self.versions_dir, version)
-            
-            self.log_to_console(f"Downloading to: {download_path}")
-            
-            # Remove existing extraction directory if it exists
-            if os.path.exists(extract_path):
-                self.log_to_console(f"Removing existing directory: {extract_path}")
-                shutil.rmtree(extract_path)
-            
-            # Download file with better progress tracking
-            total_size = int(response.headers.get('content-length', 0))
-            downloaded = 0
-            last_progress_update = 0
-            
-            self.log_to_console(f"Total download size: {self.format_size(total_size)}")
+            start = time.time()
+            response = self.http.head(url, allow_redirects=True)
+            response.close()
             
-            with open(download_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
-                        downloaded += len(chunk)
-                        if total_size > 0:
-                            progress = (downloaded / total_size) * 100
-                            # Update progress bar less frequently to avoid UI lag
-                            current_time = downloaded
-                            if current_time - last_progress_update > 1024 * 1024:  # Update every 1MB
-                                self.download_progress.set(progress)
-                                self.after(0, lambda p=progress: self.status_text.set(f"Downloading {version}: {p:.1f}%"))
-                                last_progress_update = current_time
-                                self.update()
-            
-            # Final progress update
-            self.download_progress.set(100)
-            self.log_to_console("Download completed successfully", "SUCCESS")
-            
-            self.status_text.set(f"Extracting {version}...")
-            self.log_to_console(f"Extracting to: {extract_path}")
-            self.update()
+            # Some servers refuse HEAD, ask for a single byte instead
+            if response.status_code not in (200, 206, 404, 410):
+                response = self.http.get(url, headers={'Range': 'bytes=0-0'}, stream=True)
+                response.close()
             
-            # Extract archive
-            with zipfile.ZipFile(download_path, 'r') as zip_ref:
-                zip_ref.extractall(extract_path)
-            self.log_to_console("Extraction completed successfully", "SUCCESS")
+            if response.status_code not in (200, 206):
+                return None
             
-            # Clean up zip file
-            os.remove(download_path)
-            self.log_to_console(f"Cleaned up zip file: {download_path}")
+            # Error and captive portal pages come back as HTML
+            content_type = response.headers.get('content-type', '')
+            if 'text/html' in content_type.lower():
+                return None
             
-            self.status_text.set(f"Successfully installed {version}")
-            self.log_to_console(f"Successfully installed {version}", "SUCCESS")
-            self.download_progress.set(100)
+            content_length = response.headers.get('content-length')
+            if response.status_code == 206:
+                # Content-Range: bytes 0-0/total
+                content_length = response.headers.get('content-range', '').rpartition('/')[2]
+            return {
+                'url': url,
+                'latency': time.time() - start,
+                'content_length': int(content_length) if content_length and content_length.isdigit() else None,
+                'last_modified': response.headers.get('Last-Modified'),
+                'etag': response.headers.get('ETag')
+            }
+        except Exception as e:
+            if not quiet:
+                self.log_to_console(f"URL failed: {url} - {e}", "WARNING")
+            return None
+
+    def load_release_health(self):
+        """Load cached reachability of each release's download URLs"""
+        try:
+            if os.path.exists(self.release_health_file):
+                with open(self.release_health_file, 'r') as f:
+                    return json.load(f)
+        except Exception as e:
+            print(f"Failed to load release health: {e}")
+        return {}
+
+    def get_release_health(self, version):
+        """Return the cached health record for version if it is still within its TTL"""
+        record = self.release_health.get(version)
+        if record and time.time() - record.get('checked_at', 0) < RELEASE_HEALTH_TTL:
+            return record
+        return None
+
+    def start_catalog_enrichment(self):
+        """Check every release's download URLs in the background, unless a pass is already running"""
+        if self.enrichment_running:
+            return
+        self.enrichment_running = True
+        thread = threading.Thread(target=self._enrich_catalog_thread)
+        thread.daemon = True
+        thread.start()
+
+    def _enrich_catalog_thread(self):
+        """Check the download link of releases with stale health records, a bounded number per launch"""
+        try:
+            imported = set(self.config_store.imported_versions())
+            stale = [v for v in list(self.versions) if v not in imported and not self.get_release_health(v)]
+            if not stale:
+                return
+            # Never-checked releases first, then the longest unchecked, so capped passes rotate through the catalog
+            stale.sort(key=lambda v: (v in self.release_health, self.release_health.get(v, {}).get('checked_at', 0)))
+            # The rest are checked on later launches (or resolved normally when downloaded)
+            stale = stale[:ENRICH_MAX_RELEASES]
+            
+            self.log_to_console(f"Checking download links of {len(stale)} releases...")
+            results = {}
+            with ThreadPoolExecutor(max_workers=ENRICH_CONCURRENCY, thread_name_prefix="enrich") as executor:
+                futures = {executor.submit(self.check_release_links, version): version for version in stale}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+            
+            dead = []
+            now = time.time()
+            for version, working in results.items():
+                if working:
+                    # The working URL is tried first at download time
+                    record = dict(working, reachable=True, checked_at=now)
+                else:
+                    record = {'reachable': False, 'url': None, 'checked_at': now}
+                    dead.append(version)
+                self.release_health[version] = record
             
-            # Refresh UI with a delay to avoid canvas errors
-            self.after(1000, lambda: self.refresh_version_buttons())
-            self.after(1000, lambda: self.select_version(version))  # Update the display and button
+            try:
+                write_json_atomic(self.release_health_file, self.release_health)
+            except Exception as e:
+                print(f"Failed to save release health: {e}")
             
+            if dead:
+                self.log_to_console(f"{len(dead)} releases have no working download link: {', '.join(dead[:10])}", "WARNING")
+            self.log_to_console(f"Checked download links of {len(stale)} releases", "SUCCESS")
         except Exception as e:
-            error_msg = f"Failed to download {version}: {str(e)}"
-            self.log_to_console(error_msg, "ERROR")
-            messagebox.showerror("Error", error_msg)
-            self.status_text.set(f"Failed to download {version}")
-            self.download_progress.set(0)
+            self.log_to_console(f"Release link check failed: {e}", "WARNING")
+        finally:
+            self.enrichment_running = False
+
+    def check_release_links(self, version):
+        """Probe a release's API link; only if it fails, time every mirror pattern and keep the fastest that works"""
+        primary = self.download_links.get(version)
+        if primary:
+            result = self.inspect_download_url(primary, True)
+            if result:
+                return result
+        
+        working = []
+        for pattern in self.get_fallback_patterns():
+            url = pattern.format(version=version)
+            if url == primary:
+                continue
+            result = self.inspect_download_url(url, True)
+            if result:
+                working.append(result)
+        return min(working, key=lambda result: result['latency']) if working else None
+
+    def find_fallback_download_url(self, version):
+        """Probe all fallback URLs concurrently and return the first one that responds"""
+        patterns = self.get_fallback_patterns()
+        urls = {pattern.format(version=version): pattern for pattern in patterns}
+        
+        # Try the learned mirror on its own first, it usually wins outright
+        learned = self.config_store.get_section('_download_mirrors', {}).get('last')
+        if learned in patterns:
+            url = learned.format(version=version)
+            self.log_to_console(f"Trying preferred mirror: {url}")
+            if self.probe_download_url(url):
+                self.remember_download_mirror(learned)
+                return url
+            del urls[url]
+        
+        if not urls:
+            return None
+        
+        executor = ThreadPoolExecutor(max_workers=len(urls))
+        futures = {executor.submit(self.probe_download_url, url): url for url in urls}
+        winner = None
+        try:
+            for future in as_completed(futures):
+                if future.result():
+                    winner = futures[future]
+                    break
+        finally:
+            # Losing probes close their own responses when they finish
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=False)
+        
+        if winner:
+            self.remember_download_mirror(urls[winner])
+        return winner
 
     def is_windows(self):
         """Check if running on Windows (with test mode override)"""
@@ -1165,7 +4079,7 @@ class TitanicLauncher(ctk.CTk):
             display_name = config['custom_name']
             
             self.log_to_console(f"Launching {display_name}...")
-            self.status_text.set(f"Launching {display_name}...")
+            self.set_status(f"Launching {display_name}...")
             self.launch_btn.configure(state="disabled", text="Launching...")
             self.update()
             
@@ -1288,7 +4202,7 @@ class TitanicLauncher(ctk.CTk):
                     self.log_to_console(f"Failed to start process: {e}", "ERROR")
                     raise e
             
-            self.status_text.set(f"Launched {display_name}")
+            self.set_status(f"Launched {display_name}")
             self.log_to_console(f"Successfully launched {display_name}", "SUCCESS")
             
             # Re-enable button after a delay
@@ -1298,7 +4212,7 @@ class TitanicLauncher(ctk.CTk):
             error_msg = f"Failed to launch {version}: {str(e)}"
             self.log_to_console(error_msg, "ERROR")
             messagebox.showerror("Error", error_msg)
-            self.status_text.set(f"Failed to launch {version}")
+            self.set_status(f"Failed to launch {version}")
             self.launch_btn.configure(state="normal", text="Start osu!", fg_color=self.accent_color.get(), text_color=self.button_text_color.get())
 
     def delete_version(self):
@@ -1317,7 +4231,9 @@ class TitanicLauncher(ctk.CTk):
         if messagebox.askyesno("Confirm Delete", f"Are you sure you want to delete {version}?"):
             try:
                 shutil.rmtree(version_path)
-                self.status_text.set(f"Deleted {version}")
+                self.verifier.remove(version)
+                threading.Thread(target=self.object_store.prune, daemon=True).start()
+                self.set_status(f"Deleted {version}")
                 self.refresh_version_buttons()
                 
                 # Clear selection if deleted version was selected
@@ -1342,7 +4258,7 @@ class TitanicLauncher(ctk.CTk):
                 
             except Exception as e:
                 messagebox.showerror("Error", f"Failed to delete {version}: {str(e)}")
-                self.status_text.set(f"Failed to delete {version}")
+                self.set_status(f"Failed to delete {version}")
 
     def open_versions_folder(self):
         """Open the versions folder in the file manager"""
@@ -1379,14 +4295,48 @@ class TitanicLauncher(ctk.CTk):
 
     def open_download_dialog(self):
         """Open download dialog showing available clients to download"""
-        # Create download window
         # Set appearance mode for the popup
         ctk.set_appearance_mode(self.appearance_mode.get())
         
+        # The dialog is built once and hidden on close, reopening only refreshes its rows
+        if self.download_dialog is None or not self.download_dialog.winfo_exists():
+            self._build_download_dialog()
+        else:
+            self.download_dialog.deiconify()
+            self.download_dialog.lift()
+        download_window = self.download_dialog
+        self.refresh_download_dialog(reset=True)
+        
+        # Set grab after window is fully configured
+        def set_grab_safely():
+            try:
+                # Release any existing grabs first
+                current_focus = self.focus_get()
+                if current_focus and hasattr(current_focus, 'grab_release'):
+                    try:
+                        current_focus.grab_release()
+                    except:
+                        pass
+                
+                # Set new grab
+                download_window.grab_set()
+                download_window.focus_set()
+            except Exception as e:
+                print(f"Grab failed: {e}")
+        
+        download_window.after(100, set_grab_safely)
+        
+        # Apply styling to popup
+        self.after(150, lambda: self.apply_popup_styling(download_window))
+
+    def _build_download_dialog(self):
+        """Create the download dialog with a small pool of client cards that are recycled while scrolling"""
         download_window = ctk.CTkToplevel(self)
         download_window.title("Download Clients")
         download_window.geometry("800x600")
         download_window.transient(self)
+        download_window.protocol("WM_DELETE_WINDOW", self.hide_download_dialog)
+        self.download_dialog = download_window
         
         # Main frame
         main_frame = ctk.CTkFrame(download_window)
@@ -1421,88 +4371,259 @@ class TitanicLauncher(ctk.CTk):
         )
         import_folder_btn.grid(row=0, column=2, sticky="e", padx=10, pady=10)
         
-        # Scrollable frame for client list
-        scrollable_frame = ctk.CTkScrollableFrame(main_frame, height=400)
-        scrollable_frame.pack(fill="both", expand=True, pady=(0, 20))
-        scrollable_frame.grid_columnconfigure(0, weight=1)
-        scrollable_frame.grid_columnconfigure(1, weight=1)
-        scrollable_frame.grid_columnconfigure(2, weight=1)
-        
-        # Add available clients (not installed)
-        row = 0
-        for version in self.versions:
-            version_path = os.path.join(self.versions_dir, version)
-            if not (os.path.exists(version_path) and os.path.exists(os.path.join(version_path, "osu!.exe"))):
-                # Get version info
-                config = self.get_version_config(version)
-                display_name = config['custom_name']
-                description = self.version_descriptions.get(version, "No description available")
-                image_url = self.version_images.get(version)
-                
-                # Create client card
-                client_frame = ctk.CTkFrame(scrollable_frame)
-                client_frame.grid(row=row, column=0, columnspan=3, sticky="ew", pady=5, padx=5)
-                client_frame.grid_columnconfigure(1, weight=1)
-                
-                # Version name - make it clickable
-                name_label = ctk.CTkLabel(
-                    client_frame, 
-                    text=display_name, 
-                    font=ctk.CTkFont(size=16, weight="bold"),
-                    text_color=("#1B5E20", "#4CAF50"),
-                    cursor="hand2"
-                )
-                name_label.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
-                name_label.bind("<Button-1>", lambda e, v=version: self.show_client_preview(v))
-                
-                # Download button
-                download_btn = ctk.CTkButton(
-                    client_frame,
-                    text="Download",
-                    fg_color="#1bd964",
-                    hover_color="#15a34a",
-                    text_color="black",
-                    width=100,
-                    command=lambda v=version, w=download_window: self.download_from_dialog(v, w)
-                )
-                download_btn.grid(row=0, column=2, sticky="e", padx=10, pady=(10, 5))
-                
-                # Description
-                desc_label = ctk.CTkLabel(client_frame, text=description, font=ctk.CTkFont(size=12), text_color="gray")
-                desc_label.grid(row=1, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 10))
-                
-                row += 1
+        # Client list: only as many cards as fit are created, the scrollbar moves the window over the catalog
+        list_frame = ctk.CTkFrame(main_frame)
+        list_frame.pack(fill="both", expand=True, pady=(0, 20))
+        list_frame.grid_columnconfigure(0, weight=1)
+        list_frame.grid_rowconfigure(0, weight=1)
+        
+        rows_frame = ctk.CTkFrame(list_frame, fg_color="transparent", height=400)
+        rows_frame.grid(row=0, column=0, sticky="nsew")
+        rows_frame.grid_propagate(False)
+        rows_frame.grid_columnconfigure(0, weight=1)
+        rows_frame.bind("<Configure>", self._resize_download_dialog)
+        self._bind_download_dialog_wheel(rows_frame)
+        
+        scrollbar = ctk.CTkScrollbar(list_frame, command=self._scroll_download_dialog)
+        scrollbar.grid(row=0, column=1, sticky="ns")
+        
+        empty_label = ctk.CTkLabel(rows_frame, text="All available clients are installed", text_color="gray")
+        
+        self.download_dialog_state = {
+            'rows_frame': rows_frame,
+            'scrollbar': scrollbar,
+            'empty_label': empty_label,
+            'slots': [],
+            'versions': [],
+            'top': 0,
+        }
+        for _ in range(DOWNLOAD_DIALOG_MIN_ROWS):
+            self._create_download_slot()
         
         # Close button
-        close_btn = ctk.CTkButton(main_frame, text="Close", command=download_window.destroy, fg_color="#6c757d")
+        close_btn = ctk.CTkButton(main_frame, text="Close", command=self.hide_download_dialog, fg_color="#6c757d")
         close_btn.pack(pady=(10, 0))
+
+    def _create_download_slot(self):
+        """Add one recyclable client card to the download dialog"""
+        state = self.download_dialog_state
+        slot = {'version': None, 'shown': None}
+        
+        # Create client card, fixed height so every row takes the same space
+        client_frame = ctk.CTkFrame(state['rows_frame'], height=DOWNLOAD_DIALOG_ROW_HEIGHT)
+        client_frame.grid_propagate(False)
+        client_frame.grid_columnconfigure(1, weight=1)
+        
+        # Version name - make it clickable
+        name_label = ctk.CTkLabel(
+            client_frame,
+            text="",
+            font=ctk.CTkFont(size=16, weight="bold"),
+            text_color=("#1B5E20", "#4CAF50"),
+            cursor="hand2"
+        )
+        name_label.grid(row=0, column=0, sticky="w", padx=10, pady=(10, 5))
+        name_label.bind("<Button-1>", lambda e: slot['version'] and self.show_client_preview(slot['version']))
+        
+        # Flag releases whose links were all dead at the last check
+        health_label = ctk.CTkLabel(
+            client_frame,
+            text="⚠ Download unavailable",
+            font=ctk.CTkFont(size=12, weight="bold"),
+            text_color="#dc3545"
+        )
+        health_label.grid(row=0, column=1, sticky="e", padx=10, pady=(10, 5))
         
-        # Set grab after window is fully configured
-        def set_grab_safely():
+        # Download button
+        download_btn = ctk.CTkButton(
+            client_frame,
+            text="Download",
+            fg_color="#1bd964",
+            hover_color="#15a34a",
+            text_color="black",
+            width=100,
+            command=lambda: slot['version'] and self.download_from_dialog(slot['version'])
+        )
+        download_btn.grid(row=0, column=2, sticky="e", padx=10, pady=(10, 5))
+        
+        # Description
+        desc_label = ctk.CTkLabel(client_frame, text="", font=ctk.CTkFont(size=12), text_color="gray", anchor="w", justify="left")
+        desc_label.grid(row=1, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 5))
+        
+        # Archive size, read from the cache or inspected in the background
+        size_label = ctk.CTkLabel(client_frame, text="", font=ctk.CTkFont(size=11), text_color="gray")
+        size_label.grid(row=2, column=0, columnspan=3, sticky="w", padx=10, pady=(0, 10))
+        
+        slot.update(frame=client_frame, name=name_label, health=health_label, desc=desc_label, size=size_label)
+        for widget in (client_frame, name_label, health_label, download_btn, desc_label, size_label):
+            self._bind_download_dialog_wheel(widget)
+        state['slots'].append(slot)
+        return slot
+
+    def _bind_download_dialog_wheel(self, widget):
+        """Scroll the download dialog's client list with the mouse wheel over widget"""
+        widget.bind("<MouseWheel>", self._on_download_dialog_wheel)
+        widget.bind("<Button-4>", self._on_download_dialog_wheel)  # Linux scroll up
+        widget.bind("<Button-5>", self._on_download_dialog_wheel)  # Linux scroll down
+
+    def _on_download_dialog_wheel(self, event):
+        """Handle mouse wheel scrolling for the download dialog"""
+        if sys.platform == "win32" or sys.platform == "darwin":
+            delta = -1 if event.delta > 0 else 1
+        else:  # Linux
+            delta = -1 if event.num == 4 else 1
+        self._scroll_download_dialog("scroll", delta, "units")
+
+    def _scroll_download_dialog(self, *args):
+        """Scrollbar command: move the first visible row and re-render the recycled cards"""
+        state = self.download_dialog_state
+        if args[0] == "moveto":
+            state['top'] = int(round(float(args[1]) * len(state['versions'])))
+        elif args[0] == "scroll":
+            step = len(state['slots']) if args[2] == "pages" else 1
+            state['top'] += int(args[1]) * step
+        self.render_download_dialog()
+
+    def _resize_download_dialog(self, event):
+        """Grow or shrink the card pool to the number of rows that fit the list"""
+        state = self.download_dialog_state
+        row_height = state['slots'][0]['frame'].winfo_reqheight() + 10  # Card plus its vertical padding
+        wanted = max(DOWNLOAD_DIALOG_MIN_ROWS, event.height // max(row_height, 1))
+        if wanted == len(state['slots']):
+            return
+        while len(state['slots']) < wanted:
+            self._apply_styling_to_widgets(self._create_download_slot()['frame'])
+        while len(state['slots']) > wanted:
+            state['slots'].pop()['frame'].destroy()
+        self.render_download_dialog()
+
+    def refresh_download_dialog(self, reset=False):
+        """Recompute the not-installed releases from the in-memory installed set and redraw the dialog"""
+        if self.download_dialog is None or not self.download_dialog.winfo_exists():
+            return
+        state = self.download_dialog_state
+        state['versions'] = [v for v in self.versions if v not in self.installed_versions]
+        if reset:
+            state['top'] = 0
+        self.render_download_dialog()
+
+    def render_download_dialog(self):
+        """Bind the visible slice of releases to the pooled cards, touching only cards whose content changed"""
+        state = self.download_dialog_state
+        versions = state['versions']
+        slots = state['slots']
+        state['top'] = max(0, min(state['top'], len(versions) - len(slots)))
+        top = state['top']
+        
+        for i, slot in enumerate(slots):
+            index = top + i
+            if index >= len(versions):
+                if slot['version'] is not None:
+                    slot['frame'].grid_remove()
+                    slot['version'] = slot['shown'] = None
+                continue
+            
+            version = versions[index]
+            description = self.version_descriptions.get(version) or "No description available"
+            health = self.get_release_health(version)
+            shown = (
+                self.get_version_config(version)['custom_name'],
+                description.splitlines()[0] if description.strip() else description,
+                self.release_size_text(version),
+                bool(health and not health.get('reachable')),
+            )
+            if slot['version'] is None:
+                slot['frame'].grid(row=i, column=0, sticky="ew", pady=5, padx=5)
+            slot['version'] = version
+            if shown == slot['shown']:
+                continue
+            
+            previous = slot['shown'] or (None, None, None, None)
+            if shown[0] != previous[0]:
+                slot['name'].configure(text=shown[0])
+            if shown[1] != previous[1]:
+                slot['desc'].configure(text=shown[1])
+            if shown[2] != previous[2]:
+                slot['size'].configure(text=shown[2])
+            if shown[3] != previous[3]:
+                if shown[3]:
+                    slot['health'].grid()
+                else:
+                    slot['health'].grid_remove()
+            slot['shown'] = shown
+        
+        if versions:
+            state['empty_label'].grid_remove()
+            state['scrollbar'].set(top / len(versions), min(1.0, (top + len(slots)) / len(versions)))
+        else:
+            state['empty_label'].grid(row=0, column=0, pady=20)
+            state['scrollbar'].set(0.0, 1.0)
+
+    def hide_download_dialog(self):
+        """Hide the download dialog, keeping it for the next opening"""
+        if self.download_dialog is None or not self.download_dialog.winfo_exists():
+            return
+        try:
+            self.download_dialog.grab_release()
+        except Exception:
+            pass
+        self.download_dialog.withdraw()
+
+    def release_size_text(self, version):
+        """Archive size line for a release, inspecting the archive off the UI thread the first time it is needed"""
+        meta = self.release_meta.get(version)
+        if meta and meta.get('url') == self.download_links.get(version, meta.get('url')):
+            return self.describe_release_meta(meta)
+        if version in self.release_size_texts:
+            return self.release_size_texts[version]
+        
+        def task():
             try:
-                # Release any existing grabs first
-                current_focus = self.focus_get()
-                if current_focus and hasattr(current_focus, 'grab_release'):
-                    try:
-                        current_focus.grab_release()
-                    except:
-                        pass
-                
-                # Set new grab
-                download_window.grab_set()
-                download_window.focus_set()
-            except Exception as e:
-                print(f"Grab failed: {e}")
+                text = self.describe_release_meta(self.get_release_meta(version))
+            except Exception:
+                text = "Size unknown"
+            self.release_size_texts[version] = text
+            self.ui.set_latest('download_dialog', self.render_download_dialog)
+        
+        self.release_size_texts[version] = "Checking size..."
+        self.inspect_pool.submit(task)
+        return "Checking size..."
+
+    def _load_preview_archive_info(self, version, size_label, files_text):
+        """Inspect a release archive for the preview window (runs on the inspect pool)"""
+        try:
+            # Browsing must not probe mirrors or skew the learned mirror, only use links already known
+            url = self.known_download_url(version)
+            if not url:
+                raise Exception("no known download link yet, it is resolved when the release is downloaded")
+            meta, members = self.inspect_remote_archive(version, url)
+            summary = self.describe_release_meta(meta)
+            if members is None:
+                listing = "File list unavailable (the server does not support partial downloads)"
+            else:
+                files = sorted((m for m in members if not m['name'].endswith('/')), key=lambda m: m['size'], reverse=True)
+                listing = "\n".join(f"{self.format_size(m['size']):>10}  {m['name']}" for m in files[:200])
+                if len(files) > 200:
+                    listing += f"\n... and {len(files) - 200} more"
+        except Exception as e:
+            summary = "Size unknown"
+            listing = f"Could not inspect archive: {e}"
         
-        download_window.after(100, set_grab_safely)
+        def apply():
+            if not size_label.winfo_exists():
+                return
+            size_label.configure(text=summary)
+            files_text.configure(state="normal")
+            files_text.delete("0.0", "end")
+            files_text.insert("0.0", listing)
+            files_text.configure(state="disabled")
         
-        # Apply styling to popup
-        self.after(150, lambda: self.apply_popup_styling(download_window))
+        self.ui.call(apply)
 
-    def download_from_dialog(self, version, window):
+    def download_from_dialog(self, version):
         """Download a version from the download dialog"""
-        # Close the dialog first
-        window.destroy()
+        # Hide the dialog first
+        self.hide_download_dialog()
         
         # Start download
         self.selected_version.set(version)
@@ -1522,7 +4643,7 @@ class TitanicLauncher(ctk.CTk):
         # Create preview window
         preview_window = ctk.CTkToplevel(self)
         preview_window.title(f"Preview - {display_name}")
-        preview_window.geometry("600x500")
+        preview_window.geometry("600x650")
         preview_window.transient(self)
         
         # Main frame
@@ -1540,6 +4661,20 @@ class TitanicLauncher(ctk.CTk):
         image_label = ctk.CTkLabel(image_frame, text="Loading preview...", font=ctk.CTkFont(size=14), corner_radius=8)
         image_label.pack(pady=10, padx=10)
         
+        # Archive size and contents
+        archive_frame = ctk.CTkFrame(main_frame)
+        archive_frame.pack(fill="x", pady=(10, 0), padx=20)
+        
+        size_label = ctk.CTkLabel(archive_frame, text="Checking size...", font=ctk.CTkFont(size=12, weight="bold"))
+        size_label.pack(anchor="w", padx=10, pady=(5, 0))
+        
+        files_text = ctk.CTkTextbox(archive_frame, height=90, font=ctk.CTkFont(size=11))
+        files_text.pack(fill="x", padx=10, pady=(5, 10))
+        files_text.insert("0.0", "Loading file list...")
+        files_text.configure(state="disabled")
+        
+        self.inspect_pool.submit(self._load_preview_archive_info, version, size_label, files_text)
+        
         # Description
         desc_frame = ctk.CTkFrame(main_frame)
         desc_frame.pack(fill="both", expand=True, pady=(10, 20), padx=20)
@@ -1608,17 +4743,9 @@ class TitanicLauncher(ctk.CTk):
         """Load preview image for preview window"""
         try:
             # Add proper headers to mimic browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Referer': 'https://osu.titanic.sh/download/',
-                'Accept': 'image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Upgrade-Insecure-Requests': '1'
-            }
+            headers = dict(IMAGE_REQUEST_HEADERS, Referer='https://osu.titanic.sh/download/')
             
-            response = requests.get(image_url, headers=headers, timeout=10)
+            response = self.http.get(image_url, headers=headers)
             if response.status_code == 200:
                 # Load image from response
                 image_data = io.BytesIO(response.content)
@@ -1648,12 +4775,12 @@ class TitanicLauncher(ctk.CTk):
                 ctk_image = ctk.CTkImage(light_image=pil_image, dark_image=pil_image, size=(target_width, target_height))
                 
                 # Update UI in main thread
-                self.after(0, lambda: image_label.configure(image=ctk_image, text=""))
+                self.ui.call(lambda: image_label.configure(image=ctk_image, text=""))
             else:
-                self.after(0, lambda: image_label.configure(text="Preview image unavailable", image=""))
+                self.ui.call(lambda: image_label.configure(text="Preview image unavailable", image=""))
         except Exception as e:
             print(f"Failed to load preview image: {e}")
-            self.after(0, lambda: image_label.configure(text="Failed to load preview image", image=""))
+            self.ui.call(lambda: image_label.configure(text="Failed to load preview image", image=""))
 
     def download_from_preview(self, version, window):
         """Download a version from the preview window"""
@@ -1836,6 +4963,160 @@ class TitanicLauncher(ctk.CTk):
         )
         apply_size_btn.pack(side="left", padx=10)
         
+        # Downloads section
+        downloads_frame = ctk.CTkFrame(scrollable_frame)
+        downloads_frame.pack(fill="x", pady=(0, 20))
+        
+        ctk.CTkLabel(downloads_frame, text="Downloads", font=ctk.CTkFont(size=18, weight="bold")).pack(anchor="w", padx=10, pady=(10, 5))
+        
+        # Parallel connections per download
+        segments_frame = ctk.CTkFrame(downloads_frame)
+        segments_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(segments_frame, text="Connections per Download:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        segments_slider = ctk.CTkSlider(
+            segments_frame,
+            from_=1,
+            to=8,
+            number_of_steps=7,
+            variable=self.download_segments,
+            command=lambda value: self.save_options_config()
+        )
+        segments_slider.pack(side="left", padx=10, fill="x", expand=True)
+        
+        segments_label = ctk.CTkLabel(segments_frame, textvariable=self.download_segments, width=30)
+        segments_label.pack(side="left", padx=5)
+        
+        # Queue concurrency
+        concurrent_frame = ctk.CTkFrame(downloads_frame)
+        concurrent_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(concurrent_frame, text="Simultaneous Downloads:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        concurrent_slider = ctk.CTkSlider(
+            concurrent_frame,
+            from_=1,
+            to=5,
+            number_of_steps=4,
+            variable=self.max_concurrent_downloads,
+            command=lambda value: self.update_max_concurrent_downloads(int(value))
+        )
+        concurrent_slider.pack(side="left", padx=10, fill="x", expand=True)
+        
+        concurrent_label = ctk.CTkLabel(concurrent_frame, textvariable=self.max_concurrent_downloads, width=30)
+        concurrent_label.pack(side="left", padx=5)
+        
+        # Streaming install
+        stream_frame = ctk.CTkFrame(downloads_frame)
+        stream_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(stream_frame, text="Install Mode:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        stream_switch = ctk.CTkSwitch(
+            stream_frame,
+            text="Extract while downloading (interrupted downloads still resume)",
+            variable=self.stream_install,
+            onvalue=True,
+            offvalue=False,
+            command=lambda: self.save_options_config()
+        )
+        stream_switch.pack(side="left", padx=10)
+        
+        # Delta installs
+        delta_frame = ctk.CTkFrame(downloads_frame)
+        delta_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(delta_frame, text="Updates:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        delta_switch = ctk.CTkSwitch(
+            delta_frame,
+            text="Only download files that changed since the closest installed version",
+            variable=self.delta_updates,
+            onvalue=True,
+            offvalue=False,
+            command=lambda: self.save_options_config()
+        )
+        delta_switch.pack(side="left", padx=10)
+        
+        # Shared storage between installs
+        dedup_frame = ctk.CTkFrame(downloads_frame)
+        dedup_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(dedup_frame, text="Storage:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        dedup_switch = ctk.CTkSwitch(
+            dedup_frame,
+            text="Share identical files between versions",
+            variable=self.dedup_installs,
+            onvalue=True,
+            offvalue=False,
+            command=lambda: self.save_options_config()
+        )
+        dedup_switch.pack(side="left", padx=10)
+        
+        dedup_btn = ctk.CTkButton(
+            dedup_frame,
+            text="Deduplicate Installed",
+            width=150,
+            fg_color="#17a2b8",
+            hover_color="#138496",
+            command=lambda: self.dedup_installed_versions(dedup_label)
+        )
+        dedup_btn.pack(side="right", padx=10)
+        
+        dedup_label = ctk.CTkLabel(downloads_frame, text="", text_color="gray")
+        dedup_label.pack(anchor="w", padx=20, pady=(0, 5))
+        self.update_dedup_report(dedup_label)
+        
+        # Archive cache
+        cache_frame = ctk.CTkFrame(downloads_frame)
+        cache_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(cache_frame, text="Archive Cache:", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        cache_switch = ctk.CTkSwitch(
+            cache_frame,
+            text="Keep archives for instant reinstalls",
+            variable=self.archive_cache_enabled,
+            onvalue=True,
+            offvalue=False,
+            command=lambda: self.save_options_config()
+        )
+        cache_switch.pack(side="left", padx=10)
+        
+        cache_clear_btn = ctk.CTkButton(
+            cache_frame,
+            text="Clear Cache",
+            width=110,
+            fg_color="#dc3545",
+            hover_color="#c82333",
+            command=lambda: self.clear_archive_cache(cache_usage_label)
+        )
+        cache_clear_btn.pack(side="right", padx=10)
+        
+        cache_size_frame = ctk.CTkFrame(downloads_frame)
+        cache_size_frame.pack(fill="x", padx=10, pady=5)
+        
+        ctk.CTkLabel(cache_size_frame, text="Cache Size (GB):", font=ctk.CTkFont(weight="bold")).pack(side="left", padx=10)
+        
+        cache_slider = ctk.CTkSlider(
+            cache_size_frame,
+            from_=1,
+            to=50,
+            number_of_steps=49,
+            variable=self.archive_cache_gb,
+            command=lambda value: self.update_archive_cache_limit(int(value), cache_usage_label)
+        )
+        cache_slider.pack(side="left", padx=10, fill="x", expand=True)
+        
+        cache_size_label = ctk.CTkLabel(cache_size_frame, textvariable=self.archive_cache_gb, width=30)
+        cache_size_label.pack(side="left", padx=5)
+        
+        cache_usage_label = ctk.CTkLabel(downloads_frame, text="", text_color="gray")
+        cache_usage_label.pack(anchor="w", padx=20, pady=(0, 5))
+        self.update_archive_cache_report(cache_usage_label)
+        
         # Tools section
         tools_frame = ctk.CTkFrame(scrollable_frame)
         tools_frame.pack(fill="x", pady=(0, 20))
@@ -2058,7 +5339,7 @@ class TitanicLauncher(ctk.CTk):
             
             # Run the command
             self.log_to_console("Running audio fix: osu-wine –winetricks sound=alsa")
-            self.status_text.set("Running audio fix...")
+            self.set_status("Running audio fix...")
             
             # Run in a separate thread to avoid blocking UI
             def run_command():
@@ -2071,12 +5352,13 @@ class TitanicLauncher(ctk.CTk):
                     )
                     
                     # Update UI in main thread
-                    self.after(0, lambda: self._handle_audio_fix_result(result))
+                    self.ui.call(lambda: self._handle_audio_fix_result(result))
                     
                 except subprocess.TimeoutExpired:
-                    self.after(0, lambda: self._handle_audio_fix_timeout())
+                    self.ui.call(lambda: self._handle_audio_fix_timeout())
                 except Exception as e:
-                    self.after(0, lambda: self._handle_audio_fix_error(str(e)))
+                    error_msg = str(e)  # e is cleared when the except block ends, before the UI thread runs
+                    self.ui.call(lambda: self._handle_audio_fix_error(error_msg))
             
             threading.Thread(target=run_command, daemon=True).start()
             
@@ -2087,13 +5369,13 @@ class TitanicLauncher(ctk.CTk):
         """Handle the result of the audio fix command"""
         if result.returncode == 0:
             self.log_to_console("Audio fix completed successfully", "SUCCESS")
-            self.status_text.set("Audio fix completed successfully")
+            self.set_status("Audio fix completed successfully")
             messagebox.showinfo("Success", 
                 "Audio fix completed successfully!\n\n"
                 "Try launching the game again to see if the audio issues are resolved.")
         else:
             self.log_to_console(f"Audio fix failed: {result.stderr}", "ERROR")
-            self.status_text.set("Audio fix failed")
+            self.set_status("Audio fix failed")
             messagebox.showerror("Audio Fix Failed", 
                 f"The audio fix command failed.\n\n"
                 f"Error: {result.stderr}\n\n"
@@ -2102,7 +5384,7 @@ class TitanicLauncher(ctk.CTk):
     def _handle_audio_fix_timeout(self):
         """Handle timeout of the audio fix command"""
         self.log_to_console("Audio fix timed out", "ERROR")
-        self.status_text.set("Audio fix timed out")
+        self.set_status("Audio fix timed out")
         messagebox.showerror("Timeout", 
             "The audio fix command timed out after 60 seconds.\n\n"
             "Please try running it manually in the terminal:\n"
@@ -2111,7 +5393,7 @@ class TitanicLauncher(ctk.CTk):
     def _handle_audio_fix_error(self, error_msg):
         """Handle error in the audio fix command"""
         self.log_to_console(f"Audio fix error: {error_msg}", "ERROR")
-        self.status_text.set("Audio fix error")
+        self.set_status("Audio fix error")
         messagebox.showerror("Error", 
             f"An error occurred while running the audio fix:\n\n"
             f"{error_msg}")
@@ -2152,7 +5434,7 @@ class TitanicLauncher(ctk.CTk):
             
             # Run the program
             self.log_to_console(f"Running program with osu-wine: {file_path}")
-            self.status_text.set(f"Running {filename}...")
+            self.set_status(f"Running {filename}...")
             
             # Run in a separate thread to avoid blocking UI
             def run_command():
@@ -2165,12 +5447,13 @@ class TitanicLauncher(ctk.CTk):
                     )
                     
                     # Update UI in main thread
-                    self.after(0, lambda: self._handle_program_result(result, filename))
+                    self.ui.call(lambda: self._handle_program_result(result, filename))
                     
                 except subprocess.TimeoutExpired:
-                    self.after(0, lambda: self._handle_program_timeout(filename))
+                    self.ui.call(lambda: self._handle_program_timeout(filename))
                 except Exception as e:
-                    self.after(0, lambda: self._handle_program_error(str(e), filename))
+                    error_msg = str(e)
+                    self.ui.call(lambda: self._handle_program_error(error_msg, filename))
             
             threading.Thread(target=run_command, daemon=True).start()
             
@@ -2181,12 +5464,12 @@ class TitanicLauncher(ctk.CTk):
         """Handle the result of running a program"""
         if result.returncode == 0:
             self.log_to_console(f"Program '{filename}' completed successfully", "SUCCESS")
-            self.status_text.set(f"Program completed successfully")
+            self.set_status("Program completed successfully")
             messagebox.showinfo("Success", 
                 f"Program '{filename}' completed successfully!")
         else:
             self.log_to_console(f"Program '{filename}' failed: {result.stderr}", "ERROR")
-            self.status_text.set("Program failed")
+            self.set_status("Program failed")
             messagebox.showerror("Program Failed", 
                 f"The program '{filename}' failed to run.\n\n"
                 f"Error: {result.stderr}\n\n"
@@ -2195,7 +5478,7 @@ class TitanicLauncher(ctk.CTk):
     def _handle_program_timeout(self, filename):
         """Handle timeout of the program"""
         self.log_to_console(f"Program '{filename}' timed out", "ERROR")
-        self.status_text.set("Program timed out")
+        self.set_status("Program timed out")
         messagebox.showerror("Timeout", 
             f"The program '{filename}' timed out after 5 minutes.\n\n"
             f"The program may still be running in the background.")
@@ -2203,7 +5486,7 @@ class TitanicLauncher(ctk.CTk):
     def _handle_program_error(self, error_msg, filename):
         """Handle error in running the program"""
         self.log_to_console(f"Program '{filename}' error: {error_msg}", "ERROR")
-        self.status_text.set("Program error")
+        self.set_status("Program error")
         messagebox.showerror("Error", 
             f"An error occurred while running the program:\n\n"
             f"{error_msg}")
@@ -2251,14 +5534,14 @@ class TitanicLauncher(ctk.CTk):
         """Install osu-wine in background thread"""
         try:
             # Update UI to show installation in progress
-            self.after(0, lambda: self.status_text.set("Installing osu-wine..."))
+            self.set_status("Installing osu-wine...")
             
             # Create temporary directory for installation
             temp_dir = tempfile.mkdtemp()
             clone_path = os.path.join(temp_dir, "osu-winello")
             
             # Clone the repository
-            self.after(0, lambda: self.status_text.set("Cloning osu-winello repository..."))
+            self.set_status("Cloning osu-winello repository...")
             clone_result = subprocess.run([
                 "git", "clone", 
                 "https://github.com/NelloKudo/osu-winello.git",
@@ -2269,12 +5552,12 @@ class TitanicLauncher(ctk.CTk):
                 raise Exception(f"Failed to clone repository: {clone_result.stderr}")
             
             # Make script executable
-            self.after(0, lambda: self.status_text.set("Preparing installation script..."))
+            self.set_status("Preparing installation script...")
             script_path = os.path.join(clone_path, "osu-winello.sh")
             subprocess.run(["chmod", "+x", script_path], check=True)
             
             # Run installation script with proper environment
-            self.after(0, lambda: self.status_text.set("Running osu-wine installation..."))
+            self.set_status("Running osu-wine installation...")
             
             # Set up environment for proper PATH handling
             env = os.environ.copy()
@@ -2286,7 +5569,7 @@ class TitanicLauncher(ctk.CTk):
             
             if install_result.returncode != 0:
                 # Try alternative installation method
-                self.after(0, lambda: self.status_text.set("Trying alternative installation..."))
+                self.set_status("Trying alternative installation...")
                 
                 # Try manual installation to user bin directory
                 user_bin = os.path.expanduser("~/.local/bin")
@@ -2323,7 +5606,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
             shutil.rmtree(temp_dir, ignore_errors=True)
             
             # Update UI to show success
-            self.after(0, lambda: self.status_text.set("osu-wine installed successfully!"))
+            self.set_status("osu-wine installed successfully!")
             
             # Show success message with PATH instructions
             success_msg = ("osu-wine has been successfully installed!\n\n"
@@ -2333,14 +5616,14 @@ echo "export PATH=\"$PATH:{user_bin}\""
                           "3. Or run: export PATH=\"$PATH:~/.local/bin\"\n\n"
                           "You can now launch Titanic clients using the launcher.")
             
-            self.after(0, lambda: messagebox.showinfo("Installation Complete", success_msg))
+            self.ui.call(lambda: messagebox.showinfo("Installation Complete", success_msg))
             
             # Update button state
-            self.after(0, self.update_osuwine_button_state)
+            self.ui.call(self.update_osuwine_button_state)
             
         except subprocess.TimeoutExpired:
-            self.after(0, lambda: self.status_text.set("Installation timed out"))
-            self.after(0, lambda: messagebox.showerror(
+            self.set_status("Installation timed out")
+            self.ui.call(lambda: messagebox.showerror(
                 "Installation Failed", 
                 "Installation timed out. Please try again or install manually.\n\n"
                 "Manual installation:\n"
@@ -2348,15 +5631,15 @@ echo "export PATH=\"$PATH:{user_bin}\""
                 "2. Follow the installation instructions"
             ))
         except Exception as e:
-            self.after(0, lambda: self.status_text.set(f"Installation failed: {str(e)}"))
-            self.after(0, lambda: messagebox.showerror(
-                "Installation Failed", 
+            self.set_status(f"Installation failed: {str(e)}")
+            error_msg = (
                 f"Failed to install osu-wine:\n{str(e)}\n\n"
                 "Manual installation:\n"
                 "1. Visit: https://github.com/NelloKudo/osu-winello\n"
                 "2. Follow the installation instructions\n\n"
                 "After installation, restart the launcher."
-            ))
+            )
+            self.ui.call(lambda: messagebox.showerror("Installation Failed", error_msg))
         finally:
             # Clean up temporary directory
             try:
@@ -2385,56 +5668,53 @@ echo "export PATH=\"$PATH:{user_bin}\""
     def save_options_config(self):
         """Save options configuration"""
         try:
-            # Load existing config
-            config = {}
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-            
-            # Add options
-            config['options'] = {
+            # Update options in the shared store
+            self.config_store.set_section('options', {
                 'appearance_mode': self.appearance_mode.get(),
                 'accent_color': self.accent_color.get(),
                 'text_color': self.text_color.get(),
-                'button_text_color': self.button_text_color.get()
-            }
+                'button_text_color': self.button_text_color.get(),
+                'download_segments': self.download_segments.get(),
+                'max_concurrent_downloads': self.max_concurrent_downloads.get(),
+                'stream_install': self.stream_install.get(),
+                'dedup_installs': self.dedup_installs.get(),
+                'delta_updates': self.delta_updates.get(),
+                'archive_cache': self.archive_cache_enabled.get(),
+                'archive_cache_gb': self.archive_cache_gb.get()
+            })
             
             # Add auth data if logged in
             if self.auth_token:
-                config['auth'] = {
+                self.config_store.set_section('auth', {
                     'token': self.auth_token,
                     'user_data': self.user_data
-                }
+                })
             
             # Save config
-            with open(self.config_file, 'w') as f:
-                json.dump(config, f, indent=2)
+            self.config_store.save()
         except Exception as e:
             print(f"Failed to save options config: {e}")
 
     def load_auth_config(self):
         """Load authentication configuration and refresh user stats"""
         try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    
-                if 'auth' in config:
-                    self.auth_token = config['auth'].get('token')
-                    self.user_data = config['auth'].get('user_data', {})
-                    
-                    # Update display with cached data first
-                    self.update_user_display()
-                    
-                    # Refresh user data from API in background
-                    if self.auth_token:
-                        print("Refreshing user stats on startup...")
-                        self.log_to_console("Refreshing user stats...", "INFO")
-                        
-                        # Start refresh in background thread to avoid blocking UI
-                        thread = threading.Thread(target=self._refresh_user_data_thread)
-                        thread.daemon = True
-                        thread.start()
+            auth = self.config_store.auth()
+            if auth:
+                self.auth_token = auth.get('token')
+                self.user_data = auth.get('user_data', {})
+
+                # Update display with cached data first
+                self.update_user_display()
+
+                # Refresh user data from API in background
+                if self.auth_token:
+                    print("Refreshing user stats on startup...")
+                    self.log_to_console("Refreshing user stats...", "INFO")
+
+                    # Start refresh in background thread to avoid blocking UI
+                    thread = threading.Thread(target=self._refresh_user_data_thread)
+                    thread.daemon = True
+                    thread.start()
         except Exception as e:
             print(f"Failed to load auth config: {e}")
             self.log_to_console(f"Failed to load auth config: {e}", "ERROR")
@@ -2446,8 +5726,8 @@ echo "export PATH=\"$PATH:{user_bin}\""
             self.fetch_user_data()
             
             # Update UI in main thread
-            self.after(0, lambda: self.update_user_display())
-            self.after(0, lambda: self.save_options_config())
+            self.ui.call(lambda: self.update_user_display())
+            self.ui.call(lambda: self.save_options_config())
             
             if self.user_data.get('username'):
                 self.log_to_console(f"User stats refreshed for {self.user_data['username']}", "SUCCESS")
@@ -2564,10 +5844,9 @@ echo "export PATH=\"$PATH:{user_bin}\""
             }
             
             # Make login request
-            response = requests.post(
+            response = self.http.post(
                 "https://api.titanic.sh/account/login",
-                headers=headers,
-                timeout=10
+                headers=headers
             )
             
             if response.status_code == 200:
@@ -2578,10 +5857,10 @@ echo "export PATH=\"$PATH:{user_bin}\""
                 self.fetch_user_data()
                 
                 # Update UI
-                self.after(0, lambda: self.update_user_display())
-                self.after(0, lambda: self.save_options_config())
-                self.after(0, lambda: login_window.destroy())
-                self.after(0, lambda: messagebox.showinfo("Success", f"Logged in as {self.username.get()}!"))
+                self.ui.call(lambda: self.update_user_display())
+                self.ui.call(lambda: self.save_options_config())
+                self.ui.call(lambda: login_window.destroy())
+                self.ui.call(lambda: messagebox.showinfo("Success", f"Logged in as {self.username.get()}!"))
             else:
                 error_msg = "Login failed"
                 try:
@@ -2590,14 +5869,15 @@ echo "export PATH=\"$PATH:{user_bin}\""
                 except:
                     pass
                 
-                self.after(0, lambda: messagebox.showerror("Login Failed", error_msg))
+                self.ui.call(lambda: messagebox.showerror("Login Failed", error_msg))
                 
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Login Error", f"An error occurred: {str(e)}"))
+            error_msg = f"An error occurred: {str(e)}"
+            self.ui.call(lambda: messagebox.showerror("Login Error", error_msg))
         finally:
             # Re-enable buttons
-            self.after(0, lambda: login_window.children["!ctkframe"].children["!ctkframe"].children["!ctkbutton"].configure(state="normal"))
-            self.after(0, lambda: login_window.children["!ctkframe"].children["!ctkframe"].children["!ctkbutton2"].configure(state="normal"))
+            self.ui.call(lambda: login_window.children["!ctkframe"].children["!ctkframe"].children["!ctkbutton"].configure(state="normal"))
+            self.ui.call(lambda: login_window.children["!ctkframe"].children["!ctkframe"].children["!ctkbutton2"].configure(state="normal"))
 
     def fetch_user_data(self):
         """Fetch user data from API"""
@@ -2611,10 +5891,9 @@ echo "export PATH=\"$PATH:{user_bin}\""
             }
             
             # Get user profile
-            response = requests.get(
+            response = self.http.get(
                 "https://api.titanic.sh/account/profile",
-                headers=headers,
-                timeout=10
+                headers=headers
             )
             
             if response.status_code == 200:
@@ -2694,14 +5973,9 @@ echo "export PATH=\"$PATH:{user_bin}\""
         """Load user avatar image from URL"""
         try:
             # Add proper headers to mimic browser request
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36',
-                'Referer': 'https://osu.titanic.sh/',
-                'Accept': 'image/webp,image/apng,image/svg+xml,image/*,*/*;q=0.8',
-                'Accept-Language': 'en-US,en;q=0.9'
-            }
+            headers = dict(IMAGE_REQUEST_HEADERS, Referer='https://osu.titanic.sh/')
             
-            response = requests.get(avatar_url, headers=headers, timeout=10)
+            response = self.http.get(avatar_url, headers=headers)
             response.raise_for_status()
             
             # Load image
@@ -2713,7 +5987,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
             self.avatar_image = ctk.CTkImage(light_image=img, dark_image=img, size=(40, 40))
             
             # Update avatar display
-            self.after(0, self.update_avatar_display)
+            self.ui.call(self.update_avatar_display)
             
         except Exception as e:
             print(f"Failed to load avatar image: {e}")
@@ -2764,10 +6038,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
         """Load options configuration"""
         try:
             if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    config = json.load(f)
-                    
-                options = config.get('options', {})
+                options = self.config_store.options()
                 self.appearance_mode.set(options.get('appearance_mode', 'dark'))
                 accent = options.get('accent_color', '#F8A6BE')
                 # Set default text color based on mode
@@ -2777,6 +6048,15 @@ echo "export PATH=\"$PATH:{user_bin}\""
                 self.accent_color.set(accent)
                 self.text_color.set(text_color)
                 self.button_text_color.set(button_text_color)
+                self.download_segments.set(int(options.get('download_segments', 4)))
+                self.max_concurrent_downloads.set(int(options.get('max_concurrent_downloads', 2)))
+                self.download_queue.set_max_concurrent(self.max_concurrent_downloads.get())
+                self.stream_install.set(bool(options.get('stream_install', True)))
+                self.dedup_installs.set(bool(options.get('dedup_installs', False)))
+                self.delta_updates.set(bool(options.get('delta_updates', True)))
+                self.archive_cache_enabled.set(bool(options.get('archive_cache', False)))
+                self.archive_cache_gb.set(int(options.get('archive_cache_gb', 5)))
+                self.archive_cache.set_limit(self.archive_cache_gb.get() * 1024 ** 3)
                 
                 # Apply settings
                 ctk.set_appearance_mode(self.appearance_mode.get())
@@ -2816,14 +6096,37 @@ echo "export PATH=\"$PATH:{user_bin}\""
 
     def clear_console(self):
         """Clear the console output"""
+        with self.console_lock:
+            self.console_pending.clear()
+            self.console_dropped = 0
         self.console_text.configure(state="normal")
         self.console_text.delete("0.0", "end")
         self.console_text.insert("0.0", "Console cleared...\n")
         self.console_text.configure(state="disabled")
 
+    def set_status(self, text):
+        """Set the status line, from any thread (worker updates are coalesced)"""
+        if self.ui.on_main_thread():
+            self.ui.discard('status')
+            self.status_text.set(text)
+        else:
+            self.ui.set_latest('status', lambda: self.status_text.set(text))
+
+    def set_progress(self, value):
+        """Set download progress (0-100), from any thread (worker updates are coalesced)"""
+        def apply():
+            self.download_progress.set(value)
+            if hasattr(self, 'progress_bar'):
+                self.progress_bar.set(value / 100)
+        
+        if self.ui.on_main_thread():
+            self.ui.discard('progress')
+            apply()
+        else:
+            self.ui.set_latest('progress', apply)
+
     def log_to_console(self, message, level="INFO"):
-        """Log a message to the console"""
-        import datetime
+        """Log a message to the console and the on-disk log"""
         timestamp = datetime.datetime.now().strftime("%H:%M:%S")
         
         # Check if this is a game message
@@ -2832,34 +6135,65 @@ echo "export PATH=\"$PATH:{user_bin}\""
         # Color coding for different levels
         if level == "ERROR":
             prefix = f"[{timestamp}] [ERROR] "
+            tag = "ERROR"
         elif level == "WARNING":
             prefix = f"[{timestamp}] [WARN]  "
+            tag = "WARN"
         elif level == "SUCCESS":
             prefix = f"[{timestamp}] [SUCCESS] "
+            tag = "SUCCESS"
         elif is_game_message:
             prefix = f"[{timestamp}] [GAME]  "
+            tag = "GAME"
         else:
             prefix = f"[{timestamp}] [INFO]  "
+            tag = "INFO"
         
         full_message = f"{prefix}{message}\n"
-        
-        # Update console in main thread
-        self.after(0, lambda: self._update_console(full_message, is_game_message))
+        self.log_writer.write(message[len("[GAME]"):].lstrip() if is_game_message else message, tag)
+        
+        # Queue the line, the UI thread flushes everything pending once per frame
+        with self.console_lock:
+            if len(self.console_pending) == self.console_pending.maxlen:
+                self.console_dropped += 1
+            self.console_pending.append((full_message, tag))
+        self.ui.set_latest('console', self._update_console)
 
-    def _update_console(self, message, is_game_message=False):
-        """Update console text widget (must be called from main thread)"""
+    def _update_console(self):
+        """Flush pending lines into the console widget (must be called from main thread, once per frame)"""
+        with self.console_lock:
+            entries = list(self.console_pending)
+            self.console_pending.clear()
+            dropped = self.console_dropped
+            self.console_dropped = 0
+        if not entries:
+            return
+        
         try:
+            # Only follow new output if the user has not scrolled up
+            at_bottom = self.console_text.yview()[1] >= 0.999
             self.console_text.configure(state="normal")
             
-            # For game messages, we'll just insert them normally since CTkTextbox doesn't support tags
-            # The [GAME] prefix will help distinguish them
-            self.console_text.insert("end", message)
+            if dropped:
+                self.console_text.insert("end", f"... {dropped} lines skipped ...\n", "WARN")
+            for text, tag in entries:
+                self.console_text.insert("end", text, tag)
             
-            self.console_text.see("end")  # Auto-scroll to bottom
+            # Trim the oldest lines beyond the cap
+            line_count = int(self.console_text.index("end-1c").split('.')[0])
+            if line_count > CONSOLE_MAX_LINES:
+                self.console_text.delete("1.0", f"{line_count - CONSOLE_MAX_LINES + 1}.0")
+            
+            if at_bottom:
+                self.console_text.see("end")
             self.console_text.configure(state="disabled")
         except Exception as e:
             print(f"Failed to update console: {e}")
 
+    def apply_console_filter(self, level):
+        """Show or hide one level's lines by eliding its tag"""
+        self.console_text.tag_config(level, elide=not self.console_level_filters[level].get())
+
     def toggle_details_section(self):
         """Toggle collapse state of version details section"""
         if self.details_collapsed:
@@ -2910,34 +6244,17 @@ echo "export PATH=\"$PATH:{user_bin}\""
         else:
             return f"{size_bytes / (1024 * 1024 * 1024):.1f} GB"
 
-    def load_config(self):
-        """Load version configurations from file"""
-        try:
-            if os.path.exists(self.config_file):
-                with open(self.config_file, 'r') as f:
-                    self.version_configs = json.load(f)
-        except Exception as e:
-            print(f"Failed to load config: {e}")
-            self.version_configs = {}
-
     def save_config(self):
         """Save version configurations to file"""
-        try:
-            with open(self.config_file, 'w') as f:
-                json.dump(self.version_configs, f, indent=2)
-        except Exception as e:
-            print(f"Failed to save config: {e}")
+        self.config_store.save()
 
     def get_version_config(self, version):
         """Get configuration for a specific version"""
-        return self.version_configs.get(version, {
-            'custom_name': version,
-            'launch_args': ''
-        })
+        return self.config_store.get_version(version)
 
     def update_version_config(self, version, config):
         """Update configuration for a specific version"""
-        self.version_configs[version] = config
+        self.config_store.set_version(version, config)
         self.save_config()
 
     def import_from_zip(self):
@@ -3018,32 +6335,32 @@ echo "export PATH=\"$PATH:{user_bin}\""
         """Import client from zip file in background thread"""
         try:
             self.log_to_console(f"Importing client from {file_path}...")
-            self.status_text.set("Importing client...")
+            self.set_status("Importing client...")
             
             # Create destination directory
             dest_path = os.path.join(self.versions_dir, version_name)
             if os.path.exists(dest_path):
-                self.after(0, lambda: messagebox.showerror("Error", f"Version {version_name} already exists"))
+                self.ui.call(lambda: messagebox.showerror("Error", f"Version {version_name} already exists"))
                 return
             
-            os.makedirs(dest_path, exist_ok=True)
+            # Extract into staging so a failed import leaves nothing behind
+            staging_path = self.prepare_staging(version_name)
             
             # Extract zip file
-            with zipfile.ZipFile(file_path, 'r') as zip_ref:
-                zip_ref.extractall(dest_path)
+            self.extract_archive(version_name, file_path, staging_path)
             
             # Check if osu!.exe exists in extracted files
-            osu_exe_path = os.path.join(dest_path, "osu!.exe")
+            osu_exe_path = os.path.join(staging_path, "osu!.exe")
             if not os.path.exists(osu_exe_path):
                 # Look for osu!.exe in subdirectories
                 found = False
-                for root, dirs, files in os.walk(dest_path):
+                for root, dirs, files in os.walk(staging_path):
                     if "osu!.exe" in files:
-                        # Move everything from this subdirectory to dest_path
+                        # Move everything from this subdirectory to the staging root
                         sub_dir = root
                         for item in os.listdir(sub_dir):
                             s = os.path.join(sub_dir, item)
-                            d = os.path.join(dest_path, item)
+                            d = os.path.join(staging_path, item)
                             if os.path.isfile(s):
                                 shutil.move(s, d)
                             else:
@@ -3053,41 +6370,45 @@ echo "export PATH=\"$PATH:{user_bin}\""
                         break
                 
                 if not found:
-                    self.after(0, lambda: messagebox.showerror("Error", "Imported file does not contain osu!.exe"))
-                    shutil.rmtree(dest_path)
+                    self.ui.call(lambda: messagebox.showerror("Error", "Imported file does not contain osu!.exe"))
+                    self.discard_staging(version_name)
                     return
             
+            self.commit_staged_install(version_name, staging_path)
+            
             # Add to versions list if not already there
             if version_name not in self.versions:
                 self.versions.append(version_name)
             
             # Save imported versions to config
-            imported_versions = self.version_configs.get('_imported_versions', [])
+            imported_versions = self.config_store.imported_versions()
             if version_name not in imported_versions:
                 imported_versions.append(version_name)
-                self.version_configs['_imported_versions'] = imported_versions
+                self.config_store.set_section('_imported_versions', imported_versions)
                 self.save_config()
             
             # Refresh UI
-            self.after(0, self.refresh_version_buttons)
-            self.after(0, lambda: self.status_text.set(f"Successfully imported {version_name}"))
+            self.ui.call(self.refresh_version_buttons)
+            self.set_status(f"Successfully imported {version_name}")
             self.log_to_console(f"Successfully imported {version_name}", "SUCCESS")
             
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Import Error", f"Failed to import client: {str(e)}"))
-            self.after(0, lambda: self.status_text.set("Import failed"))
+            self.discard_staging(version_name)
+            error_msg = f"Failed to import client: {str(e)}"
+            self.ui.call(lambda: messagebox.showerror("Import Error", error_msg))
+            self.set_status("Import failed")
             self.log_to_console(f"Import failed: {str(e)}", "ERROR")
 
     def _import_folder_thread(self, folder_path, version_name):
         """Import client from folder in background thread"""
         try:
             self.log_to_console(f"Importing client from {folder_path}...")
-            self.status_text.set("Importing client...")
+            self.set_status("Importing client...")
             
             # Create destination directory
             dest_path = os.path.join(self.versions_dir, version_name)
             if os.path.exists(dest_path):
-                self.after(0, lambda: messagebox.showerror("Error", f"Version {version_name} already exists"))
+                self.ui.call(lambda: messagebox.showerror("Error", f"Version {version_name} already exists"))
                 return
             
             # Copy folder contents
@@ -3098,20 +6419,21 @@ echo "export PATH=\"$PATH:{user_bin}\""
                 self.versions.append(version_name)
             
             # Save imported versions to config
-            imported_versions = self.version_configs.get('_imported_versions', [])
+            imported_versions = self.config_store.imported_versions()
             if version_name not in imported_versions:
                 imported_versions.append(version_name)
-                self.version_configs['_imported_versions'] = imported_versions
+                self.config_store.set_section('_imported_versions', imported_versions)
                 self.save_config()
             
             # Refresh UI
-            self.after(0, self.refresh_version_buttons)
-            self.after(0, lambda: self.status_text.set(f"Successfully imported {version_name}"))
+            self.ui.call(self.refresh_version_buttons)
+            self.set_status(f"Successfully imported {version_name}")
             self.log_to_console(f"Successfully imported {version_name}", "SUCCESS")
             
         except Exception as e:
-            self.after(0, lambda: messagebox.showerror("Import Error", f"Failed to import client: {str(e)}"))
-            self.after(0, lambda: self.status_text.set("Import failed"))
+            error_msg = f"Failed to import client: {str(e)}"
+            self.ui.call(lambda: messagebox.showerror("Import Error", error_msg))
+            self.set_status("Import failed")
             self.log_to_console(f"Import failed: {str(e)}", "ERROR")
 
     # === CUSTOMIZATION FUNCTIONS ===
@@ -3158,7 +6480,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
             # Apply to ALL buttons
             buttons_to_color = [
                 'launch_btn', 'download_clients_btn', 'options_btn', 
-                'refresh_btn', 'delete_btn', 'folder_btn', 'save_settings_btn',
+                'refresh_btn', 'delete_btn', 'queue_btn', 'folder_btn', 'save_settings_btn', 'verify_btn', 'repair_btn',
                 'details_toggle_btn', 'settings_toggle_btn', 'console_toggle_btn',
                 'clear_console_btn'
             ]
@@ -3177,7 +6499,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
             # Apply to ALL buttons
             buttons_to_color = [
                 'launch_btn', 'download_clients_btn', 'options_btn', 
-                'refresh_btn', 'delete_btn', 'folder_btn', 'save_settings_btn',
+                'refresh_btn', 'delete_btn', 'queue_btn', 'folder_btn', 'save_settings_btn', 'verify_btn', 'repair_btn',
                 'details_toggle_btn', 'settings_toggle_btn', 'console_toggle_btn',
                 'clear_console_btn'
             ]
@@ -3275,7 +6597,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
                 'launch_btn', 'download_btn', 'options_btn', 'folder_btn',
                 'details_toggle_btn', 'settings_toggle_btn', 'console_toggle_btn',
                 'clear_console_btn', 'save_settings_btn', 'download_clients_btn',
-                'refresh_btn', 'delete_btn'
+                'refresh_btn', 'delete_btn', 'queue_btn', 'verify_btn', 'repair_btn'
             ]
             
             # Update specific buttons
@@ -3289,10 +6611,8 @@ echo "export PATH=\"$PATH:{user_bin}\""
             
             # Update version buttons in sidebar
             if hasattr(self, 'version_buttons'):
-                for version_name, button_frame in self.version_buttons.items():
-                    for child in button_frame.winfo_children():
-                        if isinstance(child, ctk.CTkButton):
-                            child.configure(corner_radius=radius)
+                for button in self.version_buttons.values():
+                    button.configure(corner_radius=radius)
             
             self.save_customization_config()
             self.log_to_console(f"Button corner radius updated to {radius}", "SUCCESS")
@@ -3422,12 +6742,12 @@ echo "export PATH=\"$PATH:{user_bin}\""
             'custom_window_width': self.custom_window_width.get(),
             'custom_window_height': self.custom_window_height.get()
         }
-        self.version_configs['_customization'] = customization
+        self.config_store.set_section('_customization', customization)
         self.save_config()
     
     def load_customization_config(self):
         """Load customization settings from config"""
-        customization = self.version_configs.get('_customization', {})
+        customization = self.config_store.customization()
         
         if customization:
             self.custom_bg_image.set(customization.get('custom_bg_image', ''))
@@ -3468,6 +6788,7 @@ echo "export PATH=\"$PATH:{user_bin}\""
 def main():
     app = TitanicLauncher()
     app.mainloop()
+    app.config_store.flush()
 
 if __name__ == "__main__":
     main()